@@ -69,7 +69,9 @@ from cirq.circuits import (
     AbstractCircuit,
     Circuit,
     CircuitDag,
+    CompactCircuitDag,
     CircuitOperation,
+    CircuitTemplate,
     FrozenCircuit,
     InsertStrategy,
     PointOptimizationSummary,
@@ -230,6 +232,7 @@ from cirq.ops import (
     NamedQid,
     OP_TREE,
     Operation,
+    PackedPauliSum,
     ParallelGateOperation,
     Pauli,
     PAULI_GATE_LIKE,
@@ -404,6 +407,7 @@ from cirq.study import (
     plot_state_histogram,
     Points,
     Product,
+    resolve_values_over_sweep,
     Sweep,
     Sweepable,
     to_resolvers,
@@ -494,6 +498,8 @@ from cirq.protocols import (
     quil,
     QuilFormatter,
     read_json_gzip,
+    read_json_binary,
+    read_json_lines,
     read_json,
     resolve_parameters,
     resolve_parameters_once,
@@ -523,6 +529,8 @@ from cirq.protocols import (
     SupportsTraceDistanceBound,
     SupportsUnitary,
     to_json_gzip,
+    to_json_binary,
+    to_json_lines,
     to_json,
     obj_to_dict_helper,
     trace_distance_bound,
@@ -551,7 +559,9 @@ from cirq.vis import (
 
 from cirq.work import (
     CircuitSampleJob,
+    ExecutorSampler,
     PauliSumCollector,
+    ProcessPoolSampler,
     Sampler,
     Collector,
     ZerosSampler,
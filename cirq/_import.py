@@ -16,6 +16,7 @@ from typing import Any, Callable, List, Optional
 
 from contextlib import contextmanager
 import importlib
+import importlib.abc
 import sys
 
 # Bug workaround: https://github.com/python/mypy/issues/1498
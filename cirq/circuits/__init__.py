@@ -32,8 +32,12 @@ from cirq.circuits.circuit import (
 )
 from cirq.circuits.circuit_dag import (
     CircuitDag,
+    CompactCircuitDag,
     Unique,
 )
+from cirq.circuits.circuit_template import (
+    CircuitTemplate,
+)
 from cirq.circuits.circuit_operation import (
     CircuitOperation,
 )
@@ -1102,6 +1102,61 @@ class AbstractCircuit(abc.ABC):
             use_unicode_characters=use_unicode_characters,
         )
 
+    def to_text_diagram_lines(
+        self,
+        *,
+        use_unicode_characters: bool = True,
+        transpose: bool = False,
+        include_tags: bool = True,
+        precision: Optional[int] = 3,
+        qubit_order: 'cirq.QubitOrderOrList' = ops.QubitOrder.DEFAULT,
+        moments: slice = slice(None),
+        qubits: Optional[Iterable['cirq.Qid']] = None,
+        moments_per_block: int = 50,
+    ) -> Iterator[str]:
+        """Lazily yields the lines of a text diagram of (part of) the circuit.
+
+        The selected moments are split into blocks of `moments_per_block`
+        moments. Each block is drawn and rendered on its own, only when the
+        iteration reaches it, and blocks are separated by an empty line. This
+        keeps the time to the first line and the memory used bounded for very
+        large circuits, e.g. when logging them. All blocks share the same
+        qubit wires.
+
+        Args:
+            use_unicode_characters: Determines if unicode characters are
+                allowed (as opposed to ascii-only diagrams).
+            transpose: Arranges qubit wires vertically instead of horizontally.
+            include_tags: Whether tags on TaggedOperations should be printed
+            precision: Number of digits to display in text diagram
+            qubit_order: Determines how qubits are ordered in the diagram.
+            moments: The range of moments to draw. Defaults to all moments.
+            qubits: If specified, only operations acting on at least one of
+                these qubits are drawn, as in `circuit[:, qubits]`.
+            moments_per_block: The number of moments drawn in each block.
+
+        Yields:
+            The lines of the text diagram.
+
+        Raises:
+            ValueError: `moments_per_block` is not positive.
+        """
+        if moments_per_block < 1:
+            raise ValueError(f'moments_per_block must be positive, got {moments_per_block}.')
+        window = self[moments] if qubits is None else self[moments, qubits]
+        wires = ops.QubitOrder.as_qubit_order(qubit_order).order_for(window.all_qubits())
+        for start in range(0, max(len(window), 1), moments_per_block):
+            if start:
+                yield ''
+            block = window[start : start + moments_per_block]
+            yield from block.to_text_diagram(
+                use_unicode_characters=use_unicode_characters,
+                transpose=transpose,
+                include_tags=include_tags,
+                precision=precision,
+                qubit_order=ops.QubitOrder.explicit(wires),
+            ).split('\n')
+
     def to_text_diagram_drawer(
         self,
         *,
@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, Generic, Iterator, TypeVar, cast, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+    TYPE_CHECKING,
+)
 
 import functools
 import networkx
+import numpy as np
 
 from cirq import ops, devices
 from cirq.circuits import circuit
@@ -113,6 +127,8 @@ class CircuitDag(networkx.DiGraph):
         can_reorder: Callable[['cirq.Operation', 'cirq.Operation'], bool] = _disjoint_qubits,
         device: devices.Device = devices.UNCONSTRAINED_DEVICE,
     ) -> 'CircuitDag':
+        if can_reorder is _disjoint_qubits:
+            return CompactCircuitDag(ops.flatten_to_ops(operations), device=device).to_circuit_dag()
         dag = CircuitDag(can_reorder=can_reorder, device=device)
         for op in ops.flatten_op_tree(operations):
             dag.append(cast(ops.Operation, op))
@@ -209,3 +225,169 @@ class CircuitDag(networkx.DiGraph):
                 remaining_dag.remove_node(node)
                 continue
             yield node
+
+
+class CompactCircuitDag:
+    """A compact, array based DAG of operations that can't be reordered.
+
+    Two operations can't be reordered when they share a qubit, as for the
+    default predicate of CircuitDag. Unlike CircuitDag, the graph is not a
+    transitive completion: each operation is only linked to the previous and
+    next operation on each of its qubits. These links are stored in flat
+    integer arrays indexed by operation slot, so construction, traversal and
+    subgraph extraction take time linear in the total number of operation
+    qubits.
+
+    Nodes are identified by the index of the operation in `operations`, which
+    is also a topological order of the graph.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable['cirq.Operation'] = (),
+        device: devices.Device = devices.UNCONSTRAINED_DEVICE,
+    ) -> None:
+        """Initializes a CompactCircuitDag.
+
+        Args:
+            operations: The operations, in application order.
+            device: Hardware that the circuit should be able to run on.
+        """
+        self.operations: Tuple['cirq.Operation', ...] = tuple(operations)
+        self.device = device
+
+        # Slot k in [offsets[i], offsets[i + 1]) refers to the k-th qubit of
+        # operation i. pred_slots[k] / succ_slots[k] hold the index of the
+        # previous / next operation on that qubit, or -1 if there is none.
+        offsets = [0]
+        pred_slots: List[int] = []
+        succ_slots: List[int] = []
+        # The last node and slot seen on each qubit.
+        last_on_qubit: Dict['cirq.Qid', Tuple[int, int]] = {}
+        for i, op in enumerate(self.operations):
+            for q in op.qubits:
+                prev = last_on_qubit.get(q)
+                if prev is None:
+                    pred_slots.append(-1)
+                else:
+                    pred_slots.append(prev[0])
+                    succ_slots[prev[1]] = i
+                succ_slots.append(-1)
+                last_on_qubit[q] = (i, len(pred_slots) - 1)
+            offsets.append(len(pred_slots))
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._pred_slots = np.array(pred_slots, dtype=np.int64)
+        self._succ_slots = np.array(succ_slots, dtype=np.int64)
+
+    @staticmethod
+    def from_circuit(circuit: 'cirq.AbstractCircuit') -> 'CompactCircuitDag':
+        return CompactCircuitDag(circuit.all_operations(), device=circuit.device)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def _links(self, links: np.ndarray, node: int) -> List[int]:
+        linked = links[self._offsets[node] : self._offsets[node + 1]]
+        return sorted({int(e) for e in linked if e >= 0})
+
+    def predecessors(self, node: int) -> List[int]:
+        """The nodes that must be applied immediately before the given one."""
+        return self._links(self._pred_slots, node)
+
+    def successors(self, node: int) -> List[int]:
+        """The nodes that must be applied immediately after the given one."""
+        return self._links(self._succ_slots, node)
+
+    def frontier(self, applied: Iterable[int] = ()) -> List[int]:
+        """The nodes that can be applied next.
+
+        Args:
+            applied: Nodes that have already been applied. Must be closed
+                under predecessors, e.g. a union of earlier frontiers.
+
+        Returns:
+            The sorted nodes that are not applied and whose predecessors all
+            are.
+        """
+        done = np.zeros(len(self), dtype=bool)
+        done[list(applied)] = True
+        has_pred = self._pred_slots >= 0
+        slot_blocked = np.zeros(len(self._pred_slots), dtype=bool)
+        slot_blocked[has_pred] = ~done[self._pred_slots[has_pred]]
+        num_blocked = np.concatenate([[0], np.cumsum(slot_blocked)])
+        node_blocked = num_blocked[self._offsets[1:]] != num_blocked[self._offsets[:-1]]
+        return [int(e) for e in np.flatnonzero(~node_blocked & ~done)]
+
+    def topological_layers(self) -> Iterator[List[int]]:
+        """Yields nodes grouped by the earliest moment they can be applied in.
+
+        Each layer holds the nodes whose predecessors all are in earlier
+        layers, so the layers correspond to the moments of the circuit built
+        with the EARLIEST insert strategy.
+        """
+        if not self.operations:
+            return
+        depth = np.zeros(len(self), dtype=np.int64)
+        for i in range(len(self)):
+            preds = self._pred_slots[self._offsets[i] : self._offsets[i + 1]]
+            preds = preds[preds >= 0]
+            if len(preds):
+                depth[i] = depth[preds].max() + 1
+        order = np.argsort(depth, kind='stable')
+        boundaries = np.flatnonzero(np.diff(depth[order])) + 1
+        for layer in np.split(order, boundaries):
+            yield [int(e) for e in layer]
+
+    def subgraph(self, nodes: Iterable[int]) -> 'CompactCircuitDag':
+        """The DAG of the operations at the given nodes, kept in order."""
+        return CompactCircuitDag(
+            (self.operations[i] for i in sorted(set(nodes))), device=self.device
+        )
+
+    def to_networkx(self) -> networkx.DiGraph:
+        """A networkx graph with an edge between each node and its successors.
+
+        Nodes are the integer node indices, with the operation stored under the
+        'op' attribute.
+        """
+        graph = networkx.DiGraph()
+        graph.add_nodes_from((i, {'op': op}) for i, op in enumerate(self.operations))
+        graph.add_edges_from((i, j) for i in range(len(self)) for j in self.successors(i))
+        return graph
+
+    def to_circuit_dag(self) -> CircuitDag:
+        """The equivalent CircuitDag, i.e. the transitive completion.
+
+        Nodes are added in the same order as when appending the operations one
+        at a time to a CircuitDag, so `nodes()` and `edges()` iterate in the
+        same order too. This takes time linear in the number of edges of the
+        result, which is quadratic in the length of a chain of operations.
+        """
+        dag = CircuitDag(device=self.device)
+        nodes: List[Unique['cirq.Operation']] = []
+        # The ancestors of every node. The earlier operations on each qubit
+        # are ancestors of the last one, so only the last operations on the
+        # qubits of a node are needed to find its ancestors.
+        ancestors: List[Set[int]] = []
+        last_on_qubit: Dict['cirq.Qid', int] = {}
+        for i, op in enumerate(self.operations):
+            node_ancestors: Set[int] = set()
+            for j in sorted(
+                {last_on_qubit[q] for q in op.qubits if q in last_on_qubit}, reverse=True
+            ):
+                if j not in node_ancestors:
+                    node_ancestors.add(j)
+                    node_ancestors.update(ancestors[j])
+            node = dag.make_node(op)
+            dag.add_edges_from((nodes[j], node) for j in node_ancestors)
+            dag.add_node(node)
+            nodes.append(node)
+            ancestors.append(node_ancestors)
+            for q in op.qubits:
+                last_on_qubit[q] = i
+        return dag
+
+    def to_circuit(self) -> circuit.Circuit:
+        return circuit.Circuit(
+            self.operations, strategy=circuit.InsertStrategy.EARLIEST, device=self.device
+        )
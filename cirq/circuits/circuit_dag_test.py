@@ -264,3 +264,73 @@ def test_findall_nodes_until_blocked(circuit, is_blocker):
     blocked_nodes = blocking_nodes.union(*(dag.succ[node] for node in blocking_nodes))
     expected_nodes = set(all_nodes) - blocked_nodes
     assert sorted(found_nodes) == sorted(expected_nodes)
+
+
+def test_from_ops_matches_append():
+    for _ in range(10):
+        circuit = cirq.testing.random_circuit(qubits=5, n_moments=10, op_density=0.6)
+        expected = cirq.CircuitDag()
+        for op in circuit.all_operations():
+            expected.append(op)
+        actual = cirq.CircuitDag.from_circuit(circuit)
+        assert [n.val for n in actual.nodes()] == [n.val for n in expected.nodes()]
+        assert [(a.val, b.val) for a, b in actual.edges()] == [
+            (a.val, b.val) for a, b in expected.edges()
+        ]
+        assert list(actual.all_operations()) == list(expected.all_operations())
+
+
+def test_compact_dag_links():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    ops = [cirq.X(q0), cirq.CZ(q0, q1), cirq.H(q2), cirq.CZ(q1, q2), cirq.Y(q0), cirq.CZ(q0, q1)]
+    dag = cirq.CompactCircuitDag(ops)
+    assert len(dag) == 6
+    assert dag.operations == tuple(ops)
+    assert [dag.predecessors(i) for i in range(6)] == [[], [0], [], [1, 2], [1], [3, 4]]
+    assert [dag.successors(i) for i in range(6)] == [[1], [3, 4], [3], [5], [5], []]
+    assert list(dag.topological_layers()) == [[0, 2], [1], [3, 4], [5]]
+    assert list(cirq.CompactCircuitDag().topological_layers()) == []
+
+
+def test_compact_dag_frontier():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    ops = [cirq.X(q0), cirq.CZ(q0, q1), cirq.H(q2), cirq.CZ(q1, q2), cirq.Y(q0)]
+    dag = cirq.CompactCircuitDag(ops)
+    assert dag.frontier() == [0, 2]
+    assert dag.frontier([0]) == [1, 2]
+    assert dag.frontier([0, 1]) == [2, 4]
+    assert dag.frontier([0, 1, 2]) == [3, 4]
+    assert dag.frontier(range(5)) == []
+
+    dag = cirq.CompactCircuitDag([cirq.GlobalPhaseOperation(1j), cirq.X(q0)])
+    assert dag.frontier() == [0, 1]
+
+
+def test_compact_dag_subgraph_and_conversions():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    ops = [cirq.X(q0), cirq.CZ(q0, q1), cirq.H(q2), cirq.CZ(q1, q2), cirq.Y(q0)]
+    dag = cirq.CompactCircuitDag(ops)
+    assert cirq.CompactCircuitDag.from_circuit(cirq.Circuit(ops)).to_circuit() == cirq.Circuit(ops)
+
+    sub = dag.subgraph([4, 0, 2])
+    assert sub.operations == (cirq.X(q0), cirq.H(q2), cirq.Y(q0))
+    assert [sub.predecessors(i) for i in range(3)] == [[], [], [0]]
+
+    graph = dag.to_networkx()
+    assert sorted(graph.edges()) == [(0, 1), (1, 3), (1, 4), (2, 3)]
+    assert graph.nodes[3]['op'] == cirq.CZ(q1, q2)
+    assert networkx.is_directed_acyclic_graph(graph)
+
+    assert dag.to_circuit() == cirq.Circuit(ops)
+    assert dag.to_circuit_dag() == cirq.CircuitDag.from_ops(ops)
+
+
+def test_compact_dag_to_circuit_dag_of_chain():
+    q0, q1 = cirq.LineQubit.range(2)
+    ops = [cirq.X(q0), cirq.CZ(q0, q1), cirq.Y(q1)] * 100
+    dag = cirq.CompactCircuitDag(ops).to_circuit_dag()
+    # Every operation must be applied after all earlier ones, except for the
+    # 99 pairs of a Y gate and the X gate following it.
+    assert dag.number_of_edges() == 300 * 299 // 2 - 99
+    assert networkx.is_directed_acyclic_graph(dag)
+    assert [n.val for n in dag.ordered_nodes()] == ops
@@ -25,6 +25,7 @@ import numpy as np
 
 from cirq import circuits, ops, protocols, study
 from cirq._compat import proper_repr
+from cirq.type_workarounds import NotImplementedType
 
 if TYPE_CHECKING:
     import cirq
@@ -32,6 +33,11 @@ if TYPE_CHECKING:
 
 INT_TYPE = Union[int, np.integer]
 
+# Repeated circuits acting on a Hilbert space of at most this dimension may
+# have their unitary computed once and raised to the number of repetitions,
+# instead of being decomposed into one copy of the circuit per repetition.
+_MAX_UNITARY_DIMENSION = 2 ** 6
+
 
 @dataclasses.dataclass(frozen=True)
 class CircuitOperation(ops.Operation):
@@ -50,6 +56,8 @@ class CircuitOperation(ops.Operation):
     """
 
     _hash: Optional[int] = dataclasses.field(default=None, init=False)
+    _cached_has_unitary: Optional[bool] = dataclasses.field(default=None, init=False)
+    _cached_unitary: Optional[np.ndarray] = dataclasses.field(default=None, init=False)
 
     circuit: 'cirq.FrozenCircuit'
     repetitions: int = 1
@@ -110,6 +118,54 @@ class CircuitOperation(ops.Operation):
             )
         }
 
+    def _resolved_circuit(self) -> 'cirq.FrozenCircuit':
+        """The contained circuit with this operation's parameters resolved."""
+        if not self.param_resolver:
+            return self.circuit
+        return protocols.resolve_parameters(self.circuit, self.param_resolver, recursive=False)
+
+    def _has_unitary_(self) -> bool:
+        if self._cached_has_unitary is None:
+            circuit = self._resolved_circuit()
+            object.__setattr__(
+                self,
+                '_cached_has_unitary',
+                not circuit.has_measurements() and protocols.has_unitary(circuit),
+            )
+        return self._cached_has_unitary
+
+    def _unitary_(self) -> Union[np.ndarray, NotImplementedType]:
+        """The unitary of the contained circuit raised to `repetitions`.
+
+        Qubit mappings do not change the matrix, as the mapped qubits keep the
+        order of the qubits in the contained circuit. This is only done when
+        applying the powered unitary is cheaper than applying the operations
+        of every repetition, i.e. for small, repeated circuits. Otherwise
+        NotImplemented is returned, so that callers fall back to
+        decomposition.
+        """
+        if self._cached_unitary is not None:
+            return self._cached_unitary
+        if abs(self.repetitions) <= 1 or not self._has_unitary_():
+            return NotImplemented
+        dim = np.prod(self._qid_shape_(), dtype=np.int64)
+        if dim > _MAX_UNITARY_DIMENSION:
+            return NotImplemented
+        # Applying an operation costs about the dimension of the space it acts
+        # on per amplitude of the state it is applied to.
+        unrolled_cost = abs(self.repetitions) * sum(
+            np.prod(protocols.qid_shape(op), dtype=np.int64) for op in self.circuit.all_operations()
+        )
+        if dim >= unrolled_cost:
+            return NotImplemented
+        result = protocols.unitary(self._resolved_circuit())
+        if self.repetitions < 0:
+            result = result.conj().T
+        # Uses repeated squaring, so the cost grows with log(repetitions).
+        result = np.linalg.matrix_power(result, abs(self.repetitions))
+        object.__setattr__(self, '_cached_unitary', result)
+        return result
+
     def _decompose_(self) -> 'cirq.OP_TREE':
         result = self.circuit.unfreeze()
         result = result.transform_qubits(lambda q: self.qubit_map.get(q, q))
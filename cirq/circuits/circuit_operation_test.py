@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest, sympy
 
 import cirq
@@ -480,6 +481,60 @@ def test_decompose_loops():
     assert cirq.Circuit(cirq.decompose_once(op)) == expected_circuit
 
 
+def test_unitary_of_repeated_circuit():
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit = cirq.FrozenCircuit(cirq.H(a), cirq.CX(a, b) ** t, cirq.T(b))
+    u = cirq.unitary(cirq.resolve_parameters(circuit, {'t': 0.3}))
+
+    op = cirq.CircuitOperation(circuit).with_params({t: 0.3}).with_qubits(b, a)
+    assert cirq.has_unitary(op)
+    np.testing.assert_allclose(cirq.unitary(op.repeat(5)), np.linalg.matrix_power(u, 5))
+    np.testing.assert_allclose(
+        cirq.unitary(op.repeat(-3)), np.linalg.matrix_power(u.conj().T, 3), atol=1e-8
+    )
+    np.testing.assert_allclose(cirq.unitary(op.repeat(0)), np.eye(4))
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(op.repeat(7)),
+        cirq.Circuit(cirq.decompose_once(op.repeat(7))).unitary(qubit_order=op.qubits),
+        atol=1e-8,
+    )
+
+    # The powered unitary is computed once per operation.
+    repeated = op.repeat(1000)
+    assert cirq.unitary(repeated) is cirq.unitary(repeated)
+
+    assert not cirq.has_unitary(cirq.CircuitOperation(circuit))
+    assert cirq.unitary(cirq.CircuitOperation(circuit), None) is None
+    measured = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.X(a), cirq.measure(a)))
+    assert not cirq.has_unitary(measured)
+
+
+def test_unitary_falls_back_to_decomposition_unless_cheaper():
+    a, b = cirq.LineQubit.range(2)
+    op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.H(a), cirq.CX(a, b)))
+    # A single repetition is cheapest to apply gate by gate.
+    assert cirq.has_unitary(op)
+    assert op._unitary_() is NotImplemented
+    assert op.repeat(-1)._unitary_() is NotImplemented
+    np.testing.assert_allclose(cirq.unitary(op), cirq.unitary(op.circuit))
+    assert op.repeat(2)._unitary_() is not NotImplemented
+
+    # A few single-qubit gates are cheaper than the unitary on all qubits.
+    qubits = cirq.LineQubit.range(6)
+    op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.X.on_each(*qubits))).repeat(2)
+    assert op._unitary_() is NotImplemented
+    assert op.repeat(30)._unitary_() is not NotImplemented
+
+
+def test_unitary_of_large_circuit_falls_back_to_decomposition():
+    qubits = cirq.LineQubit.range(7)
+    op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.X.on_each(*qubits))).repeat(1000)
+    assert cirq.has_unitary(op)
+    assert op._unitary_() is NotImplemented
+    np.testing.assert_allclose(cirq.unitary(op), np.eye(2 ** 7))
+
+
 def test_decompose_nested():
     a, b, c, d = cirq.LineQubit.range(4)
     exp1 = sympy.Symbol('exp1')
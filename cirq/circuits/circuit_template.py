@@ -0,0 +1,156 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A parameterized circuit indexed for repeated parameter resolution."""
+
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from cirq import ops, protocols, study
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class _Slot:
+    """A parameterized operation within a moment of the template.
+
+    Remembers the parameter values it was last resolved with, so that
+    resolving it again with the same values returns the same operation.
+    """
+
+    def __init__(self, index: int, operation: 'cirq.Operation') -> None:
+        self.index = index
+        self.operation = operation
+        names = protocols.parameter_names(operation)
+        # Operations that report being parameterized without naming their
+        # parameters can't be keyed by parameter values and are always resolved.
+        self.names: Optional[Tuple[str, ...]] = tuple(sorted(names)) if names else None
+        self._last_key: Any = None
+        self._last_resolved: Optional['cirq.Operation'] = None
+
+    def resolve(self, param_resolver: 'cirq.ParamResolver', recursive: bool) -> 'cirq.Operation':
+        if self.names is None:
+            return protocols.resolve_parameters(self.operation, param_resolver, recursive)
+        key = (recursive,) + tuple(param_resolver.value_of(name, recursive) for name in self.names)
+        if self._last_resolved is not None and key == self._last_key:
+            return self._last_resolved
+        resolved = protocols.resolve_parameters(self.operation, param_resolver, recursive)
+        self._last_key = key
+        self._last_resolved = resolved
+        return resolved
+
+
+class CircuitTemplate:
+    """A circuit indexed for fast repeated resolution of its parameters.
+
+    `cirq.resolve_parameters(circuit, resolver)` rebuilds every moment and
+    operation of the circuit. A template instead records once which operations
+    depend on which parameters, and resolving it only rebuilds those
+    operations and the moments containing them. Moments without parameters
+    are shared between the template's circuit and every resolved circuit.
+
+    Each parameterized operation also remembers the values of its parameters
+    from the previous resolution, and is not resolved again (nor is its moment
+    rebuilt) if they are unchanged. When iterating over a product sweep,
+    operations that only depend on the slowly varying factors are therefore
+    resolved once per value of those factors rather than once per point.
+
+    Since templates keep this state, they are not thread-safe.
+    """
+
+    def __init__(self, circuit: 'cirq.AbstractCircuit') -> None:
+        """Indexes the parameterized operations of a circuit.
+
+        Args:
+            circuit: The (typically parameterized) circuit to resolve.
+        """
+        self._circuit = circuit
+        self._moments: List['cirq.Moment'] = list(circuit.moments)
+        self._slots: Dict[int, List[_Slot]] = {}
+        for i, moment in enumerate(self._moments):
+            slots = [
+                _Slot(j, op)
+                for j, op in enumerate(moment.operations)
+                if protocols.is_parameterized(op)
+            ]
+            if slots:
+                self._slots[i] = slots
+        self._last_moments: Dict[int, 'cirq.Moment'] = {}
+
+    @property
+    def circuit(self) -> 'cirq.AbstractCircuit':
+        """The circuit this template resolves."""
+        return self._circuit
+
+    def parameter_names(self) -> AbstractSet[str]:
+        """The names of the parameters the circuit depends on."""
+        return {name for slots in self._slots.values() for s in slots for name in s.names or ()}
+
+    def parameterized_operation_count(self) -> int:
+        """The number of operations that are re-resolved for each resolver."""
+        return sum(len(slots) for slots in self._slots.values())
+
+    def resolve(
+        self, param_resolver: 'cirq.ParamResolverOrSimilarType', recursive: bool = True
+    ) -> 'cirq.AbstractCircuit':
+        """Resolves the parameters of the circuit.
+
+        Args:
+            param_resolver: The resolver to use.
+            recursive: If True, resolves parameters recursively over the
+                resolver; otherwise performs a single resolution step.
+
+        Returns:
+            A circuit of the same type as the template's circuit, equal to
+            `cirq.resolve_parameters(template.circuit, param_resolver)`.
+        """
+        if not param_resolver or not self._slots:
+            return self._circuit
+        param_resolver = study.ParamResolver(param_resolver)
+        moments = list(self._moments)
+        for i, slots in self._slots.items():
+            moment = moments[i]
+            operations = list(moment.operations)
+            changed = i not in self._last_moments
+            for slot in slots:
+                op = slot.resolve(param_resolver, recursive)
+                changed = changed or op is not self._last_moments[i].operations[slot.index]
+                operations[slot.index] = op
+            if changed:
+                self._last_moments[i] = ops.Moment(operations)
+            moments[i] = self._last_moments[i]
+        return self._circuit._with_sliced_moments(moments)
+
+    def resolve_sweep(self, params: 'cirq.Sweepable') -> Iterator['cirq.AbstractCircuit']:
+        """Yields the resolved circuit for each resolver of a sweep.
+
+        Args:
+            params: The parameters to resolve the circuit with.
+
+        Yields:
+            One resolved circuit per resolver in `cirq.to_resolvers(params)`.
+        """
+        for param_resolver in study.to_resolvers(params):
+            yield self.resolve(param_resolver)
+
+    def __repr__(self) -> str:
+        return f'cirq.CircuitTemplate({self._circuit!r})'
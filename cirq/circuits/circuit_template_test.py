@@ -0,0 +1,124 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import sympy
+
+import cirq
+
+
+def _circuit(circuit_cls):
+    a, b, c = cirq.LineQubit.range(3)
+    t, s = sympy.Symbol('t'), sympy.Symbol('s')
+    return circuit_cls(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.X(a) ** t,
+        cirq.Y(b) ** (2 * s),
+        cirq.Z(c),
+        cirq.CZ(b, c),
+        cirq.rx(t + s).on(c),
+        cirq.measure(a, b, c, key='m'),
+    )
+
+
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_resolve_matches_resolve_parameters(circuit_cls):
+    circuit = _circuit(circuit_cls)
+    template = cirq.CircuitTemplate(circuit)
+    assert template.circuit is circuit
+    assert template.parameter_names() == {'t', 's'}
+    assert template.parameterized_operation_count() == 3
+
+    sweep = cirq.Linspace('t', 0, 1, 3) * cirq.Points('s', [0.25, 0.5])
+    for r, resolved in zip(sweep, template.resolve_sweep(sweep)):
+        expected = cirq.resolve_parameters(circuit, r)
+        assert isinstance(resolved, circuit_cls)
+        assert resolved == expected
+        assert not cirq.is_parameterized(resolved)
+
+    # Unparameterized moments are shared with the template's circuit.
+    assert resolved[0] is circuit[0]
+    assert resolved[1] is circuit[1]
+
+
+def test_resolve_reuses_unchanged_operations():
+    circuit = _circuit(cirq.Circuit)
+    template = cirq.CircuitTemplate(circuit)
+    first = template.resolve({'t': 0.5, 's': 0.25})
+    second = template.resolve({'t': 0.5, 's': 0.5})
+    assert second[2].operations[0] is first[2].operations[0]
+    assert second[2].operations[1] is not first[2].operations[1]
+    assert second == cirq.resolve_parameters(circuit, {'t': 0.5, 's': 0.5})
+
+    # Moments whose operations are all unchanged are reused.
+    third = template.resolve({'t': 0.5, 's': 0.5})
+    assert third[2] is second[2]
+    assert third[4] is second[4]
+
+    fourth = template.resolve({'t': 0.5, 's': 0.5}, recursive=False)
+    assert fourth == third
+    assert fourth[2] is not third[2]
+
+
+def test_resolve_without_parameters():
+    circuit = _circuit(cirq.Circuit)
+    template = cirq.CircuitTemplate(circuit)
+    assert template.resolve(None) is circuit
+    assert template.resolve({}) is circuit
+
+    q = cirq.LineQubit(0)
+    plain = cirq.Circuit(cirq.X(q), cirq.measure(q))
+    plain_template = cirq.CircuitTemplate(plain)
+    assert plain_template.parameterized_operation_count() == 0
+    assert plain_template.resolve({'t': 1}) is plain
+
+
+def test_resolve_partially():
+    circuit = _circuit(cirq.Circuit)
+    template = cirq.CircuitTemplate(circuit)
+    resolved = template.resolve({'t': 0.5})
+    assert resolved == cirq.resolve_parameters(circuit, {'t': 0.5})
+    assert cirq.parameter_names(resolved) == {'s'}
+
+
+class UnnamedParameterGate(cirq.SingleQubitGate):
+    def __init__(self, resolved=False):
+        self.resolved = resolved
+
+    def _is_parameterized_(self):
+        return not self.resolved
+
+    def _resolve_parameters_(self, param_resolver, recursive):
+        return UnnamedParameterGate(resolved=bool(param_resolver))
+
+    def _value_equality_values_(self):
+        return self.resolved
+
+
+def test_operations_without_parameter_names_are_always_resolved():
+    q = cirq.LineQubit(0)
+    template = cirq.CircuitTemplate(cirq.Circuit(UnnamedParameterGate().on(q)))
+    assert template.parameter_names() == set()
+    assert template.parameterized_operation_count() == 1
+    first = template.resolve({'t': 1})
+    second = template.resolve({'t': 1})
+    assert first[0].operations[0].gate.resolved
+    assert first[0] is not second[0]
+
+
+def test_repr():
+    q = cirq.LineQubit(0)
+    template = cirq.CircuitTemplate(cirq.Circuit(cirq.X(q)))
+    assert repr(template) == f'cirq.CircuitTemplate({template.circuit!r})'
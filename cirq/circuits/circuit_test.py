@@ -2222,6 +2222,50 @@ def test_to_text_diagram_custom_order(circuit_cls):
     )
 
 
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_to_text_diagram_lines(circuit_cls):
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = circuit_cls(cirq.H(a), cirq.CNOT(a, b), cirq.X(c), cirq.Z(c), cirq.Y(a))
+
+    lines = circuit.to_text_diagram_lines(use_unicode_characters=False)
+    assert not isinstance(lines, (list, str))
+    assert '\n'.join(lines) == circuit.to_text_diagram(use_unicode_characters=False)
+
+    lines = circuit.to_text_diagram_lines(use_unicode_characters=False, moments_per_block=2)
+    assert (
+        '\n'.join(lines)
+        == """
+0: ---H---@---
+          |
+1: -------X---
+
+2: ---X---Z---
+
+0: ---Y---
+
+1: -------
+
+2: -------
+""".strip()
+    )
+
+    lines = circuit.to_text_diagram_lines(
+        use_unicode_characters=False, moments=slice(1, 3), qubits=[b]
+    )
+    assert (
+        '\n'.join(lines)
+        == """
+0: ---@-------
+      |
+1: ---X-------
+""".strip()
+    )
+
+    assert list(circuit_cls().to_text_diagram_lines()) == ['']
+    with pytest.raises(ValueError, match='positive'):
+        _ = list(circuit.to_text_diagram_lines(moments_per_block=0))
+
+
 @pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
 def test_overly_precise_diagram(circuit_cls):
     # Test default precision of 3
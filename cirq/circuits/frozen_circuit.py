@@ -35,6 +35,10 @@ from cirq.type_workarounds import NotImplementedType
 if TYPE_CHECKING:
     import cirq
 
+# Unitaries of circuits acting on a larger Hilbert space are not memoized, to
+# bound the memory held by each FrozenCircuit (2**10 x 2**10 complex128 = 16MB).
+_MAX_MEMOIZED_UNITARY_DIMENSION = 2 ** 10
+
 
 class FrozenCircuit(AbstractCircuit):
     """An immutable version of the Circuit data structure.
@@ -68,7 +72,9 @@ class FrozenCircuit(AbstractCircuit):
         self._device = base.device
 
         # These variables are memoized when first requested.
+        self._hash: Optional[int] = None
         self._num_qubits: Optional[int] = None
+        self._has_unitary: Optional[bool] = None
         self._unitary: Optional[Union[np.ndarray, NotImplementedType]] = None
         self._qid_shape: Optional[Tuple[int, ...]] = None
         self._all_qubits: Optional[FrozenSet['cirq.Qid']] = None
@@ -76,6 +82,8 @@ class FrozenCircuit(AbstractCircuit):
         self._has_measurements: Optional[bool] = None
         self._all_measurement_keys: Optional[AbstractSet[str]] = None
         self._are_all_measurements_terminal: Optional[bool] = None
+        self._is_parameterized: Optional[bool] = None
+        self._parameter_names: Optional[AbstractSet[str]] = None
 
     @property
     def moments(self) -> Sequence['cirq.Moment']:
@@ -86,7 +94,9 @@ class FrozenCircuit(AbstractCircuit):
         return self._device
 
     def __hash__(self):
-        return hash((self.moments, self.device))
+        if self._hash is None:
+            self._hash = hash((self.moments, self.device))
+        return self._hash
 
     def serialization_key(self):
         # TODO: use this key in serialization and support user-specified keys.
@@ -105,10 +115,21 @@ class FrozenCircuit(AbstractCircuit):
             self._qid_shape = super()._qid_shape_()
         return self._qid_shape
 
+    def _has_unitary_(self) -> bool:
+        if self._has_unitary is None:
+            self._has_unitary = super()._has_unitary_()
+        return self._has_unitary
+
     def _unitary_(self) -> Union[np.ndarray, NotImplementedType]:
-        if self._unitary is None:
-            self._unitary = super()._unitary_()
-        return self._unitary
+        if self._unitary is not None:
+            return self._unitary
+        if not self._has_unitary_():
+            self._unitary = NotImplemented
+            return self._unitary
+        result = super()._unitary_()
+        if np.prod(self._qid_shape_(), dtype=np.int64) <= _MAX_MEMOIZED_UNITARY_DIMENSION:
+            self._unitary = result
+        return result
 
     def all_qubits(self) -> FrozenSet['cirq.Qid']:
         if self._all_qubits is None:
@@ -135,6 +156,16 @@ class FrozenCircuit(AbstractCircuit):
             self._are_all_measurements_terminal = super().are_all_measurements_terminal()
         return self._are_all_measurements_terminal
 
+    def _is_parameterized_(self) -> bool:
+        if self._is_parameterized is None:
+            self._is_parameterized = super()._is_parameterized_()
+        return self._is_parameterized
+
+    def _parameter_names_(self) -> AbstractSet[str]:
+        if self._parameter_names is None:
+            self._parameter_names = frozenset(super()._parameter_names_())
+        return self._parameter_names
+
     # End of memoized methods.
 
     def __add__(self, other) -> 'FrozenCircuit':
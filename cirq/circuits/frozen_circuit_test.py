@@ -16,7 +16,9 @@
 Behavior shared with Circuit is tested with parameters in circuit_test.py.
 """
 
+import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -54,3 +56,43 @@ def test_immutable():
 
     with pytest.raises(AttributeError, match="can't set attribute"):
         c.device = cirq.google.devices.Foxtail
+
+
+def test_memoized_protocols():
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    c = cirq.FrozenCircuit(cirq.X(a) ** t, cirq.CZ(a, b), cirq.measure(a, b, key='m'))
+
+    assert cirq.is_parameterized(c)
+    assert cirq.parameter_names(c) == {'t'}
+    assert c.all_measurement_keys() == {'m'}
+    assert hash(c) == hash(cirq.FrozenCircuit(c.moments))
+    assert cirq.qid_shape(c) == (2, 2)
+    assert not cirq.has_unitary(c)
+    assert cirq.unitary(c, None) is None
+
+    # Results are computed once and reused afterwards.
+    assert c._is_parameterized is True
+    assert c._parameter_names == {'t'}
+    assert c._hash is not None
+    assert c._has_unitary is False
+
+    resolved = cirq.resolve_parameters(c, {'t': 0.5})
+    assert not cirq.is_parameterized(resolved)
+    assert cirq.parameter_names(resolved) == set()
+    assert cirq.has_unitary(resolved)
+    u = cirq.unitary(resolved)
+    assert cirq.unitary(resolved) is u
+    np.testing.assert_allclose(u, cirq.unitary(resolved.unfreeze()))
+
+
+def test_unitary_memoization_is_capped():
+    qubits = cirq.LineQubit.range(11)
+    c = cirq.FrozenCircuit(cirq.X.on_each(*qubits))
+    u = cirq.unitary(c)
+    assert u.shape == (2 ** 11, 2 ** 11)
+    assert c._unitary is None
+    assert c._has_unitary is True
+
+    small = cirq.FrozenCircuit(cirq.X.on_each(*qubits[:10]))
+    assert cirq.unitary(small) is cirq.unitary(small)
@@ -66,6 +66,6 @@ def get_logical_acquaintance_opportunities(
 ) -> Set[FrozenSet[LogicalIndex]]:
     acquaintance_dag = get_acquaintance_dag(strategy, initial_mapping)
     logical_acquaintance_opportunities = set()
-    for op in acquaintance_dag.all_operations():
-        logical_acquaintance_opportunities.add(frozenset(op.logical_indices))
+    for node in acquaintance_dag.nodes():
+        logical_acquaintance_opportunities.add(frozenset(node.val.logical_indices))
     return logical_acquaintance_opportunities
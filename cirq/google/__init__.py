@@ -58,6 +58,7 @@ from cirq.google.engine import (
     Engine,
     engine_from_environment,
     EngineJob,
+    EngineJobWaiter,
     EngineProgram,
     EngineProcessor,
     EngineTimeSlot,
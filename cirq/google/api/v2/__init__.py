@@ -35,7 +35,9 @@ from cirq.google.api.v2.results import (
     MeasureInfo,
     find_measurements,
     pack_bits,
+    pack_bit_columns,
     unpack_bits,
+    unpack_bit_columns,
     results_from_proto,
     results_to_proto,
 )
@@ -19,6 +19,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     TYPE_CHECKING,
 )
@@ -123,6 +124,43 @@ def unpack_bits(data: bytes, repetitions: int) -> np.ndarray:
     return bits[:repetitions]
 
 
+def pack_bit_columns(bits: np.ndarray) -> List[bytes]:
+    """Pack each column of a 2-D array of bools into bytes.
+
+    This is equivalent to `[pack_bits(bits[:, i]) for i in range(n)]` for an
+    array of shape `(repetitions, n)`, but packs all columns at once.
+    """
+    bits = np.asarray(bits, dtype=bool)
+    repetitions, num_columns = bits.shape
+    num_bytes = -(-repetitions // 8)
+
+    # Lay out each column as a row of whole bytes, padded with zeros.
+    padded = np.zeros((num_columns, num_bytes * 8), dtype=bool)
+    padded[:, :repetitions] = bits.T
+
+    # Pack in little-endian bit order.
+    padded = padded.reshape((num_columns, num_bytes, 8))[:, :, ::-1]
+    data = np.packbits(padded, axis=2).tobytes()
+    return [data[i * num_bytes : (i + 1) * num_bytes] for i in range(num_columns)]
+
+
+def unpack_bit_columns(data: Sequence[bytes], repetitions: int) -> np.ndarray:
+    """Unpack byte arrays into the columns of a 2-D array of bools.
+
+    This is the inverse of `pack_bit_columns`, and is equivalent to stacking
+    `unpack_bits(d, repetitions)` for each `d` in `data` as columns.
+
+    Raises:
+        ValueError: The byte arrays have different lengths.
+    """
+    num_bytes = len(data[0]) if data else -(-repetitions // 8)
+    if any(len(d) != num_bytes for d in data):
+        raise ValueError('Packed bit columns have different lengths.')
+    byte_arr = np.frombuffer(b''.join(data), dtype='uint8').reshape((len(data), num_bytes, 1))
+    bits = np.unpackbits(byte_arr, axis=2)[:, :, ::-1].reshape((len(data), num_bytes * 8))
+    return bits[:, :repetitions].T.astype(bool)
+
+
 def results_to_proto(
     trial_sweeps: Iterable[Iterable[study.Result]],
     measurements: List[MeasureInfo],
@@ -139,6 +177,7 @@ def results_to_proto(
     """
     if out is None:
         out = result_pb2.Result()
+    qubit_ids = {m.key: [v2.qubit_to_proto_id(q) for q in m.qubits] for m in measurements}
     for trial_sweep in trial_sweeps:
         sweep_result = out.sweep_results.add()
         for i, trial_result in enumerate(trial_sweep):
@@ -149,13 +188,10 @@ def results_to_proto(
             pr = sweep_result.parameterized_results.add()
             pr.params.assignments.update(trial_result.params.param_dict)
             for m in measurements:
-                mr = pr.measurement_results.add()
-                mr.key = m.key
-                m_data = trial_result.measurements[m.key]
-                for i, qubit in enumerate(m.qubits):
-                    qmr = mr.qubit_measurement_results.add()
-                    qmr.qubit.id = v2.qubit_to_proto_id(qubit)
-                    qmr.results = pack_bits(m_data[:, i])
+                mr = pr.measurement_results.add(key=m.key)
+                m_data = trial_result.measurements[m.key][:, : len(m.qubits)]
+                for qubit_id, packed in zip(qubit_ids[m.key], pack_bit_columns(m_data)):
+                    mr.qubit_measurement_results.add(results=packed).qubit.id = qubit_id
     return out
 
 
@@ -200,20 +236,24 @@ def _trial_sweep_from_proto(
     """
 
     trial_sweep: List[study.Result] = []
+    qubits: Dict[str, devices.GridQubit] = {}
     for pr in msg.parameterized_results:
         m_data: Dict[str, np.ndarray] = {}
         for mr in pr.measurement_results:
-            qubit_results: OrderedDict[devices.GridQubit, np.ndarray] = OrderedDict()
+            qubit_results: OrderedDict[devices.GridQubit, bytes] = OrderedDict()
             for qmr in mr.qubit_measurement_results:
-                qubit = v2.grid_qubit_from_proto_id(qmr.qubit.id)
+                qubit_id = qmr.qubit.id
+                if qubit_id not in qubits:
+                    qubits[qubit_id] = v2.grid_qubit_from_proto_id(qubit_id)
+                qubit = qubits[qubit_id]
                 if qubit in qubit_results:
                     raise ValueError('qubit already exists: {}'.format(qubit))
-                qubit_results[qubit] = unpack_bits(qmr.results, msg.repetitions)
+                qubit_results[qubit] = qmr.results
             if measure_map:
                 ordered_results = [qubit_results[qubit] for qubit in measure_map[mr.key].qubits]
             else:
                 ordered_results = list(qubit_results.values())
-            m_data[mr.key] = np.array(ordered_results).transpose()
+            m_data[mr.key] = unpack_bit_columns(ordered_results, msg.repetitions)
         trial_sweep.append(
             study.Result.from_single_parameter_set(
                 params=study.ParamResolver(dict(pr.params.assignments)),
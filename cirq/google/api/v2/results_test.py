@@ -15,6 +15,29 @@ def test_pack_bits(reps):
     np.testing.assert_array_equal(unpacked, data)
 
 
+@pytest.mark.parametrize('reps', [0, 1, 8, 9, 64, 100])
+@pytest.mark.parametrize('num_qubits', [0, 1, 5])
+def test_pack_bit_columns(reps, num_qubits):
+    data = np.random.randint(2, size=(reps, num_qubits), dtype=bool)
+    packed = v2.pack_bit_columns(data)
+    assert packed == [v2.pack_bits(data[:, i]) for i in range(num_qubits)]
+    assert all(isinstance(p, bytes) for p in packed)
+    unpacked = v2.unpack_bit_columns(packed, reps)
+    assert unpacked.shape == (reps, num_qubits)
+    assert unpacked.dtype == bool
+    np.testing.assert_array_equal(unpacked, data)
+
+
+def test_pack_bit_columns_of_ints():
+    data = np.array([[0, 1], [1, 1], [0, 0]], dtype=np.uint8)
+    assert v2.pack_bit_columns(data) == [b'\x02', b'\x03']
+
+
+def test_unpack_bit_columns_different_lengths():
+    with pytest.raises(ValueError, match='different lengths'):
+        v2.unpack_bit_columns([b'\x00', b'\x00\x01'], 9)
+
+
 q = cirq.GridQubit  # For brevity.
 
 
@@ -56,11 +56,20 @@ def sweep_to_proto(
         out.single_sweep.points.points.extend(sweep.points)
     elif isinstance(sweep, sweeps.ListSweep):
         sweep_dict: Dict[str, List[value.TParamVal]] = {}
-        for param_resolver in sweep:
-            for key in param_resolver:
-                if key not in sweep_dict:
-                    sweep_dict[key] = []
-                sweep_dict[key].append(param_resolver.value_of(key))
+        columns = sweep.columns()
+        if sum(len(r.param_dict) for r in sweep.resolver_list) == len(columns) * len(sweep):
+            # Every resolver assigns every key: take numeric values by column.
+            for key, column in columns.items():
+                if column.dtype == object:
+                    sweep_dict[key] = [r.value_of(key) for r in sweep.resolver_list]
+                else:
+                    sweep_dict[key] = column.tolist()
+        else:
+            for param_resolver in sweep:
+                for key in param_resolver:
+                    if key not in sweep_dict:
+                        sweep_dict[key] = []
+                    sweep_dict[key].append(param_resolver.value_of(key))
         out.sweep_function.function_type = run_context_pb2.SweepFunction.ZIP
         for key in sweep_dict:
             sweep_to_proto(sweeps.Points(key, sweep_dict[key]), out=out.sweep_function.sweeps.add())
@@ -121,6 +121,26 @@ def test_sweep_with_list_sweep():
     assert proto == expected
 
 
+def test_sweep_with_list_sweep_of_sympy_values():
+    ls = cirq.ListSweep([{'a': sympy.Float(0.5)}, {'a': sympy.Integer(2)}])
+    proto = v2.sweep_to_proto(ls)
+    assert list(proto.sweep_function.sweeps[0].single_sweep.points.points) == [0.5, 2]
+
+
+def test_sweep_with_heterogeneous_list_sweep():
+    ls = cirq.ListSweep([{'a': 'b', 'b': 0.5}, {'a': 2, 'b': 3, 'c': 4}])
+    proto = v2.sweep_to_proto(ls)
+    assert {
+        s.single_sweep.parameter_key: list(s.single_sweep.points.points)
+        for s in proto.sweep_function.sweeps
+    } == {'a': [0.5, 2], 'b': [0.5, 3], 'c': [4]}
+
+    # Chained values are resolved by the resolver of their own point.
+    ls = cirq.ListSweep([{'a': 'b', 'b': 0.5}, {'a': 'b', 'b': 1.5}])
+    proto = v2.sweep_to_proto(ls)
+    assert list(proto.sweep_function.sweeps[0].single_sweep.points.points) == [0.5, 1.5]
+
+
 def test_sweep_with_flattened_sweep():
     q = cirq.GridQubit(0, 0)
     circuit = cirq.Circuit(
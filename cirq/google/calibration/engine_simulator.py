@@ -1,3 +1,4 @@
+import functools
 from typing import (
     Any,
     Callable,
@@ -103,20 +104,13 @@ class PhasedFSimEngineSimulator(SimulatesSamples, SimulatesIntermediateStateVect
             New PhasedFSimEngineSimulator instance.
         """
 
-        def sample_gate(_1: Qid, _2: Qid, gate: FSimGate) -> PhasedFSimCharacterization:
-            assert isinstance(gate, FSimGate), f'Expected FSimGate, got {gate}'
-            assert np.isclose(gate.theta, np.pi / 4) and np.isclose(
-                gate.phi, 0.0
-            ), f'Expected ISWAP ** -0.5 like gate, got {gate}'
-            return PhasedFSimCharacterization(
-                theta=np.pi / 4, zeta=0.0, chi=0.0, gamma=0.0, phi=0.0
-            )
-
         if simulator is None:
             simulator = Simulator()
 
         return cls(
-            simulator, drift_generator=sample_gate, gates_translator=try_convert_sqrt_iswap_to_fsim
+            simulator,
+            drift_generator=_sample_ideal_gate,
+            gates_translator=try_convert_sqrt_iswap_to_fsim,
         )
 
     @classmethod
@@ -153,26 +147,11 @@ class PhasedFSimEngineSimulator(SimulatesSamples, SimulatesIntermediateStateVect
             raise ValueError(f'All mean values must be provided, got mean of {mean}')
 
         rand = parse_random_state(random_or_seed)
-
-        def sample_value(gaussian_mean: Optional[float], gaussian_sigma: Optional[float]) -> float:
-            assert gaussian_mean is not None
-            if gaussian_sigma is None:
-                return gaussian_mean
-            return rand.normal(gaussian_mean, gaussian_sigma)
-
-        def sample_gate(_1: Qid, _2: Qid, gate: FSimGate) -> PhasedFSimCharacterization:
-            assert isinstance(gate, FSimGate), f'Expected FSimGate, got {gate}'
-            assert np.isclose(gate.theta, np.pi / 4) and np.isclose(
-                gate.phi, 0.0
-            ), f'Expected ISWAP ** -0.5 like gate, got {gate}'
-
-            return PhasedFSimCharacterization(
-                theta=sample_value(mean.theta, sigma.theta),
-                zeta=sample_value(mean.zeta, sigma.zeta),
-                chi=sample_value(mean.chi, sigma.chi),
-                gamma=sample_value(mean.gamma, sigma.gamma),
-                phi=sample_value(mean.phi, sigma.phi),
-            )
+        # The global random state is used through the np.random module, which
+        # cannot be pickled.
+        sample_gate = functools.partial(
+            _sample_random_gaussian_gate, mean, sigma, None if rand is np.random else rand
+        )
 
         if simulator is None:
             simulator = Simulator()
@@ -210,36 +189,6 @@ class PhasedFSimEngineSimulator(SimulatesSamples, SimulatesIntermediateStateVect
             New PhasedFSimEngineSimulator instance.
         """
 
-        def sample_gate(a: Qid, b: Qid, gate: FSimGate) -> PhasedFSimCharacterization:
-            assert isinstance(gate, FSimGate), f'Expected FSimGate, got {gate}'
-            assert np.isclose(gate.theta, np.pi / 4) and np.isclose(
-                gate.phi, 0.0
-            ), f'Expected ISWAP ** -0.5 like gate, got {gate}'
-
-            if (a, b) in parameters:
-                pair_parameters = parameters[(a, b)]
-                if not isinstance(pair_parameters, PhasedFSimCharacterization):
-                    pair_parameters = PhasedFSimCharacterization(**pair_parameters)
-            elif (b, a) in parameters:
-                pair_parameters = parameters[(b, a)]
-                if not isinstance(pair_parameters, PhasedFSimCharacterization):
-                    pair_parameters = PhasedFSimCharacterization(**pair_parameters)
-                pair_parameters = pair_parameters.parameters_for_qubits_swapped()
-            elif ideal_when_missing_gate:
-                pair_parameters = SQRT_ISWAP_PARAMETERS
-            else:
-                raise ValueError(f'Missing parameters for pair {(a, b)}')
-
-            if pair_parameters.any_none():
-                if not ideal_when_missing_parameter:
-                    raise ValueError(
-                        f'Missing parameter value for pair {(a, b)}, '
-                        f'parameters={pair_parameters}'
-                    )
-                pair_parameters = pair_parameters.merge_with(SQRT_ISWAP_PARAMETERS)
-
-            return pair_parameters
-
         for a, b in parameters:
             if a > b:
                 raise ValueError(
@@ -250,6 +199,12 @@ class PhasedFSimEngineSimulator(SimulatesSamples, SimulatesIntermediateStateVect
         if simulator is None:
             simulator = Simulator()
 
+        sample_gate = functools.partial(
+            _sample_gate_from_dictionary,
+            parameters,
+            ideal_when_missing_gate,
+            ideal_when_missing_parameter,
+        )
         return cls(
             simulator, drift_generator=sample_gate, gates_translator=try_convert_sqrt_iswap_to_fsim
         )
@@ -400,6 +355,81 @@ class PhasedFSimEngineSimulator(SimulatesSamples, SimulatesIntermediateStateVect
         return self._simulator._base_iterator(converted, qubit_order, initial_state)
 
 
+# The drift generators of the factory methods of PhasedFSimEngineSimulator are
+# defined here, rather than as closures, so that the simulators can be pickled.
+
+
+def _check_sqrt_iswap_like(gate: FSimGate) -> None:
+    assert isinstance(gate, FSimGate), f'Expected FSimGate, got {gate}'
+    assert np.isclose(gate.theta, np.pi / 4) and np.isclose(
+        gate.phi, 0.0
+    ), f'Expected ISWAP ** -0.5 like gate, got {gate}'
+
+
+def _sample_ideal_gate(_1: Qid, _2: Qid, gate: FSimGate) -> PhasedFSimCharacterization:
+    _check_sqrt_iswap_like(gate)
+    return PhasedFSimCharacterization(theta=np.pi / 4, zeta=0.0, chi=0.0, gamma=0.0, phi=0.0)
+
+
+def _sample_random_gaussian_gate(
+    mean: PhasedFSimCharacterization,
+    sigma: PhasedFSimCharacterization,
+    rand: Optional[np.random.RandomState],
+    _1: Qid,
+    _2: Qid,
+    gate: FSimGate,
+) -> PhasedFSimCharacterization:
+    _check_sqrt_iswap_like(gate)
+
+    def sample_value(gaussian_mean: Optional[float], gaussian_sigma: Optional[float]) -> float:
+        assert gaussian_mean is not None
+        if gaussian_sigma is None:
+            return gaussian_mean
+        return (np.random if rand is None else rand).normal(gaussian_mean, gaussian_sigma)
+
+    return PhasedFSimCharacterization(
+        theta=sample_value(mean.theta, sigma.theta),
+        zeta=sample_value(mean.zeta, sigma.zeta),
+        chi=sample_value(mean.chi, sigma.chi),
+        gamma=sample_value(mean.gamma, sigma.gamma),
+        phi=sample_value(mean.phi, sigma.phi),
+    )
+
+
+def _sample_gate_from_dictionary(
+    parameters: PhasedFsimDictParameters,
+    ideal_when_missing_gate: bool,
+    ideal_when_missing_parameter: bool,
+    a: Qid,
+    b: Qid,
+    gate: FSimGate,
+) -> PhasedFSimCharacterization:
+    _check_sqrt_iswap_like(gate)
+
+    if (a, b) in parameters:
+        pair_parameters = parameters[(a, b)]
+        if not isinstance(pair_parameters, PhasedFSimCharacterization):
+            pair_parameters = PhasedFSimCharacterization(**pair_parameters)
+    elif (b, a) in parameters:
+        pair_parameters = parameters[(b, a)]
+        if not isinstance(pair_parameters, PhasedFSimCharacterization):
+            pair_parameters = PhasedFSimCharacterization(**pair_parameters)
+        pair_parameters = pair_parameters.parameters_for_qubits_swapped()
+    elif ideal_when_missing_gate:
+        pair_parameters = SQRT_ISWAP_PARAMETERS
+    else:
+        raise ValueError(f'Missing parameters for pair {(a, b)}')
+
+    if pair_parameters.any_none():
+        if not ideal_when_missing_parameter:
+            raise ValueError(
+                f'Missing parameter value for pair {(a, b)}, parameters={pair_parameters}'
+            )
+        pair_parameters = pair_parameters.merge_with(SQRT_ISWAP_PARAMETERS)
+
+    return pair_parameters
+
+
 class _PhasedFSimConverter(PointOptimizer):
     def __init__(self, simulator: PhasedFSimEngineSimulator) -> None:
         super().__init__()
@@ -1,6 +1,7 @@
 from typing import Iterable, Tuple
 
 import collections
+import pickle
 from unittest import mock
 
 import numpy as np
@@ -383,6 +384,33 @@ def test_from_characterizations_sqrt_iswap_simulates_correctly() -> None:
     assert cirq.allclose_up_to_global_phase(actual, expected)
 
 
+@pytest.mark.parametrize(
+    'create',
+    [
+        PhasedFSimEngineSimulator.create_with_ideal_sqrt_iswap,
+        lambda simulator: PhasedFSimEngineSimulator.create_with_random_gaussian_sqrt_iswap(
+            simulator=simulator, random_or_seed=5
+        ),
+        lambda simulator: PhasedFSimEngineSimulator.create_with_random_gaussian_sqrt_iswap(
+            simulator=simulator
+        ),
+        lambda simulator: PhasedFSimEngineSimulator.create_from_dictionary_sqrt_iswap(
+            {tuple(cirq.LineQubit.range(2)): {'theta': 0.6}},
+            simulator=simulator,
+            ideal_when_missing_parameter=True,
+        ),
+    ],
+)
+def test_simulators_can_be_pickled(create) -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.FSimGate(np.pi / 4, 0.0).on(a, b))
+    engine_simulator = create(simulator=cirq.Simulator(seed=1))
+    # Drifts drawn before pickling are kept.
+    expected = engine_simulator.final_state_vector(circuit)
+    copy = pickle.loads(pickle.dumps(engine_simulator))
+    assert np.allclose(copy.final_state_vector(circuit), expected)
+
+
 def test_from_characterizations_sqrt_iswap_when_invalid_arguments_fails() -> None:
     parameters_ab = cirq.google.PhasedFSimCharacterization(
         theta=0.6, zeta=0.5, chi=0.4, gamma=0.3, phi=0.2
@@ -41,6 +41,10 @@ from cirq.google.engine.engine_job import (
     EngineJob,
 )
 
+from cirq.google.engine.engine_job_waiter import (
+    EngineJobWaiter,
+)
+
 from cirq.google.engine.engine_processor import (
     EngineProcessor,
 )
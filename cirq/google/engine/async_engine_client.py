@@ -0,0 +1,276 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An asyncio client for the Quantum Engine API."""
+
+import asyncio
+import sys
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+import grpc
+from google.api_core import exceptions
+from google.api_core import grpc_helpers_async
+from google.api_core.gapic_v1 import routing_header
+
+from cirq.google.engine.client.quantum import types as qtypes
+from cirq.google.engine.client.quantum_v1alpha1.gapic.transports import (
+    quantum_engine_service_grpc_transport,
+)
+from cirq.google.engine.client.quantum_v1alpha1.proto import engine_pb2, engine_pb2_grpc
+from cirq.google.engine.engine_client import EngineClient, EngineException, RETRYABLE_ERROR_CODES
+
+_R = TypeVar('_R')
+
+_Transport = quantum_engine_service_grpc_transport.QuantumEngineServiceGrpcTransport
+
+
+class AsyncEngineClient:
+    """Coroutine-based client for the Quantum Engine API.
+
+    Like `EngineClient`, this deals with the engine protos rather than cirq
+    objects, but every call is a coroutine running on a single shared
+    `grpc.aio` channel. Many calls can therefore be in flight at once from
+    one thread, e.g. to submit a large number of small jobs:
+
+        async with AsyncEngineClient() as client:
+            jobs = await asyncio.gather(*[
+                client.create_job(project_id, program_id, None, processor_ids, context)
+                for context in run_contexts
+            ])
+
+    Calls failing with a retryable error are retried with exponential
+    backoff, sleeping without blocking the event loop. At most
+    `max_concurrent_requests` calls are sent at a time; the others wait for
+    their turn.
+    """
+
+    def __init__(
+        self,
+        channel: Optional['grpc.aio.Channel'] = None,
+        *,
+        credentials=None,
+        address: str = 'quantum.googleapis.com:443',
+        max_concurrent_requests: int = 32,
+        max_retry_delay_seconds: int = 3600,  # 1 hour
+        verbose: Optional[bool] = None,
+    ) -> None:
+        """Async engine service client.
+
+        Args:
+            channel: The `grpc.aio` channel to send requests on. By default, a
+                secure channel to `address` is created.
+            credentials: The credentials of the default channel. By default,
+                they are determined from the environment. Must not be given
+                together with `channel`.
+            address: The address of the service for the default channel.
+            max_concurrent_requests: The maximum number of requests in flight
+                at any time.
+            max_retry_delay_seconds: The maximum number of seconds to retry
+                when a retryable error code is returned.
+            verbose: Suppresses stderr messages when set to False. Default is
+                true.
+        """
+        if channel is not None and credentials is not None:
+            raise ValueError('Specify at most one of `channel` and `credentials`.')
+        if max_concurrent_requests < 1:
+            raise ValueError('max_concurrent_requests must be positive.')
+        if channel is None:
+            channel = grpc_helpers_async.create_channel(
+                address,
+                credentials=credentials,
+                scopes=_Transport._OAUTH_SCOPES,
+                options=[
+                    ('grpc.max_send_message_length', -1),
+                    ('grpc.max_receive_message_length', -1),
+                ],
+            )
+        self._channel = channel
+        self._stub = engine_pb2_grpc.QuantumEngineServiceStub(channel)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self.verbose = True if verbose is None else verbose
+        # Created on first use so that it belongs to the running event loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def close(self) -> None:
+        """Closes the channel, cancelling any requests in flight."""
+        await self._channel.close()
+
+    async def __aenter__(self) -> 'AsyncEngineClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _make_request(
+        self, request: Callable[..., Awaitable[_R]], parent: Tuple[str, str], *args
+    ) -> _R:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        metadata = [routing_header.to_grpc_metadata([parent])]
+        # Start with a 100ms retry delay with exponential backoff to
+        # max_retry_delay_seconds
+        current_delay = 0.1
+
+        while True:
+            try:
+                async with self._semaphore:
+                    return await request(*args, metadata=metadata)
+            except grpc.RpcError as rpc_error:
+                err = exceptions.from_grpc_error(rpc_error)
+                message = err.message
+                # Raise EngineException for errors that are not retryable.
+                # Otherwise, pass through to retry.
+                if err.code is None or err.code.value not in RETRYABLE_ERROR_CODES:
+                    raise EngineException(message) from err
+
+            if current_delay > self.max_retry_delay_seconds:
+                raise TimeoutError('Reached max retry attempts for error: {}'.format(message))
+            if self.verbose:
+                print(message, file=sys.stderr)
+                print('Waiting ', current_delay, 'seconds before retrying.', file=sys.stderr)
+            await asyncio.sleep(current_delay)
+            current_delay *= 2
+
+    async def create_program(
+        self,
+        project_id: str,
+        program_id: Optional[str],
+        code: qtypes.any_pb2.Any,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, qtypes.QuantumProgram]:
+        """Creates a Quantum Engine program.
+
+        Args:
+            project_id: A project_id of the parent Google Cloud Project.
+            program_id: Unique ID of the program within the parent project.
+            code: Properly serialized program code.
+            description: An optional description to set on the program.
+            labels: Optional set of labels to set on the program.
+
+        Returns:
+            Tuple of created program id and program
+        """
+        parent_name = EngineClient._project_name(project_id)
+        program_name = (
+            EngineClient._program_name_from_ids(project_id, program_id) if program_id else ''
+        )
+        program = qtypes.QuantumProgram(name=program_name, code=code)
+        if description:
+            program.description = description
+        if labels:
+            program.labels.update(labels)
+
+        request = engine_pb2.CreateQuantumProgramRequest(
+            parent=parent_name, quantum_program=program, overwrite_existing_source_code=False
+        )
+        program = await self._make_request(
+            self._stub.CreateQuantumProgram, ('parent', parent_name), request
+        )
+        return EngineClient._ids_from_program_name(program.name)[1], program
+
+    async def create_job(
+        self,
+        project_id: str,
+        program_id: str,
+        job_id: Optional[str],
+        processor_ids: Sequence[str],
+        run_context: qtypes.any_pb2.Any,
+        priority: Optional[int] = None,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, qtypes.QuantumJob]:
+        """Creates and runs a job on Quantum Engine.
+
+        Args:
+            project_id: A project_id of the parent Google Cloud Project.
+            program_id: Unique ID of the program within the parent project.
+            job_id: Unique ID of the job within the parent program.
+            run_context: Properly serialized run context.
+            processor_ids: List of processor id for running the program.
+            priority: Optional priority to run at, 0-1000.
+            description: Optional description to set on the job.
+            labels: Optional set of labels to set on the job.
+
+        Returns:
+            Tuple of created job id and job
+        """
+        # Check program to run and program parameters.
+        if priority and not 0 <= priority < 1000:
+            raise ValueError('priority must be between 0 and 1000')
+
+        parent_name = EngineClient._program_name_from_ids(project_id, program_id)
+        job_name = EngineClient._job_name_from_ids(project_id, program_id, job_id) if job_id else ''
+        job = qtypes.QuantumJob(
+            name=job_name,
+            scheduling_config=qtypes.SchedulingConfig(
+                processor_selector=qtypes.SchedulingConfig.ProcessorSelector(
+                    processor_names=[
+                        EngineClient._processor_name_from_ids(project_id, processor_id)
+                        for processor_id in processor_ids
+                    ]
+                )
+            ),
+            run_context=run_context,
+        )
+        if priority:
+            job.scheduling_config.priority = priority
+        if description:
+            job.description = description
+        if labels:
+            job.labels.update(labels)
+
+        request = engine_pb2.CreateQuantumJobRequest(
+            parent=parent_name, quantum_job=job, overwrite_existing_run_context=False
+        )
+        job = await self._make_request(
+            self._stub.CreateQuantumJob, ('parent', parent_name), request
+        )
+        return EngineClient._ids_from_job_name(job.name)[2], job
+
+    async def get_job(
+        self, project_id: str, program_id: str, job_id: str, return_run_context: bool
+    ) -> qtypes.QuantumJob:
+        """Returns a previously created job.
+
+        Args:
+            project_id: A project_id of the parent Google Cloud Project.
+            program_id: Unique ID of the program within the parent project.
+            job_id: Unique ID of the job within the parent program.
+            return_run_context: If true then the run context will be loaded
+                from the job's run_context_location and set on the returned
+                QuantumJob.
+        """
+        job_name = EngineClient._job_name_from_ids(project_id, program_id, job_id)
+        request = engine_pb2.GetQuantumJobRequest(
+            name=job_name, return_run_context=return_run_context
+        )
+        return await self._make_request(self._stub.GetQuantumJob, ('name', job_name), request)
+
+    async def get_job_results(
+        self, project_id: str, program_id: str, job_id: str
+    ) -> qtypes.QuantumResult:
+        """Returns the results of a completed job.
+
+        Args:
+            project_id: A project_id of the parent Google Cloud Project.
+            program_id: Unique ID of the program within the parent project.
+            job_id: Unique ID of the job within the parent program.
+
+        Returns:
+            The quantum result.
+        """
+        job_name = EngineClient._job_name_from_ids(project_id, program_id, job_id)
+        request = engine_pb2.GetQuantumResultRequest(parent=job_name)
+        return await self._make_request(self._stub.GetQuantumResult, ('parent', job_name), request)
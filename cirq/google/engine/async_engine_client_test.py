@@ -0,0 +1,202 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+from unittest import mock
+
+import grpc
+import pytest
+
+from cirq.google.engine.async_engine_client import AsyncEngineClient
+from cirq.google.engine.client.quantum_v1alpha1 import types as qtypes
+from cirq.google.engine.client.quantum_v1alpha1.proto import engine_pb2_grpc
+from cirq.google.engine.engine_client import EngineException
+
+
+# The servicer sleeps with the real asyncio.sleep when the client's is patched.
+_sleep = asyncio.sleep
+
+
+class FakeEngineServicer(engine_pb2_grpc.QuantumEngineServiceServicer):
+    """Keeps programs and jobs in memory, optionally failing some calls."""
+
+    def __init__(self):
+        self.programs = {}
+        self.jobs = {}
+        self.metadata = []
+        # Status codes with which the next calls are aborted.
+        self.errors = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _enter(self, context):
+        self.metadata.append(dict(context.invocation_metadata()))
+        if self.errors:
+            await context.abort(self.errors.pop(0), 'injected error')
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await _sleep(0.01)
+        self.in_flight -= 1
+
+    async def CreateQuantumProgram(self, request, context):
+        await self._enter(context)
+        program = qtypes.QuantumProgram()
+        program.CopyFrom(request.quantum_program)
+        if not program.name:
+            program.name = f'{request.parent}/programs/prog{len(self.programs)}'
+        self.programs[program.name] = program
+        return program
+
+    async def CreateQuantumJob(self, request, context):
+        await self._enter(context)
+        job = qtypes.QuantumJob()
+        job.CopyFrom(request.quantum_job)
+        if not job.name:
+            job.name = f'{request.parent}/jobs/job{len(self.jobs)}'
+        job.execution_status.state = qtypes.ExecutionStatus.State.SUCCESS
+        self.jobs[job.name] = job
+        return job
+
+    async def GetQuantumJob(self, request, context):
+        await self._enter(context)
+        if request.name not in self.jobs:
+            await context.abort(grpc.StatusCode.NOT_FOUND, 'no such job')
+        return self.jobs[request.name]
+
+    async def GetQuantumResult(self, request, context):
+        await self._enter(context)
+        return qtypes.QuantumResult(
+            parent=request.parent, result=self.jobs[request.parent].run_context
+        )
+
+
+@contextlib.asynccontextmanager
+async def fake_engine():
+    servicer = FakeEngineServicer()
+    server = grpc.aio.server()
+    engine_pb2_grpc.add_QuantumEngineServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    await server.start()
+    channel = grpc.aio.insecure_channel(f'localhost:{port}')
+    async with AsyncEngineClient(channel, verbose=False) as client:
+        yield servicer, client
+    await server.stop(None)
+
+
+def _to_any(description):
+    any_proto = qtypes.any_pb2.Any()
+    any_proto.Pack(qtypes.QuantumProgram(description=description))
+    return any_proto
+
+
+@pytest.mark.asyncio
+async def test_create_program_and_job():
+    async with fake_engine() as (servicer, client):
+        code = _to_any('code')
+        program_id, program = await client.create_program(
+            'proj', None, code, description='hello', labels={'a': 'b'}
+        )
+        assert program_id == 'prog0'
+        assert program == qtypes.QuantumProgram(
+            name='projects/proj/programs/prog0', code=code, description='hello', labels={'a': 'b'}
+        )
+        assert servicer.metadata[0]['x-goog-request-params'] == 'parent=projects/proj'
+
+        job_id, job = await client.create_job(
+            'proj',
+            'prog0',
+            'myjob',
+            ['p1'],
+            _to_any('x'),
+            priority=10,
+            description='job',
+            labels={'c': 'd'},
+        )
+        assert job_id == 'myjob'
+        assert job.name == 'projects/proj/programs/prog0/jobs/myjob'
+        assert job.scheduling_config.priority == 10
+        assert list(job.scheduling_config.processor_selector.processor_names) == [
+            'projects/proj/processors/p1'
+        ]
+        assert job.description == 'job'
+        assert dict(job.labels) == {'c': 'd'}
+
+        assert await client.get_job('proj', 'prog0', 'myjob', False) == job
+        result = await client.get_job_results('proj', 'prog0', 'myjob')
+        assert result.result == _to_any('x')
+
+        with pytest.raises(ValueError, match='priority'):
+            _ = await client.create_job('proj', 'prog0', None, ['p1'], _to_any(''), 1001)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_capped():
+    async with fake_engine() as (servicer, client):
+        client.max_concurrent_requests = 3
+        jobs = await asyncio.gather(
+            *[client.create_job('proj', 'prog', None, ['p'], _to_any('')) for _ in range(20)]
+        )
+        assert sorted(job_id for job_id, _ in jobs) == sorted(f'job{i}' for i in range(20))
+        assert servicer.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_without_blocking(capsys):
+    async with fake_engine() as (servicer, client):
+        servicer.errors = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.INTERNAL]
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            await _sleep(0)
+
+        with mock.patch('asyncio.sleep', new=fake_sleep):
+            program_id, _ = await client.create_program('proj', 'p', qtypes.any_pb2.Any())
+        assert program_id == 'p'
+        assert delays == [0.1, 0.2]
+
+        client.max_retry_delay_seconds = 0.3
+        client.verbose = True
+        servicer.errors = [grpc.StatusCode.UNAVAILABLE] * 3
+        with mock.patch('asyncio.sleep', new=fake_sleep):
+            with pytest.raises(TimeoutError, match='injected error'):
+                _ = await client.create_program('proj', 'p', qtypes.any_pb2.Any())
+        assert capsys.readouterr().err.count('Waiting') == 2
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors():
+    async with fake_engine() as (_, client):
+        with pytest.raises(EngineException, match='no such job'):
+            _ = await client.get_job('proj', 'prog', 'missing', False)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match='at most one'):
+        _ = AsyncEngineClient(mock.Mock(), credentials=mock.Mock())
+    with pytest.raises(ValueError, match='positive'):
+        _ = AsyncEngineClient(mock.Mock(), max_concurrent_requests=0)
+
+
+@mock.patch('google.api_core.grpc_helpers_async.create_channel')
+def test_default_channel(create_channel):
+    credentials = mock.Mock()
+    _ = AsyncEngineClient(credentials=credentials)
+    create_channel.assert_called_once_with(
+        'quantum.googleapis.com:443',
+        credentials=credentials,
+        scopes=('https://www.googleapis.com/auth/cloud-platform',),
+        options=[('grpc.max_send_message_length', -1), ('grpc.max_receive_message_length', -1)],
+    )
@@ -23,18 +23,33 @@ In order to run on must have access to the Quantum Engine API. Access to this
 API is (as of June 22, 2018) restricted to invitation only.
 """
 
+import concurrent.futures
 import datetime
 import enum
+import multiprocessing
 import os
+import pickle
 import random
 import string
-from typing import Dict, Iterable, List, Optional, Sequence, Set, TypeVar, Union, TYPE_CHECKING
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+)
 
 from google.protobuf import any_pb2
 from cirq.google.engine.client import quantum
 from cirq.google.engine.result_type import ResultType
 from cirq import circuits, study, value
-from cirq.google import serializable_gate_set as sgs
+from cirq.google import gate_sets, serializable_gate_set as sgs
 from cirq.google.api import v2
 from cirq.google.arg_func_langs import arg_to_proto
 from cirq.google.engine import (
@@ -69,6 +84,112 @@ def _make_random_id(prefix: str, length: int = 16):
     return '%s%s' % (prefix, suffix)
 
 
+# The gate set used by a serialization worker process.
+_worker_gate_set: Optional[sgs.SerializableGateSet] = None
+
+
+def _gate_set_reference(gate_set: sgs.SerializableGateSet) -> Optional[Union[int, bytes]]:
+    """Returns how a worker process can obtain `gate_set`, or None if it can't.
+
+    The Google gate sets hold lambdas, so they are referred to by their index
+    in `GOOGLE_GATESETS`. Other gate sets are pickled if possible.
+    """
+    for i, known in enumerate(gate_sets.GOOGLE_GATESETS):
+        if gate_set is known:
+            return i
+    try:
+        return pickle.dumps(gate_set)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+
+
+def _set_worker_gate_set(reference: Union[int, bytes]):
+    global _worker_gate_set
+    if isinstance(reference, int):
+        _worker_gate_set = gate_sets.GOOGLE_GATESETS[reference]
+    else:
+        _worker_gate_set = pickle.loads(reference)
+
+
+def _serialize_worker_program(program: 'cirq.Circuit') -> bytes:
+    assert _worker_gate_set is not None
+    return _worker_gate_set.serialize(program).SerializeToString()
+
+
+def _program_key(program: 'cirq.Circuit') -> Hashable:
+    """A key under which circuits that serialize identically are grouped."""
+    key = tuple(program)
+    try:
+        hash(key)
+    except TypeError:
+        # Some operations are not hashable; group only identical objects.
+        return id(program)
+    return key
+
+
+def _varint(value: int) -> bytes:
+    """Encodes a non-negative integer as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _serialize_batch(
+    programs: List['cirq.Circuit'],
+    gate_set: sgs.SerializableGateSet,
+    max_workers: Optional[int] = None,
+) -> any_pb2.Any:
+    """Serializes circuits into an Any containing a v2 BatchProgram.
+
+    Each distinct circuit is serialized once, and its bytes are repeated for
+    every position an equal circuit occurs at in the batch. The packed
+    BatchProgram is assembled directly from the serialized programs, without
+    building the combined message.
+
+    Args:
+        programs: The circuits of the batch.
+        gate_set: The gate set used to serialize the circuits.
+        max_workers: If greater than 1, serialize the circuits in this many
+            newly spawned worker processes. This requires the gate set to be
+            one of `gate_sets.GOOGLE_GATESETS` or to be picklable; otherwise
+            the circuits are serialized in this process.
+    """
+    index_of: Dict[Hashable, int] = {}
+    keys = [_program_key(program) for program in programs]
+    unique_programs: List['cirq.Circuit'] = []
+    for key, program in zip(keys, programs):
+        if key not in index_of:
+            index_of[key] = len(unique_programs)
+            unique_programs.append(program)
+
+    reference = None
+    if max_workers is not None and max_workers > 1 and len(unique_programs) > 1:
+        reference = _gate_set_reference(gate_set)
+    if reference is not None:
+        # Workers are spawned rather than forked, which is unsafe while gRPC
+        # channels are open and unavailable on some platforms. They receive
+        # the pickled circuits.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_set_worker_gate_set,
+            initargs=(reference,),
+        ) as pool:
+            serialized = list(pool.map(_serialize_worker_program, unique_programs))
+    else:
+        serialized = [gate_set.serialize(p).SerializeToString() for p in unique_programs]
+
+    # Each program is a length-delimited entry of field 1 of BatchProgram.
+    entries = [b'\x0a' + _varint(len(data)) + data for data in serialized]
+    return any_pb2.Any(
+        type_url=TYPE_PREFIX + v2.batch_pb2.BatchProgram.DESCRIPTOR.full_name,
+        value=b''.join(entries[index_of[key]] for key in keys),
+    )
+
+
 @value.value_equality
 class EngineContext:
     """Context for running against the Quantum Engine API. Most users should
@@ -310,6 +431,7 @@ class Engine:
         program_labels: Optional[Dict[str, str]] = None,
         job_description: Optional[str] = None,
         job_labels: Optional[Dict[str, str]] = None,
+        serialization_workers: Optional[int] = None,
     ) -> engine_job.EngineJob:
         """Runs the supplied Circuits via Quantum Engine.Creates
 
@@ -348,6 +470,9 @@ class Engine:
             program_labels: Optional set of labels to set on the program.
             job_description: An optional description to set on the job.
             job_labels: Optional set of labels to set on the job.
+            serialization_workers: If greater than 1, the number of worker
+                processes used to serialize the circuits. See
+                `create_batch_program`.
 
         Returns:
             An EngineJob. If this is iterated over it returns a list of
@@ -363,7 +488,12 @@ class Engine:
         if not processor_ids:
             raise ValueError('Processor id must be specified.')
         engine_program = self.create_batch_program(
-            programs, program_id, gate_set, program_description, program_labels
+            programs,
+            program_id,
+            gate_set,
+            program_description,
+            program_labels,
+            serialization_workers=serialization_workers,
         )
         return engine_program.run_batch(
             job_id=job_id,
@@ -497,9 +627,14 @@ class Engine:
         gate_set: Optional[sgs.SerializableGateSet] = None,
         description: Optional[str] = None,
         labels: Optional[Dict[str, str]] = None,
+        *,
+        serialization_workers: Optional[int] = None,
     ) -> engine_program.EngineProgram:
         """Wraps a list of Circuits into a BatchProgram for the Quantum Engine.
 
+        A circuit that occurs several times in the batch is serialized only
+        once.
+
         Args:
             programs: The Circuits to execute within a batch.
             program_id: A user-provided identifier for the program. This must be
@@ -511,6 +646,12 @@ class Engine:
                 must be supported by the selected processor
             description: An optional description to set on the program.
             labels: Optional set of labels to set on the program.
+            serialization_workers: If greater than 1, serialize the circuits
+                in this many worker processes. The workers are started for
+                each call, which takes a few seconds, so this only pays off
+                for large batches. It is ignored for gate sets that cannot be
+                sent to other processes, i.e. custom gate sets which are not
+                picklable.
 
         Returns:
             A EngineProgram for the newly created program.
@@ -520,14 +661,10 @@ class Engine:
         if not program_id:
             program_id = _make_random_id('prog-')
 
-        batch = v2.batch_pb2.BatchProgram()
-        for program in programs:
-            gate_set.serialize(program, msg=batch.programs.add())
-
         new_program_id, new_program = self.context.client.create_program(
             self.project_id,
             program_id,
-            code=self._pack_any(batch),
+            code=_serialize_batch(programs, gate_set, serialization_workers),
             description=description,
             labels=labels,
         )
@@ -13,7 +13,6 @@
 # limitations under the License.
 """A helper for jobs that have been created on the Quantum Engine."""
 import datetime
-import time
 
 from typing import Dict, Iterator, List, Optional, overload, Tuple, TYPE_CHECKING
 
@@ -21,6 +20,7 @@ from cirq import study
 from cirq.google.engine import calibration
 from cirq.google.engine.calibration_result import CalibrationResult
 from cirq.google.engine.client import quantum
+from cirq.google.engine import engine_job_waiter
 from cirq.google.engine.result_type import ResultType
 from cirq.google.api import v1, v2
 
@@ -285,18 +285,9 @@ class EngineJob:
         return self._batched_results
 
     def _wait_for_result(self):
-        job = self._refresh_job()
-        total_seconds_waited = 0.0
-        timeout = self.context.timeout
-        while True:
-            if timeout and total_seconds_waited >= timeout:
-                break
-            if job.execution_status.state in TERMINAL_STATES:
-                break
-            time.sleep(0.5)
-            total_seconds_waited += 0.5
-            job = self._refresh_job()
-        self._raise_on_failure(job)
+        # A single job is polled at a steady pace rather than backing off.
+        engine_job_waiter.EngineJobWaiter(max_delay=0.5).wait([self], timeout=self.context.timeout)
+        self._raise_on_failure(self._inner_job())
         response = self.context.client.get_job_results(
             self.project_id, self.program_id, self.job_id
         )
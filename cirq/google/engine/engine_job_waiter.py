@@ -0,0 +1,207 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Waits for many Quantum Engine jobs at once."""
+import asyncio
+import datetime
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cirq.google.engine import engine_job
+from cirq.google.engine.engine_client import EngineClient
+
+
+def _from_timestamp(seconds: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+
+
+def _is_done(job: 'engine_job.EngineJob') -> bool:
+    return job._job is not None and job._job.execution_status.state in engine_job.TERMINAL_STATES
+
+
+class EngineJobWaiter:
+    """Polls the status of many `cirq.google.EngineJob`s together.
+
+    While two or more jobs of a project are pending, a single `list_jobs` call
+    filtered to terminal jobs created between the oldest and the newest
+    pending one refreshes all of them, instead of one `get_job` call per job.
+    The listing is read only until all pending jobs are found, and at most
+    `max_listed_jobs` of it: if other jobs of the project crowd the listing,
+    the remaining jobs are refreshed with `get_job`. A lone pending job is
+    refreshed with `get_job`.
+
+    The delay between polls starts at `initial_delay` and is multiplied by
+    `backoff` after every poll in which no job finished, up to `max_delay`.
+    It returns to `initial_delay` as soon as a job finishes.
+
+    Jobs can be waited for synchronously with `wait`, or from a running event
+    loop with `wait_async`, which returns a future per job. All futures of a
+    waiter share one polling task, which runs the blocking Engine calls on the
+    loop's default executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 0.5,
+        max_delay: float = 5.0,
+        backoff: float = 1.5,
+        max_listed_jobs: int = 200,
+    ) -> None:
+        """Inits EngineJobWaiter.
+
+        Args:
+            initial_delay: Seconds between the first polls, and after any
+                poll in which a job finished.
+            max_delay: The maximum number of seconds between polls.
+            backoff: The factor by which the delay grows after each poll in
+                which no job finished.
+            max_listed_jobs: The maximum number of jobs read from the listing
+                of a project in one poll.
+        """
+        if not 0 < initial_delay <= max_delay:
+            raise ValueError('Delays must satisfy 0 < initial_delay <= max_delay.')
+        if backoff < 1:
+            raise ValueError('backoff must be at least 1.')
+        if max_listed_jobs < 1:
+            raise ValueError('max_listed_jobs must be positive.')
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._backoff = backoff
+        self._max_listed_jobs = max_listed_jobs
+        self._futures: Dict['engine_job.EngineJob', asyncio.Future] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+
+    def _next_delay(self, delay: float, progressed: bool) -> float:
+        if progressed:
+            return self._initial_delay
+        return min(delay * self._backoff, self._max_delay)
+
+    def refresh(self, jobs: 'Iterable[engine_job.EngineJob]') -> 'List[engine_job.EngineJob]':
+        """Updates the status of the given jobs which are not yet done.
+
+        Returns:
+            The jobs which are still not in a terminal state.
+        """
+        groups: Dict[Tuple[int, str], List['engine_job.EngineJob']] = {}
+        for job in jobs:
+            if not _is_done(job):
+                groups.setdefault((id(job.context.client), job.project_id), []).append(job)
+
+        for (_, project_id), group in groups.items():
+            if len(group) == 1:
+                group[0]._refresh_job()
+                continue
+            program_ids = {job.program_id for job in group}
+            create_times = [job._inner_job().create_time.seconds for job in group]
+            remaining = {(job.project_id, job.program_id, job.job_id): job for job in group}
+            listed = group[0].context.client.list_jobs(
+                project_id,
+                program_id=program_ids.pop() if len(program_ids) == 1 else None,
+                created_after=_from_timestamp(min(create_times)),
+                # Timestamps are truncated to seconds.
+                created_before=_from_timestamp(max(create_times) + 1),
+                execution_states=set(engine_job.TERMINAL_STATES),
+            )
+            for count, quantum_job in enumerate(listed, 1):
+                job = remaining.pop(EngineClient._ids_from_job_name(quantum_job.name), None)
+                if job is not None:
+                    job._job = quantum_job
+                if not remaining:
+                    break
+                if count == self._max_listed_jobs:
+                    for job in remaining.values():
+                        job._refresh_job()
+                    break
+        return [job for jobs_ in groups.values() for job in jobs_ if not _is_done(job)]
+
+    def wait(
+        self, jobs: 'Iterable[engine_job.EngineJob]', timeout: Optional[float] = None
+    ) -> 'List[engine_job.EngineJob]':
+        """Blocks until all jobs are done or `timeout` seconds have passed.
+
+        As for `cirq.google.EngineContext`, a `timeout` of None or 0 never
+        times out.
+
+        Returns:
+            The jobs which are still not in a terminal state.
+        """
+        pending = self.refresh(jobs)
+        delay = self._initial_delay
+        total_seconds_waited = 0.0
+        while pending:
+            if timeout:
+                if total_seconds_waited >= timeout:
+                    break
+                delay = min(delay, timeout - total_seconds_waited)
+            time.sleep(delay)
+            total_seconds_waited += delay
+            still_pending = self.refresh(pending)
+            delay = self._next_delay(delay, len(still_pending) < len(pending))
+            pending = still_pending
+        return pending
+
+    def wait_async(self, job: 'engine_job.EngineJob') -> 'asyncio.Future[engine_job.EngineJob]':
+        """Returns a future resolving to `job` once it is in a terminal state.
+
+        Must be called from a running event loop. The future fails with a
+        `RuntimeError` if the job failed or was cancelled, and with any error
+        raised while polling.
+        """
+        future = self._futures.get(job)
+        if future is None:
+            future = asyncio.get_event_loop().create_future()
+            self._futures[job] = future
+        if self._poll_task is None:
+            self._poll_task = asyncio.ensure_future(self._poll())
+        return future
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_event_loop()
+        delay = self._initial_delay
+        try:
+            while True:
+                for job, future in list(self._futures.items()):
+                    if future.done():
+                        del self._futures[job]
+                if not self._futures:
+                    break
+                jobs = list(self._futures)
+                try:
+                    pending = await loop.run_in_executor(None, self.refresh, jobs)
+                except Exception as error:
+                    for future in self._futures.values():
+                        if not future.done():
+                            future.set_exception(error)
+                    self._futures.clear()
+                    break
+                still_pending = set(pending)
+                for job in jobs:
+                    if job not in still_pending:
+                        self._resolve(job, self._futures.pop(job))
+                if self._futures:
+                    delay = self._next_delay(delay, len(pending) < len(jobs))
+                    await asyncio.sleep(delay)
+        finally:
+            self._poll_task = None
+
+    @staticmethod
+    def _resolve(job: 'engine_job.EngineJob', future: asyncio.Future) -> None:
+        if future.done():
+            return
+        try:
+            job._raise_on_failure(job._inner_job())
+        except RuntimeError as error:
+            future.set_exception(error)
+        else:
+            future.set_result(job)
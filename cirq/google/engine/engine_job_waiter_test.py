@@ -0,0 +1,264 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import datetime
+from unittest import mock
+
+import pytest
+
+import cirq.google as cg
+from cirq.google.engine.client.quantum_v1alpha1 import types as qtypes
+from cirq.google.engine.engine import EngineContext
+
+State = qtypes.ExecutionStatus.State
+
+
+class FakeEngineClient:
+    """Serves job statuses which change after a given number of polls."""
+
+    def __init__(self):
+        self.polls = 0
+        self.calls = []
+        # Job name -> (create time, number of polls until done, final state).
+        self.jobs = {}
+
+    def add_job(self, program_id, job_id, *, create_time=1000, done_after=0, state=State.SUCCESS):
+        name = f'projects/proj/programs/{program_id}/jobs/{job_id}'
+        self.jobs[name] = (create_time, done_after, state)
+        return cg.EngineJob('proj', program_id, job_id, EngineContext(client=self))
+
+    def _job(self, name):
+        create_time, done_after, state = self.jobs[name]
+        return qtypes.QuantumJob(
+            name=name,
+            create_time=qtypes.timestamp_pb2.Timestamp(seconds=create_time),
+            execution_status=qtypes.ExecutionStatus(
+                state=state if self.polls > done_after else State.RUNNING
+            ),
+        )
+
+    def get_job(self, project_id, program_id, job_id, return_run_context):
+        self.polls += 1
+        self.calls.append(('get_job', job_id))
+        return self._job(f'projects/{project_id}/programs/{program_id}/jobs/{job_id}')
+
+    def list_jobs(
+        self,
+        project_id,
+        program_id=None,
+        created_after=None,
+        created_before=None,
+        execution_states=None,
+    ):
+        self.polls += 1
+        self.calls.append(
+            ('list_jobs', program_id, created_after, created_before, execution_states)
+        )
+        return self._list_jobs(program_id, created_after, created_before, execution_states)
+
+    def _list_jobs(self, program_id, created_after, created_before, execution_states):
+        # Pages are fetched lazily, as by the engine client.
+        self.listed = 0
+        for name in self.jobs:
+            job = self._job(name)
+            if (
+                job.execution_status.state in execution_states
+                and job.name.split('/')[3] == (program_id or job.name.split('/')[3])
+                and created_after.timestamp()
+                <= job.create_time.seconds
+                <= created_before.timestamp()
+            ):
+                self.listed += 1
+                yield job
+
+
+def test_refresh_in_bulk():
+    client = FakeEngineClient()
+    jobs = [
+        client.add_job('a', 'j0', create_time=1005),
+        client.add_job('b', 'j1', create_time=1003, done_after=1),
+        client.add_job('b', 'j2', create_time=1004),
+    ]
+    for job in jobs:
+        job._job = client._job(f'projects/proj/programs/{job.program_id}/jobs/{job.job_id}')
+    client.polls = 0
+
+    waiter = cg.EngineJobWaiter()
+    assert waiter.refresh(jobs) == [jobs[1]]
+    assert client.calls == [
+        (
+            'list_jobs',
+            None,
+            datetime.datetime(1970, 1, 1, 0, 16, 43, tzinfo=datetime.timezone.utc),
+            datetime.datetime(1970, 1, 1, 0, 16, 46, tzinfo=datetime.timezone.utc),
+            {State.SUCCESS, State.FAILURE, State.CANCELLED},
+        )
+    ]
+    assert [job._job.execution_status.state for job in jobs] == [
+        State.SUCCESS,
+        State.RUNNING,
+        State.SUCCESS,
+    ]
+
+    # A single pending job is refreshed on its own.
+    assert waiter.refresh(jobs) == []
+    assert client.calls[1:] == [('get_job', 'j1')]
+    assert waiter.refresh(jobs) == []
+    assert len(client.calls) == 2
+
+
+def test_refresh_groups_by_program():
+    client = FakeEngineClient()
+    jobs = [client.add_job('a', f'j{i}') for i in range(3)]
+    assert cg.EngineJobWaiter().refresh(jobs) == []
+    # One get_job for the creation time of each job, then a single listing.
+    assert [call[:2] for call in client.calls] == [('get_job', f'j{i}') for i in range(3)] + [
+        ('list_jobs', 'a')
+    ]
+
+
+def _refreshed_jobs(client, *jobs):
+    for job in jobs:
+        job._job = client._job(f'projects/proj/programs/{job.program_id}/jobs/{job.job_id}')
+    client.polls = 0
+    client.calls = []
+    return list(jobs)
+
+
+def test_refresh_with_many_foreign_jobs():
+    client = FakeEngineClient()
+    jobs = _refreshed_jobs(
+        client,
+        client.add_job('a', 'j0', create_time=1000),
+        client.add_job('b', 'j1', create_time=1010, done_after=5),
+    )
+    for i in range(1000):
+        _ = client.add_job('c', f'other{i}', create_time=990 + i % 30)
+
+    # Other jobs created in the same window crowd the listing, which is
+    # abandoned for get_job calls of the jobs not found.
+    waiter = cg.EngineJobWaiter(max_listed_jobs=50)
+    assert waiter.refresh(jobs) == [jobs[1]]
+    assert client.listed == 50
+    assert [call[:2] for call in client.calls] == [('list_jobs', None), ('get_job', 'j1')]
+    assert jobs[0].status() == 'SUCCESS'
+
+    # Jobs created after the newest pending one are not listed, and the
+    # listing stops once all pending jobs are found.
+    client = FakeEngineClient()
+    for i in range(1000):
+        _ = client.add_job('c', f'late{i}', create_time=1012)
+    jobs = _refreshed_jobs(
+        client,
+        client.add_job('a', 'j0', create_time=1000, done_after=0),
+        client.add_job('b', 'j1', create_time=1010, done_after=0),
+    )
+    for job in jobs:
+        job._job.execution_status.state = State.RUNNING
+    for i in range(1000):
+        _ = client.add_job('c', f'other{i}', create_time=1005)
+    assert waiter.refresh(jobs) == []
+    assert client.listed == 2
+    assert [call[:2] for call in client.calls] == [('list_jobs', None)]
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_wait_backs_off(sleep):
+    client = FakeEngineClient()
+    jobs = [client.add_job('a', 'j0', done_after=6), client.add_job('a', 'j1', done_after=9)]
+    waiter = cg.EngineJobWaiter(initial_delay=1, max_delay=3, backoff=2)
+    assert waiter.wait(jobs) == []
+    delays = [call[0][0] for call in sleep.call_args_list]
+    assert delays == [1, 2, 3, 3, 1, 2, 3]
+    assert all(job.status() == 'SUCCESS' for job in jobs)
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_wait_timeout(sleep):
+    client = FakeEngineClient()
+    job = client.add_job('a', 'j0', done_after=100)
+    waiter = cg.EngineJobWaiter(initial_delay=1, max_delay=3, backoff=2)
+    assert waiter.wait([job], timeout=7.5) == [job]
+    assert [call[0][0] for call in sleep.call_args_list] == [1, 2, 3, 1.5]
+    with pytest.raises(RuntimeError, match='Timed out'):
+        job._raise_on_failure(job._job)
+    sleep.reset_mock()
+    assert waiter.wait([job], timeout=0) == []
+    assert job.status() == 'SUCCESS'
+
+
+def test_invalid_delays():
+    with pytest.raises(ValueError, match='initial_delay'):
+        _ = cg.EngineJobWaiter(initial_delay=2, max_delay=1)
+    with pytest.raises(ValueError, match='backoff'):
+        _ = cg.EngineJobWaiter(backoff=0.5)
+    with pytest.raises(ValueError, match='max_listed_jobs'):
+        _ = cg.EngineJobWaiter(max_listed_jobs=0)
+
+
+@pytest.mark.asyncio
+async def test_wait_async():
+    client = FakeEngineClient()
+    ok = client.add_job('a', 'ok', done_after=3)
+    failed = client.add_job('a', 'failed', done_after=6, state=State.CANCELLED)
+    waiter = cg.EngineJobWaiter(initial_delay=0.001, max_delay=0.01)
+    futures = [waiter.wait_async(ok), waiter.wait_async(failed)]
+    assert waiter.wait_async(ok) is futures[0]
+    assert await futures[0] is ok
+    with pytest.raises(RuntimeError, match='CANCELLED'):
+        await futures[1]
+    await asyncio.sleep(0.01)
+    assert waiter._poll_task is None
+
+    # Later jobs start a new polling task.
+    late = client.add_job('a', 'late')
+    assert await asyncio.wait_for(waiter.wait_async(late), timeout=10) is late
+
+
+@pytest.mark.asyncio
+async def test_wait_async_errors_and_cancellation():
+    client = FakeEngineClient()
+    waiter = cg.EngineJobWaiter(initial_delay=0.001, max_delay=0.01)
+    cancelled = waiter.wait_async(client.add_job('a', 'j0', done_after=1000))
+    cancelled.cancel()
+    await asyncio.sleep(0.01)
+    assert waiter._poll_task is None
+
+    broken = cg.EngineJob('proj', 'a', 'missing', EngineContext(client=client))
+    with pytest.raises(KeyError):
+        await waiter.wait_async(broken)
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_engine_job_results_wait(sleep):
+    client = FakeEngineClient()
+    client.get_job_results = mock.Mock()
+    job = client.add_job('a', 'j0', done_after=2, state=State.FAILURE)
+    with pytest.raises(RuntimeError, match='failed'):
+        job.results()
+    assert client.calls == [('get_job', 'j0')] * 3
+    assert [call[0][0] for call in sleep.call_args_list] == [0.5, 0.5]
+    client.get_job_results.assert_not_called()
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_engine_job_results_zero_timeout_waits(sleep):
+    client = FakeEngineClient()
+    client.get_job_results = mock.Mock()
+    job = client.add_job('a', 'j0', done_after=20, state=State.FAILURE)
+    job.context.timeout = 0
+    with pytest.raises(RuntimeError, match='failed'):
+        job.results()
+    assert [call[0][0] for call in sleep.call_args_list] == [0.5] * 20
@@ -32,6 +32,7 @@ class QuantumEngineSampler(work.Sampler):
         engine: 'cirq.google.Engine',
         processor_id: Union[str, List[str]],
         gate_set: 'cirq.google.SerializableGateSet',
+        serialization_workers: Optional[int] = None,
     ):
         """
         Args:
@@ -40,10 +41,14 @@ class QuantumEngineSampler(work.Sampler):
                 determining which processors may be used when sampling.
             gate_set: Determines how to serialize circuits when requesting
                 samples.
+            serialization_workers: If greater than 1, the number of worker
+                processes used to serialize the circuits of a batch. See
+                `cirq.google.Engine.create_batch_program`.
         """
         self._processor_ids = [processor_id] if isinstance(processor_id, str) else processor_id
         self._gate_set = gate_set
         self._engine = engine
+        self._serialization_workers = serialization_workers
 
     def run_sweep(
         self,
@@ -95,10 +100,29 @@ class QuantumEngineSampler(work.Sampler):
                 repetitions=repetitions,
                 processor_ids=self._processor_ids,
                 gate_set=self._gate_set,
+                serialization_workers=self._serialization_workers,
             )
             return job.batched_results()
-        # Varying number of repetitions so no speedup
-        return super().run_batch(programs, params_list, repetitions)
+        # Varying number of repetitions so no speedup from batching, but the
+        # jobs still run concurrently and are waited for together.
+        params_list, repetitions = work.sampler._normalize_batch_args(
+            programs, params_list, repetitions
+        )
+        jobs = [
+            self._engine.run_sweep(
+                program=program,
+                params=params,
+                repetitions=reps,
+                processor_ids=self._processor_ids,
+                gate_set=self._gate_set,
+            )
+            for program, params, reps in zip(programs, params_list, repetitions)
+        ]
+        pending = engine.EngineJobWaiter().wait(jobs, timeout=self._engine.context.timeout)
+        # Fail now rather than waiting for the pending jobs all over again.
+        for job in pending:
+            job._raise_on_failure(job._inner_job())
+        return [job.results() for job in jobs]
 
     @property
     def engine(self) -> 'cirq.google.Engine':
@@ -59,6 +59,7 @@ def test_run_batch():
         processor_ids=['tmp'],
         programs=circuits,
         repetitions=5,
+        serialization_workers=None,
     )
 
 
@@ -79,6 +80,24 @@ def test_run_batch_identical_repetitions():
         processor_ids=['tmp'],
         programs=circuits,
         repetitions=5,
+        serialization_workers=None,
+    )
+
+
+def test_run_batch_serialization_workers():
+    engine = mock.Mock()
+    sampler = cg.QuantumEngineSampler(
+        engine=engine, processor_id='tmp', gate_set=cg.XMON, serialization_workers=4
+    )
+    circuits = [cirq.Circuit(cirq.X(cirq.LineQubit(0)))]
+    sampler.run_batch(circuits, None, 5)
+    engine.run_batch.assert_called_with(
+        gate_set=cg.XMON,
+        params_list=None,
+        processor_ids=['tmp'],
+        programs=circuits,
+        repetitions=5,
+        serialization_workers=4,
     )
 
 
@@ -110,11 +129,30 @@ def test_run_batch_differing_repetitions():
     circuits = [circuit1, circuit2]
     params_list = [params1, params2]
     repetitions = [1, 2]
-    sampler.run_batch(circuits, params_list, repetitions)
+    with mock.patch.object(cg.EngineJobWaiter, 'wait') as wait:
+        sampler.run_batch(circuits, params_list, repetitions)
     engine.run_sweep.assert_called_with(
         gate_set=cg.XMON, params=params2, processor_ids=['tmp'], program=circuit2, repetitions=2
     )
     engine.run_batch.assert_not_called()
+    wait.assert_called_once_with([job, job], timeout=engine.context.timeout)
+    assert job.results.call_count == 2
+
+
+def test_run_batch_differing_repetitions_timeout():
+    engine = mock.Mock()
+    done, pending = mock.Mock(), mock.Mock()
+    pending._raise_on_failure.side_effect = RuntimeError('Timed out')
+    engine.run_sweep.side_effect = [done, pending]
+    sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+    with mock.patch.object(cg.EngineJobWaiter, 'wait', return_value=[pending]):
+        with pytest.raises(RuntimeError, match='Timed out'):
+            sampler.run_batch([circuit, circuit], None, [1, 2])
+    pending._raise_on_failure.assert_called_once_with(pending._inner_job())
+    # The pending job is not waited for again.
+    pending.results.assert_not_called()
+    done.results.assert_not_called()
 
 
 def test_engine_sampler_engine_property():
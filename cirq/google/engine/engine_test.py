@@ -836,6 +836,67 @@ def test_create_program(client):
     assert result.program_id == 'prog'
 
 
+@pytest.mark.parametrize('serialization_workers', [None, 1, 2])
+@mock.patch('cirq.google.engine.engine_client.EngineClient')
+def test_create_batch_program(client, serialization_workers):
+    client().create_program.return_value = ('prog', qtypes.QuantumProgram())
+    programs = [_CIRCUIT, _CIRCUIT2, _CIRCUIT, cirq.Circuit()]
+    result = cg.Engine(project_id='proj').create_batch_program(
+        programs, 'prog', gate_set=cg.XMON, serialization_workers=serialization_workers
+    )
+    assert result.program_id == 'prog'
+
+    code = client().create_program.call_args[1]['code']
+    batch = v2.batch_pb2.BatchProgram()
+    assert code.Unpack(batch)
+    expected = v2.batch_pb2.BatchProgram()
+    for program in programs:
+        cg.XMON.serialize(program, msg=expected.programs.add())
+    assert batch == expected
+
+
+def test_serialize_batch_dedupes_equal_circuits():
+    serialize = mock.Mock(wraps=cg.XMON.serialize)
+    gate_set = mock.Mock(serialize=serialize)
+    programs = [_CIRCUIT, _CIRCUIT.copy(), _CIRCUIT2, cirq.Circuit(_CIRCUIT2.moments)]
+    code = cg.engine.engine._serialize_batch(programs, gate_set, max_workers=2)
+    # The mock gate set cannot be pickled, so the circuits are serialized here.
+    assert serialize.call_count == 2
+
+    batch = v2.batch_pb2.BatchProgram()
+    assert code.Unpack(batch)
+    assert [cg.XMON.deserialize(program) for program in batch.programs] == programs
+
+
+class UnhashableGate(cirq.SingleQubitGate):
+    def __eq__(self, other):
+        return isinstance(other, UnhashableGate)
+
+
+def test_serialize_batch_unhashable_operations():
+    program = cirq.Circuit(UnhashableGate().on(cirq.GridQubit(5, 4)))
+    assert cg.engine.engine._program_key(program) == id(program)
+    assert cg.engine.engine._program_key(_CIRCUIT) == tuple(_CIRCUIT)
+
+
+def test_gate_set_reference():
+    gate_set_reference = cg.engine.engine._gate_set_reference
+    assert gate_set_reference(cg.SYC_GATESET) == 0
+    assert gate_set_reference(cg.XMON) == 3
+    assert gate_set_reference(mock.Mock()) is None
+    custom = cg.SerializableGateSet('custom', [], [])
+    cg.engine.engine._set_worker_gate_set(gate_set_reference(custom))
+    assert cg.engine.engine._worker_gate_set.gate_set_name == 'custom'
+
+
+def test_varint():
+    assert cg.engine.engine._varint(0) == b'\x00'
+    assert cg.engine.engine._varint(127) == b'\x7f'
+    assert cg.engine.engine._varint(128) == b'\x80\x01'
+    assert cg.engine.engine._varint(300) == b'\xac\x02'
+    assert cg.engine.engine._varint(2 ** 28) == b'\x80\x80\x80\x80\x01'
+
+
 @mock.patch('cirq.google.engine.engine_client.EngineClient.list_jobs')
 def test_list_jobs(list_jobs):
     job1 = qtypes.QuantumJob(name='projects/proj/programs/prog1/jobs/job1')
@@ -15,6 +15,7 @@
 Package for optimizers and gate compilers related to Google-specific devices.
 """
 from cirq.google.optimizers.two_qubit_gates import (
+    cached_gate_product_tabulation,
     gate_product_tabulation,
     GateTabulation,
 )
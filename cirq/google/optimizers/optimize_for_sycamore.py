@@ -15,15 +15,13 @@
 from functools import lru_cache
 from typing import Callable, cast, List, Optional, TYPE_CHECKING
 
-import numpy as np
-
 from cirq import circuits, devices, optimizers, protocols
 from cirq.google import ops as cg_ops
 from cirq.google.optimizers import (
+    cached_gate_product_tabulation,
     convert_to_xmon_gates,
     ConvertToSycamoreGates,
     ConvertToSqrtIswapGates,
-    gate_product_tabulation,
     GateTabulation,
 )
 
@@ -101,12 +99,11 @@ _OPTIMIZER_TYPES = {
 
 @lru_cache()
 def _gate_product_tabulation_cached(
-    optimizer_type: str, tabulation_resolution: float
+    optimizer_type: str, tabulation_resolution: float, cache_dir: Optional[str] = None
 ) -> GateTabulation:
-    random_state = np.random.RandomState(51)
     if optimizer_type == 'sycamore':
-        return gate_product_tabulation(
-            protocols.unitary(cg_ops.SYC), tabulation_resolution, random_state=random_state
+        return cached_gate_product_tabulation(
+            protocols.unitary(cg_ops.SYC), tabulation_resolution, seed=51, cache_dir=cache_dir
         )
     else:
         raise NotImplementedError(f"Gate tabulation not supported for {optimizer_type}")
@@ -120,6 +117,7 @@ def optimized_for_sycamore(
     optimizer_type: str = 'sqrt_iswap',
     tolerance: float = 1e-5,
     tabulation_resolution: Optional[float] = None,
+    tabulation_cache_dir: Optional[str] = None,
 ) -> 'cirq.Circuit':
     """Optimizes a circuit for Google devices.
 
@@ -142,6 +140,9 @@ def optimized_for_sycamore(
             with the specified resolution and use it to approximately
             compile arbitrary two-qubit gates for which an analytic compilation
             is not known.
+        tabulation_cache_dir: If provided, the gateset tabulation is read from
+            (or, if missing, written to) this directory, so that it is only
+            computed once across processes.
     Returns:
         The optimized circuit.
     """
@@ -154,7 +155,9 @@ def optimized_for_sycamore(
 
     tabulation: Optional[GateTabulation] = None
     if tabulation_resolution is not None:
-        tabulation = _gate_product_tabulation_cached(optimizer_type, tabulation_resolution)
+        tabulation = _gate_product_tabulation_cached(
+            optimizer_type, tabulation_resolution, tabulation_cache_dir
+        )
 
     opts = _OPTIMIZER_TYPES[optimizer_type](tolerance=tolerance, tabulation=tabulation)
     for optimizer in opts:
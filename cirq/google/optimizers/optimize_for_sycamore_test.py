@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import numpy as np
 import pytest
 
@@ -67,6 +69,29 @@ def test_tabulation():
     assert len(circuit3) == 7
 
 
+def test_tabulation_cache_dir(tmpdir):
+    q0, q1 = cirq.LineQubit.range(2)
+    u = cirq.testing.random_special_unitary(4, random_state=np.random.RandomState(52))
+    circuit = cirq.Circuit(cirq.MatrixGate(u).on(q0, q1))
+    cache_dir = str(tmpdir)
+
+    circuit2 = cg.optimized_for_sycamore(
+        circuit,
+        optimizer_type='sycamore',
+        tabulation_resolution=0.1,
+        tabulation_cache_dir=cache_dir,
+    )
+    assert len(os.listdir(cache_dir)) == 1
+    circuit3 = cg.optimized_for_sycamore(
+        circuit,
+        optimizer_type='sycamore',
+        tabulation_resolution=0.1,
+        tabulation_cache_dir=cache_dir,
+    )
+    assert circuit2 == circuit3
+    cirq.testing.assert_allclose_up_to_global_phase(u, cirq.unitary(circuit3), rtol=1e-1, atol=1e-1)
+
+
 def test_no_tabulation():
     circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
     with pytest.raises(NotImplementedError):
@@ -1,4 +1,5 @@
 from cirq.google.optimizers.two_qubit_gates.gate_compilation import (
+    cached_gate_product_tabulation,
     gate_product_tabulation,
     GateTabulation,
 )
@@ -1,13 +1,17 @@
 """Attempt to tabulate single qubit gates required to generate a target 2Q gate
 with a product A k A."""
+import hashlib
+import os
+import tempfile
 from functools import reduce
-from typing import Tuple, Sequence, List, NamedTuple, TYPE_CHECKING
+from typing import Any, Callable, Tuple, Sequence, List, NamedTuple, Optional, TYPE_CHECKING
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
+import scipy.spatial
 from cirq._compat import proper_repr, proper_eq
 
-from cirq import linalg, value
+from cirq import linalg, protocols, value
 from cirq.google.optimizers.two_qubit_gates.math_utils import (
     kak_vector_infidelity,
     vector_kron,
@@ -17,10 +21,18 @@ from cirq.google.optimizers.two_qubit_gates.math_utils import (
 )
 
 if TYPE_CHECKING:
+    import multiprocessing
     import cirq
 
 _SingleQubitGatePair = Tuple[np.ndarray, np.ndarray]
 
+# Number of Euclidean nearest neighbors whose infidelity is compared when
+# looking up a KAK vector in a GateTabulation.
+_NUM_NEAREST_NEIGHBOR_CANDIDATES = 8
+
+# Number of gate products handled by a single task when tabulating with a pool.
+_TABULATION_CHUNK_SIZE = 2000
+
 
 class TwoQubitGateCompilation(NamedTuple):
     r"""Represents a compilation of a target 2-qubit with respect to a base
@@ -67,6 +79,42 @@ class GateTabulation:
     # Any KAK vectors which are expected to be compilable (within infidelity
     # max_expected_infidelity) using 2 or 3 base gates.
     missed_points: Tuple[np.ndarray, ...]
+    # Lazily built spatial index over kak_vecs, used for nearest neighbor
+    # lookups in compile_two_qubit_gate.
+    _kak_tree: Optional[scipy.spatial.cKDTree] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _nearest_kak_index(self, kak_vec: np.ndarray) -> Tuple[int, float]:
+        """Index and infidelity of a tabulated KAK vector close to kak_vec.
+
+        Candidates are the Euclidean nearest neighbors found with a KD-tree
+        over the tabulated KAK vectors, which are then ranked by the locally
+        invariant infidelity used by the tabulation. The infidelity is not
+        monotone in the Euclidean distance, so if no candidate is within
+        max_expected_infidelity, all tabulated vectors are scanned instead.
+        The result is thus a successful compilation whenever a linear scan
+        would find one, but not always the one with the least infidelity.
+        """
+        if self._kak_tree is None:
+            self._kak_tree = scipy.spatial.cKDTree(np.asarray(self.kak_vecs, dtype=float))
+        num_candidates = min(len(self.kak_vecs), _NUM_NEAREST_NEIGHBOR_CANDIDATES)
+        dists, _ = self._kak_tree.query(kak_vec, k=num_candidates)
+        # Include every point tied with the furthest candidate, in index order,
+        # so that ties are broken as by a linear scan.
+        radius = np.max(dists) * (1 + 1e-8) + 1e-12
+        candidates = np.sort(self._kak_tree.query_ball_point(kak_vec, r=radius))
+        infidelities = kak_vector_infidelity(
+            kak_vec, self.kak_vecs[candidates], ignore_equivalent_vectors=True
+        )
+        best = infidelities.argmin()
+        if infidelities[best] >= self.max_expected_infidelity:
+            infidelities = kak_vector_infidelity(
+                kak_vec, self.kak_vecs, ignore_equivalent_vectors=True
+            )
+            best = infidelities.argmin()
+            return int(best), float(infidelities[best])
+        return int(candidates[best]), float(infidelities[best])
 
     def compile_two_qubit_gate(self, unitary: np.ndarray) -> TwoQubitGateCompilation:
         r"""Compute single qubit gates required to compile a desired unitary.
@@ -87,10 +135,9 @@ class GateTabulation:
         """
         unitary = np.asarray(unitary)
         kak_vec = linalg.kak_vector(unitary, check_preconditions=False)
-        infidelities = kak_vector_infidelity(kak_vec, self.kak_vecs, ignore_equivalent_vectors=True)
-        nearest_ind = infidelities.argmin()
+        nearest_ind, infidelity = self._nearest_kak_index(kak_vec)
 
-        success = infidelities[nearest_ind] < self.max_expected_infidelity
+        success = infidelity < self.max_expected_infidelity
 
         # shape (n,2,2,2)
         inner_gates = np.array(self.single_qubit_gates[nearest_ind])
@@ -116,7 +163,7 @@ class GateTabulation:
         return {
             'cirq_type': self.__class__.__name__,
             'base_gate': self.base_gate.tolist(),
-            'kak_vecs': self.kak_vecs.tolist(),
+            'kak_vecs': self.kak_vecs,
             'single_qubit_gates': self.single_qubit_gates,
             'max_expected_infidelity': self.max_expected_infidelity,
             'summary': self.summary,
@@ -150,7 +197,12 @@ class GateTabulation:
         return (
             np.array_equal(self.base_gate, other.base_gate)
             and np.array_equal(self.kak_vecs, other.kak_vecs)
-            and proper_eq(self.single_qubit_gates, other.single_qubit_gates)
+            and len(self.single_qubit_gates) == len(other.single_qubit_gates)
+            # Cycles may be lists or tuples, e.g. after a JSON round trip.
+            and all(
+                proper_eq(tuple(a), tuple(b))
+                for a, b in zip(self.single_qubit_gates, other.single_qubit_gates)
+            )
             and self.max_expected_infidelity == other.max_expected_infidelity
             and self.summary == other.summary
             and np.array_equal(self.missed_points, other.missed_points)
@@ -177,7 +229,7 @@ class GateTabulation:
 
         return cls(
             base_gate=np.array(base_gate),
-            kak_vecs=np.array(kak_vecs),
+            kak_vecs=np.asarray(kak_vecs, dtype=float),
             single_qubit_gates=numpy_single_qubit_gates,
             max_expected_infidelity=max_expected_infidelity,
             summary=summary,
@@ -238,6 +290,30 @@ class _TabulationStepResult(NamedTuple):
     kept_cycles: List[Tuple[_SingleQubitGatePair, ...]]
 
 
+def _map(pool: Optional['multiprocessing.pool.Pool'], func: Callable, args: Sequence) -> List:
+    """Maps func over args, in parallel if a pool is given. Order is kept."""
+    if pool is None:
+        return [func(arg) for arg in args]
+    return pool.map(func, args)
+
+
+def _kak_vectors_of_products(args: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """KAK vectors of base_gate k_{n-1} base_gate ... k_0 base_gate.
+
+    Args:
+        args: A 2-tuple of the base gate (4x4 unitary) and the local cycles,
+            an array of shape (n, N, 4, 4) of 1-local unitaries.
+
+    Returns:
+        The (N, 3) KAK vectors of the N gate products.
+    """
+    base_gate, local_cycles = args
+    prods = np.einsum('ab,...bc,cd', base_gate, local_cycles[0], base_gate)
+    for local_cycle in local_cycles[1:]:
+        np.einsum('ab,...bc,...cd', base_gate, local_cycle, prods, out=prods)
+    return linalg.kak_vector(prods, check_preconditions=False)
+
+
 def _tabulate_kak_vectors(
     *,
     already_tabulated: np.ndarray,
@@ -245,6 +321,7 @@ def _tabulate_kak_vectors(
     max_dist: float,
     kak_mesh: np.ndarray,
     local_unitary_pairs: Sequence[_SingleQubitGatePair],
+    pool: Optional['multiprocessing.pool.Pool'] = None,
 ) -> _TabulationStepResult:
     """Tabulate KAK vectors from products of local unitaries with a base gate.
 
@@ -258,6 +335,7 @@ def _tabulate_kak_vectors(
             nearest neighbor distance is about 2*max_error.
         local_unitary_pairs: Sequence of 2-tuples of single qubit unitary
             tensors, each of shape (N,2,2).
+        pool: If provided, the gate products are computed in parallel.
 
     Returns:
         The newly tabulated KAK vectors and the local unitaries used to generate
@@ -272,33 +350,65 @@ def _tabulate_kak_vectors(
     # Generate products
     local_cycles = np.array([vector_kron(*pairs) for pairs in local_unitary_pairs])
 
-    prods = np.einsum('ab,...bc,cd', base_gate, local_cycles[0], base_gate)
-    for local_cycle in local_cycles[1:]:
-        np.einsum('ab,...bc,...cd', base_gate, local_cycle, prods, out=prods)
-
-    kak_vectors = linalg.kak_vector(prods, check_preconditions=False)
+    num_products = local_cycles.shape[1]
+    chunk_size = num_products if pool is None else _TABULATION_CHUNK_SIZE
+    chunks = [
+        (base_gate, local_cycles[:, start : start + chunk_size])
+        for start in range(0, num_products, chunk_size)
+    ]
+    kak_vectors = np.concatenate(_map(pool, _kak_vectors_of_products, chunks))
+
+    # The L2 distance is an upper bound to the locally invariant distance,
+    # but it's much faster to compute.
+    dists, close_inds = scipy.spatial.cKDTree(kak_mesh).query(
+        kak_vectors, distance_upper_bound=max_dist
+    )
 
     kept_kaks = []
     kept_cycles = []
 
     for ind, vec in enumerate(kak_vectors):
-        # The L2 distance is an upper bound to the locally invariant distance,
-        # but it's much faster to compute.
-        dists = np.sqrt(np.sum((kak_mesh - vec) ** 2, axis=-1))
-        close = (dists < max_dist).nonzero()[0]
-        assert close.shape[0] in (0, 1), f'close.shape: {close.shape}'
-        cycles_for_gate = tuple((k_0[ind], k_1[ind]) for k_0, k_1 in local_unitary_pairs)
-
-        # Add the vector and its cycles to the tabulation if it's not already
-        # tabulated.
-        if not np.all(already_tabulated[close]):
-            already_tabulated[close] = True
-            kept_kaks.append(vec)
-            kept_cycles.append(cycles_for_gate)
+        # Add the vector and its cycles to the tabulation if it's close to a
+        # mesh point which is not already tabulated.
+        if np.isinf(dists[ind]) or already_tabulated[close_inds[ind]]:
+            continue
+        already_tabulated[close_inds[ind]] = True
+        kept_kaks.append(vec)
+        kept_cycles.append(tuple((k_0[ind], k_1[ind]) for k_0, k_1 in local_unitary_pairs))
 
     return _TabulationStepResult(kept_kaks, kept_cycles)
 
 
+def _closest_patchup_product(args: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> Any:
+    """Finds the product base_gate^dagger k A closest to a tabulated vector.
+
+    Args:
+        args: A 4-tuple of the base gate, the local unitaries k of shape
+            (N, 4, 4), the KAK vectors tabulated with a single product, and
+            the missing KAK vector A.
+
+    Returns:
+        A 4-tuple of the Euclidean distance between the closest pair, the
+        index of the local unitary, the index of the tabulated KAK vector, and
+        the corresponding product.
+    """
+    base_gate, u_locals, kak_vecs_single, missing_vec = args
+    # Unitary A we wish to solve for
+    missing_unitary = kak_vector_to_unitary(missing_vec)
+
+    # Products of the from base_gate^\dagger k A
+    products = np.einsum('ab,...bc,cd', base_gate.conj().T, u_locals, missing_unitary)
+    # KAK vectors for these products
+    kaks = linalg.kak_vector(products, check_preconditions=False)
+    kaks = kaks[..., np.newaxis, :]
+
+    # Check if any of the product KAK vectors are close to a previously
+    # tabulated KAK vector
+    dists2 = np.sum((kaks - kak_vecs_single) ** 2, axis=-1)
+    new_ind, old_ind = np.unravel_index(dists2.argmin(), dists2.shape)
+    return np.sqrt(dists2[new_ind, old_ind]), new_ind, old_ind, products[new_ind]
+
+
 def gate_product_tabulation(
     base_gate: np.ndarray,
     max_infidelity: float,
@@ -306,6 +416,7 @@ def gate_product_tabulation(
     sample_scaling: int = 50,
     allow_missed_points: bool = True,
     random_state: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+    pool: Optional['multiprocessing.pool.Pool'] = None,
 ) -> GateTabulation:
     r"""Generate a GateTabulation for a base two qubit unitary.
 
@@ -323,6 +434,8 @@ def gate_product_tabulation(
             even if not all points in the Weyl chamber are expected to be
             compilable using 2 or 3 base gates. Otherwise an error is raised
             in this case.
+        pool: If provided, the gate products are computed in parallel. The
+            result does not depend on whether a pool is used.
 
     Returns:
         A GateTabulation object used to compile new two-qubit gates from
@@ -358,6 +471,7 @@ def gate_product_tabulation(
         max_dist=tabulation_cutoff,
         kak_mesh=mesh_points,
         local_unitary_pairs=[(u_locals_0, u_locals_1)],
+        pool=pool,
     )
     kak_vecs.extend(out.kept_kaks)
     sq_cycles.extend(out.kept_cycles)
@@ -379,6 +493,7 @@ def gate_product_tabulation(
         max_dist=tabulation_cutoff,
         kak_mesh=mesh_points,
         local_unitary_pairs=[(u_locals_0, u_locals_1)] * 2,
+        pool=pool,
     )
 
     kak_vecs.extend(out.kept_kaks)
@@ -417,35 +532,23 @@ def gate_product_tabulation(
     #    the single-qubit unitary kL is the one we need to get the desired
     #    KAK vector.
     missed_points = []
-    base_gate_dag = base_gate.conj().T
-    for ind in missing_vec_inds:
+    closest_products = _map(
+        pool,
+        _closest_patchup_product,
+        [(base_gate, u_locals, kak_vecs_single, mesh_points[ind]) for ind in missing_vec_inds],
+    )
+    for ind, (min_dist, new_ind, old_ind, new_product) in zip(missing_vec_inds, closest_products):
         missing_vec = mesh_points[ind]
-        # Unitary A we wish to solve for
-        missing_unitary = kak_vector_to_unitary(missing_vec)
-
-        # Products of the from base_gate^\dagger k A
-        products = np.einsum('ab,...bc,cd', base_gate_dag, u_locals, missing_unitary)
-        # KAK vectors for these products
-        kaks = linalg.kak_vector(products, check_preconditions=False)
-        kaks = kaks[..., np.newaxis, :]
-
-        # Check if any of the product KAK vectors are close to a previously
-        # tabulated KAK vector
-        dists2 = np.sum((kaks - kak_vecs_single) ** 2, axis=-1)
-        min_dist_inds = np.unravel_index(dists2.argmin(), dists2.shape)
-        min_dist = np.sqrt(dists2[min_dist_inds])
         if min_dist < tabulation_cutoff:
             # If so, compute the single qubit unitary k_L such that
             # base_gate^\dagger k A = kL base_gate k0 base_gate kR
             # where k0 is the old (previously tabulated) single qubit unitary
             # and k is one of the single qubit unitaries used above.
-            # Indices below are for k, k0 respectively
-            new_ind, old_ind = min_dist_inds
+            # new_ind and old_ind are indices for k, k0 respectively.
 
             # Special case where the RHS is just base_gate (no single qubit
             # gates yet applied). I.e. base_gate^\dagger k A ~  base_gate
             # which implies  base_gate^\dagger k A = k_L base_gate k_R
-            new_product = products[new_ind]
             if old_ind == 0:
                 assert not sq_cycles_single[old_ind]
                 base_product = base_gate
@@ -477,3 +580,86 @@ def gate_product_tabulation(
     return GateTabulation(
         base_gate, kak_vecs, sq_cycles, max_infidelity, summary, tuple(missed_points)
     )
+
+
+def _tabulation_cache_key(
+    base_gate: np.ndarray,
+    max_infidelity: float,
+    sample_scaling: int,
+    allow_missed_points: bool,
+    seed: int,
+) -> str:
+    """A digest identifying the output of gate_product_tabulation."""
+    hasher = hashlib.sha256()
+    hasher.update(np.ascontiguousarray(base_gate, dtype=np.complex128).tobytes())
+    hasher.update(repr((float(max_infidelity), sample_scaling, allow_missed_points, seed)).encode())
+    return hasher.hexdigest()[:32]
+
+
+def cached_gate_product_tabulation(
+    base_gate: np.ndarray,
+    max_infidelity: float,
+    *,
+    sample_scaling: int = 50,
+    allow_missed_points: bool = True,
+    seed: int,
+    cache_dir: Optional[str] = None,
+    pool: Optional['multiprocessing.pool.Pool'] = None,
+) -> GateTabulation:
+    """A GateTabulation for a base two qubit unitary, cached on disk.
+
+    The tabulation is keyed by the base gate, max_infidelity, sample_scaling,
+    allow_missed_points and seed. If a tabulation for this key exists in
+    cache_dir it is loaded, otherwise it is computed with
+    gate_product_tabulation and stored there as JSON. Files are written
+    atomically, so several processes may share the same cache directory.
+
+    Args:
+        base_gate: The base gate of the tabulation.
+        max_infidelity: See gate_product_tabulation.
+        sample_scaling: See gate_product_tabulation.
+        allow_missed_points: See gate_product_tabulation.
+        seed: Seed of the random state used to compute the tabulation.
+        cache_dir: Directory holding cached tabulations. It is created if it
+            does not exist. If None, the tabulation is always computed.
+        pool: If provided, the tabulation is computed in parallel.
+
+    Returns:
+        A GateTabulation object, equal to the one returned by
+        gate_product_tabulation for the same arguments.
+    """
+    if cache_dir is None:
+        return gate_product_tabulation(
+            base_gate,
+            max_infidelity,
+            sample_scaling=sample_scaling,
+            allow_missed_points=allow_missed_points,
+            random_state=seed,
+            pool=pool,
+        )
+
+    key = _tabulation_cache_key(
+        base_gate, max_infidelity, sample_scaling, allow_missed_points, seed
+    )
+    path = os.path.join(cache_dir, f'gate_tabulation_{key}.json')
+    if os.path.exists(path):
+        return protocols.read_json(path)
+
+    tabulation = gate_product_tabulation(
+        base_gate,
+        max_infidelity,
+        sample_scaling=sample_scaling,
+        allow_missed_points=allow_missed_points,
+        random_state=seed,
+        pool=pool,
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            protocols.to_json(tabulation, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tabulation
@@ -1,13 +1,21 @@
 """Tests for gate_compilation.py"""
+import dataclasses
+import multiprocessing
+import os
+
 import numpy as np
 import pytest
 
-from cirq import unitary, FSimGate, value
+from cirq import linalg, unitary, FSimGate, value
 from cirq.google.optimizers.two_qubit_gates.gate_compilation import (
+    cached_gate_product_tabulation,
     gate_product_tabulation,
     GateTabulation,
 )
-from cirq.google.optimizers.two_qubit_gates.math_utils import unitary_entanglement_fidelity
+from cirq.google.optimizers.two_qubit_gates.math_utils import (
+    kak_vector_infidelity,
+    unitary_entanglement_fidelity,
+)
 from cirq.testing import random_special_unitary, assert_equivalent_repr
 
 _rng = value.parse_random_state(11)  # for determinism
@@ -88,3 +96,65 @@ def test_sycamore_gate_tabulation_eq():
     assert sycamore_tabulation == sycamore_tabulation
     assert sycamore_tabulation != sqrt_iswap_tabulation
     assert sycamore_tabulation != 1
+
+
+@pytest.mark.parametrize('tabulation', [sycamore_tabulation, sqrt_iswap_tabulation])
+def test_gate_compilation_nearest_neighbor_matches_linear_scan(tabulation):
+    rng = value.parse_random_state(3)
+    targets = [
+        linalg.kak_vector(random_special_unitary(4, random_state=rng), check_preconditions=False)
+        for _ in range(200)
+    ]
+    targets.extend(rng.uniform(-np.pi / 4, np.pi / 4, size=(300, 3)))
+    exact = dataclasses.replace(tabulation, max_expected_infidelity=0)
+    for kak_vec in targets:
+        infidelities = kak_vector_infidelity(
+            kak_vec, tabulation.kak_vecs, ignore_equivalent_vectors=True
+        )
+        ind, infidelity = tabulation._nearest_kak_index(kak_vec)
+        assert np.isclose(infidelity, infidelities[ind])
+        # Compilation succeeds exactly when it does with a linear scan.
+        max_infidelity = tabulation.max_expected_infidelity
+        assert (infidelity < max_infidelity) == (infidelities.min() < max_infidelity)
+        if infidelities.min() >= max_infidelity:
+            assert ind == infidelities.argmin()
+        # Without a threshold to meet, the lookup is a linear scan.
+        assert exact._nearest_kak_index(kak_vec) == (infidelities.argmin(), infidelities.min())
+
+
+def test_gate_product_tabulation_with_pool():
+    base_gate = unitary(FSimGate(np.pi / 2, np.pi / 6))
+    expected = gate_product_tabulation(base_gate, 0.2, sample_scaling=5, random_state=3)
+    with multiprocessing.Pool(2) as pool:
+        actual = gate_product_tabulation(
+            base_gate, 0.2, sample_scaling=5, random_state=3, pool=pool
+        )
+    assert actual == expected
+
+
+def test_cached_gate_product_tabulation(tmpdir):
+    base_gate = unitary(FSimGate(np.pi / 2, np.pi / 6))
+    cache_dir = os.path.join(tmpdir, 'tabulations')
+    expected = gate_product_tabulation(base_gate, 0.2, sample_scaling=5, random_state=3)
+
+    assert cached_gate_product_tabulation(base_gate, 0.2, sample_scaling=5, seed=3) == expected
+    assert not os.path.exists(cache_dir)
+
+    first = cached_gate_product_tabulation(
+        base_gate, 0.2, sample_scaling=5, seed=3, cache_dir=cache_dir
+    )
+    assert first == expected
+    assert len(os.listdir(cache_dir)) == 1
+
+    second = cached_gate_product_tabulation(
+        base_gate, 0.2, sample_scaling=5, seed=3, cache_dir=cache_dir
+    )
+    assert second == expected
+    assert second.compile_two_qubit_gate(base_gate).success
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A different key is stored separately.
+    _ = cached_gate_product_tabulation(
+        base_gate, 0.2, sample_scaling=5, seed=4, cache_dir=cache_dir
+    )
+    assert len(os.listdir(cache_dir)) == 2
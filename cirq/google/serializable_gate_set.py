@@ -61,6 +61,8 @@ class SerializableGateSet:
         for s in serializers:
             self.serializers.setdefault(s.gate_type, []).append(s)
         self.deserializers = {d.serialized_gate_id: d for d in deserializers}
+        # Serializers applicable to each gate type, in the order they are tried.
+        self._serializers_by_type: Dict[Type, List[op_serializer.GateOpSerializer]] = {}
 
     def with_added_gates(
         self,
@@ -97,11 +99,22 @@ class SerializableGateSet:
     def is_supported_operation(self, op: 'cirq.Operation') -> bool:
         """Whether or not the given gate can be serialized by this gate set."""
         return any(
-            serializer.can_serialize_operation(op)
-            for gate_type in type(op.gate).mro()
-            for serializer in self.serializers.get(gate_type, [])
+            serializer.can_serialize_predicate(op)
+            for serializer in self._serializers_for_type(type(op.gate))
         )
 
+    def _serializers_for_type(self, gate_type: Type) -> List[op_serializer.GateOpSerializer]:
+        """Returns the serializers for a gate type and its super classes.
+
+        The serializers are in the order they should be tried: by method
+        resolution order of the type, and then in the order they were given.
+        """
+        serializers = self._serializers_by_type.get(gate_type)
+        if serializers is None:
+            serializers = [s for t in gate_type.mro() for s in self.serializers.get(t, [])]
+            self._serializers_by_type[gate_type] = serializers
+        return serializers
+
     def serialize(
         self,
         program: 'cirq.Circuit',
@@ -156,17 +169,14 @@ class SerializableGateSet:
             A dictionary corresponds to the cirq.google.api.v2.Operation proto.
         """
         gate_type = type(op.gate)
-        for gate_type_mro in gate_type.mro():
-            # Check all super classes in method resolution order.
-            if gate_type_mro in self.serializers:
-                # Check each serializer in turn, if serializer proto returns
-                # None, then skip.
-                for serializer in self.serializers[gate_type_mro]:
-                    proto_msg = serializer.to_proto(
-                        op, msg, arg_function_language=arg_function_language, constants=constants
-                    )
-                    if proto_msg is not None:
-                        return proto_msg
+        # Check each serializer in turn, if serializer proto returns None, then
+        # skip.
+        for serializer in self._serializers_for_type(gate_type):
+            proto_msg = serializer.to_proto(
+                op, msg, arg_function_language=arg_function_language, constants=constants
+            )
+            if proto_msg is not None:
+                return proto_msg
         raise ValueError('Cannot serialize op {!r} of type {}'.format(op, gate_type))
 
     def deserialize(
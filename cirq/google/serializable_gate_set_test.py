@@ -357,6 +357,38 @@ def test_multiple_serializers():
     assert gate_set.serialize_op(cirq.X(q0) ** 0.5).gate.id == 'x_pow'
 
 
+def test_serializers_checked_in_method_resolution_order():
+    eigen_serializer = cg.GateOpSerializer(
+        gate_type=cirq.EigenGate,
+        serialized_gate_id='eigen',
+        args=[
+            cg.SerializingArg(
+                serialized_name='half_turns', serialized_type=float, op_getter='exponent'
+            )
+        ],
+    )
+    x_serializer = cg.GateOpSerializer(
+        gate_type=cirq.XPowGate,
+        serialized_gate_id='x',
+        args=[],
+        can_serialize_predicate=lambda x: x.gate.exponent == 1,
+    )
+    gate_set = cg.SerializableGateSet(
+        gate_set_name='my_gate_set',
+        serializers=[eigen_serializer, x_serializer],
+        deserializers=[],
+    )
+    q0 = cirq.GridQubit(1, 1)
+    for _ in range(2):
+        assert gate_set.serialize_op(cirq.X(q0)).gate.id == 'x'
+        assert gate_set.serialize_op(cirq.X(q0) ** 0.5).gate.id == 'eigen'
+        assert gate_set.serialize_op(cirq.Z(q0)).gate.id == 'eigen'
+        assert gate_set.is_supported_operation(cirq.X(q0) ** 0.5)
+    with pytest.raises(ValueError, match='Cannot serialize'):
+        gate_set.serialize_op(cirq.measure(q0))
+    assert not gate_set.is_supported_operation(cirq.measure(q0))
+
+
 def test_gateset_with_added_gates():
     q = cirq.GridQubit(1, 1)
     x_gateset = cg.SerializableGateSet(
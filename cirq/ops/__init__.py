@@ -116,6 +116,10 @@ from cirq.ops.linear_combinations import (
     PauliSumLike,
 )
 
+from cirq.ops.packed_pauli_sum import (
+    PackedPauliSum,
+)
+
 from cirq.ops.parallel_gate_operation import (
     ParallelGateOperation,
 )
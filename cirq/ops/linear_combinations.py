@@ -14,6 +14,8 @@
 from collections import defaultdict
 from typing import (
     AbstractSet,
+    Callable,
+    Dict,
     Mapping,
     Optional,
     Tuple,
@@ -21,11 +23,14 @@ from typing import (
     List,
     FrozenSet,
     DefaultDict,
+    Iterable,
     TYPE_CHECKING,
 )
 import numbers
 
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 
 from cirq import linalg, protocols, qis, value
 from cirq._doc import document
@@ -306,6 +311,46 @@ class LinearCombinationOfOperations(value.LinearDict[raw_types.Operation]):
             return m
         raise ValueError(f'{self} is not unitary')
 
+    def _pauli_sum(self) -> 'PauliSum':
+        """Expands self into a sum of Pauli strings.
+
+        Raises:
+            TypeError: if any of the operations in self has no Pauli expansion.
+        """
+        paulis = {'X': pauli_gates.X, 'Y': pauli_gates.Y, 'Z': pauli_gates.Z}
+        terms: DefaultDict[UnitPauliStringT, value.Scalar] = defaultdict(lambda: 0)
+        for op, coefficient in self.items():
+            for names, c in protocols.pauli_expansion(op).items():
+                unit = frozenset((q, paulis[n]) for q, n in zip(op.qubits, names) if n != 'I')
+                terms[unit] += c * coefficient
+        return PauliSum(value.LinearDict(terms))
+
+    def sparse_matrix(self) -> scipy.sparse.csr_matrix:
+        """Reconstructs matrix of self as a sparse matrix.
+
+        The operations are expanded in the Pauli basis and the matrix is built
+        with `cirq.PauliSum.sparse_matrix`, without forming dense matrices
+        larger than those of the individual operations.
+
+        Raises:
+            TypeError: if any of the operations in self has no Pauli expansion.
+        """
+        if self._is_parameterized_():
+            return NotImplemented
+        return self._pauli_sum().sparse_matrix(self.qubits)
+
+    def linear_operator(self) -> scipy.sparse.linalg.LinearOperator:
+        """Returns self as a matrix-free linear operator.
+
+        See `cirq.PauliSum.linear_operator`.
+
+        Raises:
+            TypeError: if any of the operations in self has no Pauli expansion.
+        """
+        if self._is_parameterized_():
+            return NotImplemented
+        return self._pauli_sum().linear_operator(self.qubits)
+
     def _pauli_expansion_(self) -> value.LinearDict[str]:
         """Computes Pauli expansion of self from Pauli expansions of terms."""
 
@@ -354,6 +399,122 @@ def _pauli_string_from_unit(unit: UnitPauliStringT, coefficient: Union[int, floa
     return PauliString(qubit_pauli_map=dict(unit), coefficient=coefficient)
 
 
+# Powers of i, indexed by the number of Y factors modulo 4.
+_Y_PHASES = (1, 1j, -1, -1j)
+
+
+def _grouped_pauli_masks(
+    linear_dict: value.LinearDict[UnitPauliStringT],
+    qubit_map: Mapping[raw_types.Qid, int],
+    num_qubits: int,
+) -> Dict[int, List[Tuple[int, complex]]]:
+    """Encodes the terms of a PauliSum as bit masks grouped by X mask.
+
+    Writing each Pauli Y as iXZ, every term is a phase times a product of X
+    factors on the qubits in its X mask and Z factors on the qubits in its Z
+    mask. Bits are big-endian, matching the indices of a flattened state.
+
+    Returns:
+        A dictionary from X masks to the Z mask and phase (the coefficient
+        times i to the number of Y factors) of each term with that X mask.
+    """
+    groups: Dict[int, List[Tuple[int, complex]]] = {}
+    for unit, coefficient in linear_dict.items():
+        x_mask = z_mask = num_y = 0
+        for qubit, pauli in unit:
+            bit = 1 << (num_qubits - 1 - qubit_map[qubit])
+            if pauli != pauli_gates.Z:
+                x_mask |= bit
+            if pauli != pauli_gates.X:
+                z_mask |= bit
+            if pauli == pauli_gates.Y:
+                num_y += 1
+        groups.setdefault(x_mask, []).append((z_mask, coefficient * _Y_PHASES[num_y % 4]))
+    return groups
+
+
+def _z_parity_sum(values: np.ndarray, z_mask: int) -> complex:
+    """Sums `values[j] * (-1)**popcount(j & z_mask)` over all indices j."""
+    while z_mask:
+        pairs = values.reshape(-1, 2)
+        values = pairs[:, 0] - pairs[:, 1] if z_mask & 1 else pairs[:, 0] + pairs[:, 1]
+        # The halved array is indexed by j >> 1, so the mask stays aligned.
+        z_mask >>= 1
+    return np.sum(values)
+
+
+def _walsh_hadamard(values: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Returns `_z_parity_sum(values, z)` for every Z mask z at once."""
+    result = values
+    for k in range(num_qubits):
+        blocks = result.reshape(-1, 2, 1 << k)
+        result = np.stack([blocks[:, 0] + blocks[:, 1], blocks[:, 0] - blocks[:, 1]], axis=1)
+    return result.reshape(-1)
+
+
+def _pauli_sum_expectation(
+    linear_dict: value.LinearDict[UnitPauliStringT],
+    qubit_map: Mapping[raw_types.Qid, int],
+    num_qubits: int,
+    diagonal: Callable[[int], np.ndarray],
+):
+    """Evaluates a PauliSum expectation from the X-shifted diagonals of a state.
+
+    A term with X mask x, Z mask z and phase c maps basis state |j> to
+    `c * (-1)**popcount(j & z) |j ^ x>`. Its expectation is therefore the
+    parity-signed sum of `diagonal(x)[j]`, which is `conj(psi[j ^ x]) * psi[j]`
+    for a state vector and `rho[j, j ^ x]` for a density matrix. The diagonal
+    is gathered once per distinct X mask and shared by all terms with that mask.
+    """
+    total = 0
+    for x_mask, terms in _grouped_pauli_masks(linear_dict, qubit_map, num_qubits).items():
+        values = diagonal(x_mask)
+        # A parity sum costs about two passes over the diagonal and a
+        # Walsh-Hadamard transform one pass per qubit, so large groups of terms
+        # are evaluated together with the latter.
+        if len(terms) > num_qubits:
+            spectrum = _walsh_hadamard(values, num_qubits)
+            total += sum(phase * spectrum[z_mask] for z_mask, phase in terms)
+        else:
+            total += sum(phase * _z_parity_sum(values, z_mask) for z_mask, phase in terms)
+    return total
+
+
+def _z_signs(z_mask: int, num_qubits: int) -> np.ndarray:
+    """Returns `(-1)**popcount(j & z_mask)` for every index j."""
+    signs = np.ones(1 << num_qubits)
+    k = 0
+    while z_mask:
+        if z_mask & 1:
+            signs.reshape(-1, 2, 1 << k)[:, 1, :] *= -1
+        z_mask >>= 1
+        k += 1
+    return signs
+
+
+def _flip_axes(tensor: np.ndarray, axes: Tuple[int, ...]) -> np.ndarray:
+    """Reverses the given axes of a tensor and flattens it."""
+    return (np.flip(tensor, axes) if axes else tensor).reshape(-1)
+
+
+def _x_group_diagonal(terms: List[Tuple[int, complex]], num_qubits: int) -> np.ndarray:
+    """Returns the phase each basis state picks up from a group of terms.
+
+    All terms of the group share an X mask x, so together they map basis
+    state |j> to `d[j] |j ^ x>` where `d[j]` is the parity-signed sum of the
+    phases of the terms.
+    """
+    if len(terms) > num_qubits:
+        phases = np.zeros(1 << num_qubits, dtype=np.complex128)
+        for z_mask, phase in terms:
+            phases[z_mask] += phase
+        return _walsh_hadamard(phases, num_qubits)
+    diagonal = np.zeros(1 << num_qubits, dtype=np.complex128)
+    for z_mask, phase in terms:
+        diagonal += phase * _z_signs(z_mask, num_qubits)
+    return diagonal
+
+
 @value.value_equality(approximate=True)
 class PauliSum:
     """Represents operator defined by linear combination of PauliStrings.
@@ -421,6 +582,110 @@ class PauliSum:
             result += coeff * op.matrix(self.qubits)
         return result
 
+    def _x_groups(
+        self, qubits: Optional[Iterable[raw_types.Qid]]
+    ) -> Tuple[int, Dict[int, List[Tuple[int, complex]]]]:
+        qubits = self.qubits if qubits is None else tuple(qubits)
+        missing = set(self.qubits) - set(qubits)
+        if missing:
+            raise ValueError(f'Qubits {sorted(missing)} of {self} are not among {qubits!r}.')
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        return len(qubits), _grouped_pauli_masks(self._linear_dict, qubit_map, len(qubits))
+
+    def sparse_matrix(
+        self, qubits: Optional[Iterable[raw_types.Qid]] = None
+    ) -> scipy.sparse.csr_matrix:
+        """Returns the matrix of self as a sparse matrix.
+
+        Every Pauli string maps each basis state to a single basis state, so
+        the matrix has at most one nonzero entry per row for each distinct
+        pattern of X and Y factors among the terms. Unlike `matrix`, the
+        entries are computed directly from bit masks of the terms without
+        forming any dense matrices.
+
+        Args:
+            qubits: The qubits the matrix acts on, in big-endian order.
+                Defaults to `self.qubits`.
+
+        Returns:
+            A `scipy.sparse.csr_matrix` equal to `self.matrix()` when `qubits`
+            is `self.qubits`.
+
+        Raises:
+            ValueError: `qubits` does not include all of the qubits of self.
+        """
+        num_qubits, groups = self._x_groups(qubits)
+        dim = 1 << num_qubits
+        indices = np.arange(dim)
+        rows, columns, data = [], [], []
+        for x_mask, terms in groups.items():
+            diagonal = _x_group_diagonal(terms, num_qubits)
+            nonzero = np.flatnonzero(diagonal)
+            rows.append(nonzero ^ x_mask)
+            columns.append(nonzero)
+            data.append(diagonal[nonzero])
+        if not data:
+            return scipy.sparse.csr_matrix((dim, dim), dtype=np.complex128)
+        return scipy.sparse.csr_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(columns))),
+            shape=(dim, dim),
+        )
+
+    def linear_operator(
+        self, qubits: Optional[Iterable[raw_types.Qid]] = None
+    ) -> scipy.sparse.linalg.LinearOperator:
+        """Returns self as a matrix-free linear operator.
+
+        The operator applies the terms of self to a vector without storing
+        any matrix. Terms with the same pattern of X and Y factors are applied
+        together as a diagonal followed by a permutation of the vector. The
+        diagonals are computed once when the operator is built, so memory use
+        is one vector per distinct pattern and each product costs a few vector
+        operations per pattern, regardless of the number of terms. This allows computing e.g. ground states of sums on more qubits than
+        `sparse_matrix` can handle, using `scipy.sparse.linalg.eigsh`.
+
+        Args:
+            qubits: The qubits the operator acts on, in big-endian order.
+                Defaults to `self.qubits`.
+
+        Returns:
+            A `scipy.sparse.linalg.LinearOperator` whose matrix is
+            `self.matrix()` when `qubits` is `self.qubits`.
+
+        Raises:
+            ValueError: `qubits` does not include all of the qubits of self.
+        """
+        num_qubits, groups = self._x_groups(qubits)
+        shape = (2,) * num_qubits
+        # Flipping bit x of every index reverses the corresponding tensor axis.
+        flips = [
+            (
+                tuple(i for i in range(num_qubits) if x_mask >> (num_qubits - 1 - i) & 1),
+                _x_group_diagonal(terms, num_qubits),
+            )
+            for x_mask, terms in groups.items()
+        ]
+
+        def apply(vector: np.ndarray, adjoint: bool) -> np.ndarray:
+            vector = np.reshape(vector, -1)
+            result = np.zeros(vector.shape, dtype=np.complex128)
+            for axes, diagonal in flips:
+                # The group maps |j> to diagonal[j] |j ^ x>, so its adjoint maps
+                # |j ^ x> to conj(diagonal[j]) |j>.
+                if adjoint:
+                    result += np.conj(diagonal) * _flip_axes(vector.reshape(shape), axes)
+                else:
+                    result += _flip_axes((diagonal * vector).reshape(shape), axes)
+            return result
+
+        dim = 1 << num_qubits
+        return scipy.sparse.linalg.LinearOperator(
+            shape=(dim, dim),
+            matvec=lambda vector: apply(vector, adjoint=False),
+            rmatvec=lambda vector: apply(vector, adjoint=True),
+            dtype=np.complex128,
+        )
+
     def _has_unitary_(self) -> bool:
         return linalg.is_unitary(self.matrix())
 
@@ -508,9 +773,15 @@ class PauliSum:
                 dtype=state_vector.dtype,
                 atol=atol,
             )
-        return sum(
-            p._expectation_from_state_vector_no_validation(state_vector, qubit_map) for p in self
-        )
+        flat = state_vector.reshape(-1)
+        indices = np.arange(flat.size)
+
+        def diagonal(x_mask: int) -> np.ndarray:
+            if not x_mask:
+                return np.abs(flat) ** 2
+            return flat[indices ^ x_mask].conj() * flat
+
+        return _pauli_sum_expectation(self._linear_dict, qubit_map, num_qubits, diagonal)
 
     def expectation_from_density_matrix(
         self,
@@ -565,7 +836,13 @@ class PauliSum:
                 dtype=state.dtype,
                 atol=atol,
             )
-        return sum(p._expectation_from_density_matrix_no_validation(state, qubit_map) for p in self)
+        matrix = state.reshape(dim, dim)
+        indices = np.arange(dim)
+
+        def diagonal(x_mask: int) -> np.ndarray:
+            return matrix[indices, indices ^ x_mask]
+
+        return _pauli_sum_expectation(self._linear_dict, qubit_map, num_qubits, diagonal)
 
     def __iter__(self):
         for vec, coeff in self._linear_dict.items():
@@ -631,10 +908,10 @@ class PauliSum:
             temp = PauliSum.from_pauli_strings([term * other for term in self])
             self._linear_dict = temp._linear_dict
         elif isinstance(other, PauliSum):
-            temp = PauliSum.from_pauli_strings(
-                [term * other_term for term in self for other_term in other]
-            )
-            self._linear_dict = temp._linear_dict
+            from cirq.ops.packed_pauli_sum import PackedPauliSum
+
+            product = PackedPauliSum.from_pauli_sum(self) * PackedPauliSum.from_pauli_sum(other)
+            self._linear_dict = product._to_linear_dict()
 
         return self
 
@@ -17,6 +17,8 @@ from typing import Union
 
 import numpy as np
 import pytest
+import scipy.sparse
+import scipy.sparse.linalg
 import sympy
 
 import cirq
@@ -677,6 +679,23 @@ def test_linear_combination_of_operations_has_correct_qubits(terms, expected_qub
 def test_linear_combination_of_operations_has_correct_matrix(terms, expected_matrix):
     combination = cirq.LinearCombinationOfOperations(terms)
     assert np.allclose(combination.matrix(), expected_matrix)
+    assert np.allclose(combination.sparse_matrix().toarray(), expected_matrix)
+    operator = combination.linear_operator()
+    assert np.allclose(operator @ np.eye(len(expected_matrix)), expected_matrix)
+
+
+def test_parameterized_linear_combination_of_ops_has_no_sparse_matrix():
+    combination = cirq.LinearCombinationOfOperations(
+        {cirq.XPowGate(exponent=sympy.Symbol('t'))(q0): 1}
+    )
+    assert combination.sparse_matrix() is NotImplemented
+    assert combination.linear_operator() is NotImplemented
+
+
+def test_linear_combination_of_operations_without_pauli_expansion_has_no_sparse_matrix():
+    combination = cirq.LinearCombinationOfOperations({cirq.measure(q0): 1})
+    with pytest.raises(TypeError):
+        _ = combination.sparse_matrix()
 
 
 @pytest.mark.parametrize(
@@ -1029,6 +1048,93 @@ def test_non_pauli_sum_has_no_unitary(psum):
         _ = cirq.unitary(psum)
 
 
+def _random_complex_pauli_sum(qubits, num_terms, prng):
+    paulis = [cirq.I, cirq.X, cirq.Y, cirq.Z]
+    return cirq.PauliSum.from_pauli_strings(
+        [
+            cirq.PauliString(
+                {q: paulis[prng.randint(4)] for q in qubits},
+                coefficient=prng.randn() + 1j * prng.randn(),
+            )
+            for _ in range(num_terms)
+        ]
+    )
+
+
+# More than one term per qubit for some X mask exercises the Walsh-Hadamard path.
+@pytest.mark.parametrize('num_terms', [1, 5, 100])
+def test_pauli_sum_sparse_matrix(num_terms):
+    prng = np.random.RandomState(num_terms)
+    qubits = cirq.LineQubit.range(4)
+    psum = _random_complex_pauli_sum(qubits, num_terms, prng) - 2
+    matrix = psum.sparse_matrix()
+    assert isinstance(matrix, scipy.sparse.csr_matrix)
+    np.testing.assert_allclose(matrix.toarray(), psum.matrix(), atol=1e-8)
+
+    reordered = qubits[::-1] + [cirq.LineQubit(9)]
+    expected = sum(p.matrix(reordered) for p in psum)
+    np.testing.assert_allclose(psum.sparse_matrix(reordered).toarray(), expected, atol=1e-8)
+
+
+def test_pauli_sum_sparse_matrix_edge_cases():
+    assert cirq.PauliSum().sparse_matrix().shape == (1, 1)
+    assert cirq.PauliSum().sparse_matrix().nnz == 0
+    np.testing.assert_allclose(cirq.PauliSum.wrap(3).sparse_matrix().toarray(), [[3]])
+    np.testing.assert_allclose(
+        cirq.PauliSum.wrap(cirq.X(q0)).sparse_matrix([q1, q0]).toarray(),
+        np.kron(np.eye(2), cirq.unitary(cirq.X)),
+    )
+    with pytest.raises(ValueError, match='not among'):
+        _ = cirq.PauliSum.wrap(cirq.X(q0)).sparse_matrix([q1])
+    with pytest.raises(ValueError, match='not among'):
+        _ = cirq.PauliSum.wrap(cirq.X(q0)).linear_operator([q1])
+
+
+@pytest.mark.parametrize('num_terms', [1, 5, 100])
+def test_pauli_sum_linear_operator(num_terms):
+    prng = np.random.RandomState(num_terms)
+    qubits = cirq.LineQubit.range(4)
+    psum = _random_complex_pauli_sum(qubits, num_terms, prng) + 1
+    operator = psum.linear_operator(qubits)
+    matrix = sum(p.matrix(qubits) for p in psum)
+    vector = prng.randn(16) + 1j * prng.randn(16)
+    np.testing.assert_allclose(operator.matvec(vector), matrix @ vector, atol=1e-8)
+    np.testing.assert_allclose(operator.rmatvec(vector), matrix.conj().T @ vector, atol=1e-8)
+    np.testing.assert_allclose(operator @ np.eye(16), matrix, atol=1e-8)
+
+
+def test_pauli_sum_linear_operator_computes_diagonals_once(monkeypatch):
+    x_group_diagonal = cirq.ops.linear_combinations._x_group_diagonal
+    calls = []
+
+    def counting_x_group_diagonal(terms, num_qubits):
+        calls.append(terms)
+        return x_group_diagonal(terms, num_qubits)
+
+    monkeypatch.setattr(
+        cirq.ops.linear_combinations, '_x_group_diagonal', counting_x_group_diagonal
+    )
+    q0, q1 = cirq.LineQubit.range(2)
+    operator = (cirq.X(q0) * cirq.Z(q1) + cirq.Y(q0) + cirq.Z(q0) + 1).linear_operator()
+    assert len(calls) == 2
+    vector = np.arange(4, dtype=np.complex128)
+    for _ in range(3):
+        _ = operator.matvec(vector)
+        _ = operator.rmatvec(vector)
+    assert len(calls) == 2
+
+
+def test_pauli_sum_linear_operator_ground_state_energy():
+    qubits = cirq.LineQubit.range(6)
+    hamiltonian = sum(
+        cirq.Z(a) * cirq.Z(b) + 0.5 * cirq.X(a) for a, b in zip(qubits, qubits[1:] + qubits[:1])
+    )
+    expected = np.linalg.eigvalsh(hamiltonian.matrix())[0]
+    for operator in [hamiltonian.sparse_matrix(), hamiltonian.linear_operator()]:
+        energy = scipy.sparse.linalg.eigsh(operator, k=1, which='SA')[0][0]
+        np.testing.assert_allclose(energy, expected)
+
+
 @pytest.mark.parametrize(
     'psum, expected_qubits',
     (
@@ -1576,6 +1682,62 @@ def test_expectation_from_density_matrix_two_qubit_states():
         )
 
 
+def _random_pauli_sum(qubits, num_terms, prng):
+    paulis = [cirq.I, cirq.X, cirq.Y, cirq.Z]
+    return cirq.PauliSum.from_pauli_strings(
+        [
+            cirq.PauliString({q: paulis[prng.randint(4)] for q in qubits}, coefficient=prng.randn())
+            for _ in range(num_terms)
+        ]
+    )
+
+
+# More than one term per qubit for some X mask exercises the Walsh-Hadamard path.
+@pytest.mark.parametrize('num_terms', [0, 1, 5, 200])
+def test_expectation_matches_term_by_term(num_terms):
+    prng = np.random.RandomState(num_terms)
+    qubits = cirq.LineQubit.range(5)
+    q_map = {q: i for i, q in enumerate([qubits[2], qubits[0], qubits[4], qubits[1], qubits[3]])}
+    psum = _random_pauli_sum(qubits, num_terms, prng) + 0.5 * cirq.Y(qubits[1])
+
+    state_vector = cirq.testing.random_superposition(32, random_state=prng)
+    expected = sum(
+        p._expectation_from_state_vector_no_validation(state_vector, q_map) for p in psum
+    )
+    for state in [state_vector, state_vector.reshape((2,) * 5)]:
+        np.testing.assert_allclose(
+            psum.expectation_from_state_vector(state, qubit_map=q_map), expected, atol=1e-7
+        )
+
+    rho = cirq.testing.random_density_matrix(32, random_state=prng)
+    expected = sum(p._expectation_from_density_matrix_no_validation(rho, q_map) for p in psum)
+    for state in [rho, rho.reshape((2,) * 10)]:
+        np.testing.assert_allclose(
+            psum.expectation_from_density_matrix(state, qubit_map=q_map), expected, atol=1e-7
+        )
+
+
+def test_expectation_on_larger_state():
+    q0, q1 = cirq.LineQubit.range(2)
+    psum = cirq.X(q0) * cirq.Y(q1) - 2 * cirq.Z(q0) + 3
+    # The sum acts on qubits 1 and 3 of a four qubit state |0+0(i)>.
+    q_map = {q0: 1, q1: 3}
+    single = [
+        np.array([1, 0]),
+        np.array([1, 1]) / np.sqrt(2),
+        np.array([1, 0]),
+        np.array([1, 1j]) / np.sqrt(2),
+    ]
+    state_vector = cirq.linalg.kron(*single).reshape(-1).astype(np.complex64)
+    np.testing.assert_allclose(
+        psum.expectation_from_state_vector(state_vector, qubit_map=q_map), 4, atol=1e-6
+    )
+    rho = np.outer(state_vector, state_vector.conj())
+    np.testing.assert_allclose(
+        psum.expectation_from_density_matrix(rho, qubit_map=q_map), 4, atol=1e-6
+    )
+
+
 def test_deprecated():
     q = cirq.LineQubit(0)
     pauli_sum = cirq.X(q) + 0.2 * cirq.Z(q)
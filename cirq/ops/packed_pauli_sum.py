@@ -0,0 +1,388 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A sum of Pauli strings stored as arrays of symplectic bits."""
+
+import numbers
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from cirq import value
+from cirq.ops import dense_pauli_string, pauli_gates
+from cirq.ops.linear_combinations import PauliSum, UnitPauliStringT
+from cirq.ops.pauli_string import PauliString, SingleQubitPauliStringGateOperation
+
+if TYPE_CHECKING:
+    import cirq
+
+# Paulis indexed by `x_bit + 2 * z_bit`.
+_PAULIS_BY_CODE = (None, pauli_gates.X, pauli_gates.Z, pauli_gates.Y)
+
+
+@value.value_equality(approximate=True)
+class PackedPauliSum:
+    """A sum of Pauli strings over a sequence of qubits, stored as arrays.
+
+    Term k of the sum is `coefficients[k]` times the tensor product over
+    qubits j of the Pauli whose X bit is `x_bits[k, j]` and whose Z bit is
+    `z_bits[k, j]`, with I=(0, 0), X=(1, 0), Y=(1, 1) and Z=(0, 1).
+
+    Unlike `cirq.PauliSum`, which holds a dictionary entry per term and a set
+    per Pauli string, arithmetic on this representation is vectorized over
+    all terms. This makes building, multiplying and analyzing Hamiltonians
+    with very many terms practical. Use `cirq.PackedPauliSum.from_pauli_sum`
+    and `to_pauli_sum` to convert between the two.
+
+    Terms are not combined automatically when building a sum from arrays;
+    sums produced by arithmetic operations are simplified.
+    """
+
+    def __init__(
+        self,
+        qubits: Iterable['cirq.Qid'],
+        x_bits: np.ndarray,
+        z_bits: np.ndarray,
+        coefficients: Iterable[complex],
+    ) -> None:
+        """Initializes a packed Pauli sum.
+
+        Args:
+            qubits: The qubits the columns of the bit arrays refer to.
+            x_bits: A boolean array of shape (number of terms, number of qubits)
+                holding the X bit of each Pauli.
+            z_bits: A boolean array of the same shape holding the Z bits.
+            coefficients: The coefficient of each term.
+
+        Raises:
+            ValueError: The shapes of the arrays are inconsistent with each
+                other or with the qubits, or the qubits are not distinct.
+        """
+        self._qubits = tuple(qubits)
+        if len(set(self._qubits)) != len(self._qubits):
+            raise ValueError(f'Qubits are not distinct: {self._qubits!r}.')
+        self._coefficients = np.array(coefficients, dtype=np.complex128).reshape(-1)
+        shape = (len(self._coefficients), len(self._qubits))
+        self._x_bits = _as_bit_array(x_bits, shape)
+        self._z_bits = _as_bit_array(z_bits, shape)
+        if self._x_bits.shape != shape or self._z_bits.shape != shape:
+            raise ValueError(
+                f'Expected bit arrays of shape {shape} for {shape[0]} coefficients on '
+                f'{shape[1]} qubits, but got {self._x_bits.shape} and {self._z_bits.shape}.'
+            )
+        for array in (self._coefficients, self._x_bits, self._z_bits):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_pauli_sum(
+        cls, val: 'cirq.PauliSumLike', qubits: Optional[Sequence['cirq.Qid']] = None
+    ) -> 'PackedPauliSum':
+        """Packs a `cirq.PauliSum`, `cirq.PauliString` or scalar.
+
+        Args:
+            val: The sum to pack.
+            qubits: The qubits of the packed sum. Must include every qubit of
+                `val`. Defaults to `val.qubits` (in sorted order).
+
+        Raises:
+            ValueError: `qubits` does not include all of the qubits of `val`.
+        """
+        val = PauliSum.wrap(val)
+        qubits = val.qubits if qubits is None else tuple(qubits)
+        index = {q: j for j, q in enumerate(qubits)}
+        missing = set(val.qubits) - index.keys()
+        if missing:
+            raise ValueError(f'Qubits {sorted(missing)} are not among {qubits!r}.')
+
+        # pylint: disable=protected-access
+        items = val._linear_dict.items()
+        x_bits = np.zeros((len(items), len(index)), dtype=bool)
+        z_bits = np.zeros((len(items), len(index)), dtype=bool)
+        coefficients = np.empty(len(items), dtype=np.complex128)
+        for k, (unit, coefficient) in enumerate(items):
+            coefficients[k] = coefficient
+            for qubit, pauli in unit:
+                j = index[qubit]
+                x_bits[k, j] = pauli != pauli_gates.Z
+                z_bits[k, j] = pauli != pauli_gates.X
+        return cls(qubits, x_bits, z_bits, coefficients)
+
+    @classmethod
+    def from_dense_pauli_strings(
+        cls,
+        strings: Iterable['cirq.BaseDensePauliString'],
+        qubits: Optional[Sequence['cirq.Qid']] = None,
+    ) -> 'PackedPauliSum':
+        """Packs the sum of dense Pauli strings.
+
+        Args:
+            strings: The dense Pauli strings to sum. They must all have the
+                same length and numeric coefficients.
+            qubits: The qubits the strings act on. Defaults to
+                `cirq.LineQubit.range(length)`, as in
+                `cirq.DensePauliString.sparse`.
+
+        Raises:
+            ValueError: The strings have different lengths, or their length
+                differs from the number of qubits.
+        """
+        strings = list(strings)
+        lengths = {len(s) for s in strings}
+        if len(lengths) > 1:
+            raise ValueError(f'Dense Pauli strings have different lengths: {sorted(lengths)}.')
+        if qubits is None:
+            from cirq import devices
+
+            qubits = devices.LineQubit.range(lengths.pop() if lengths else 0)
+        masks = np.array([s.pauli_mask for s in strings], dtype=np.uint8)
+        masks = masks.reshape(len(strings), -1 if strings else len(qubits))
+        if masks.shape[1] != len(qubits):
+            raise ValueError(
+                f'Dense Pauli strings of length {masks.shape[1]} do not act on {len(qubits)} qubits.'
+            )
+        x_bits = (masks == dense_pauli_string.BaseDensePauliString.X_VAL) | (
+            masks == dense_pauli_string.BaseDensePauliString.Y_VAL
+        )
+        z_bits = (masks == dense_pauli_string.BaseDensePauliString.Z_VAL) | (
+            masks == dense_pauli_string.BaseDensePauliString.Y_VAL
+        )
+        return cls(qubits, x_bits, z_bits, [complex(s.coefficient) for s in strings])
+
+    @property
+    def qubits(self) -> Tuple['cirq.Qid', ...]:
+        return self._qubits
+
+    @property
+    def x_bits(self) -> np.ndarray:
+        """A read-only boolean array of the X bits of each term and qubit."""
+        return self._x_bits
+
+    @property
+    def z_bits(self) -> np.ndarray:
+        """A read-only boolean array of the Z bits of each term and qubit."""
+        return self._z_bits
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """A read-only array of the coefficient of each term."""
+        return self._coefficients
+
+    def __len__(self) -> int:
+        return len(self._coefficients)
+
+    def to_pauli_sum(self) -> PauliSum:
+        """Returns the equivalent `cirq.PauliSum`."""
+        return PauliSum(self._to_linear_dict())
+
+    def _to_linear_dict(self) -> value.LinearDict[UnitPauliStringT]:
+        codes = self._x_bits + 2 * self._z_bits.astype(np.uint8)
+        # The (qubit, Pauli) pair for each column and nonzero code.
+        pairs = [[(q, pauli) for pauli in _PAULIS_BY_CODE] for q in self._qubits]
+        terms: Dict[UnitPauliStringT, complex] = {}
+        for row, coefficient in zip(codes.tolist(), self._coefficients.tolist()):
+            unit = frozenset(pairs[j][code] for j, code in enumerate(row) if code)
+            terms[unit] = terms.get(unit, 0) + coefficient
+        return value.LinearDict(terms)
+
+    def to_dense_pauli_strings(self) -> List['cirq.DensePauliString']:
+        """Returns a dense Pauli string over `qubits` for each term."""
+        masks = np.zeros(self._x_bits.shape, dtype=np.uint8)
+        masks[self._x_bits] = dense_pauli_string.BaseDensePauliString.X_VAL
+        masks[self._z_bits] = dense_pauli_string.BaseDensePauliString.Z_VAL
+        masks[self._x_bits & self._z_bits] = dense_pauli_string.BaseDensePauliString.Y_VAL
+        return [
+            dense_pauli_string.DensePauliString(mask, coefficient=coefficient)
+            for mask, coefficient in zip(masks, self._coefficients)
+        ]
+
+    def with_qubits(self, qubits: Sequence['cirq.Qid']) -> 'PackedPauliSum':
+        """Returns the same sum over a superset of its qubits, in a new order.
+
+        Raises:
+            ValueError: `qubits` does not include all of the sum's qubits.
+        """
+        qubits = tuple(qubits)
+        if qubits == self._qubits:
+            return self
+        index = {q: j for j, q in enumerate(qubits)}
+        missing = set(self._qubits) - index.keys()
+        if missing:
+            raise ValueError(f'Qubits {sorted(missing)} are not among {qubits!r}.')
+        columns = [index[q] for q in self._qubits]
+        x_bits = np.zeros((len(self), len(qubits)), dtype=bool)
+        z_bits = np.zeros((len(self), len(qubits)), dtype=bool)
+        x_bits[:, columns] = self._x_bits
+        z_bits[:, columns] = self._z_bits
+        return PackedPauliSum(qubits, x_bits, z_bits, self._coefficients)
+
+    def simplify(self, *, atol: float = 0) -> 'PackedPauliSum':
+        """Combines terms with the same Pauli string and drops negligible ones.
+
+        Args:
+            atol: Terms whose combined coefficient has absolute value `atol`
+                or less are dropped.
+
+        Returns:
+            The simplified sum, with its terms sorted by Pauli string.
+        """
+        if self._qubits:
+            rows = np.concatenate([self._x_bits, self._z_bits], axis=1)
+            rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            rows = np.zeros((min(len(self), 1), 0), dtype=bool)
+            inverse = np.zeros(len(self), dtype=np.intp)
+        coefficients = np.bincount(
+            inverse, weights=self._coefficients.real, minlength=len(rows)
+        ) + 1j * np.bincount(inverse, weights=self._coefficients.imag, minlength=len(rows))
+        keep = np.abs(coefficients) > atol
+        n = len(self._qubits)
+        return PackedPauliSum(self._qubits, rows[keep, :n], rows[keep, n:], coefficients[keep])
+
+    def commutes(self, other: 'PackedPauliSum') -> np.ndarray:
+        """Returns which terms of this sum commute with which terms of another.
+
+        Args:
+            other: The other sum. Its qubits may differ from this sum's.
+
+        Returns:
+            A boolean array whose entry [j, k] says whether term j of this sum
+            commutes with term k of `other`. Two Pauli strings commute if and
+            only if they anticommute on an even number of qubits, i.e. if the
+            symplectic inner product of their bits is zero.
+        """
+        lhs, rhs = _aligned(self, other)
+        x1, z1 = lhs._x_bits.astype(np.int64), lhs._z_bits.astype(np.int64)
+        x2, z2 = rhs._x_bits.astype(np.int64), rhs._z_bits.astype(np.int64)
+        return (x1 @ z2.T + z1 @ x2.T) % 2 == 0
+
+    def _product(self, other: 'PackedPauliSum') -> 'PackedPauliSum':
+        lhs, rhs = _aligned(self, other)
+        x1, z1, x2, z2 = lhs._x_bits, lhs._z_bits, rhs._x_bits, rhs._z_bits
+        shape = (len(x1) * len(x2), len(lhs._qubits))
+        x = (x1[:, np.newaxis, :] ^ x2[np.newaxis, :, :]).reshape(shape)
+        z = (z1[:, np.newaxis, :] ^ z2[np.newaxis, :, :]).reshape(shape)
+
+        # Writing each Pauli string as i**(x.z) X**x Z**z (since Y = iXZ) and
+        # moving the Z factors of the left string past the X factors of the
+        # right one gives the product's phase as a power of i.
+        y1 = np.sum(x1 & z1, axis=1)[:, np.newaxis]
+        y2 = np.sum(x2 & z2, axis=1)[np.newaxis, :]
+        swaps = z1.astype(np.int64) @ x2.T.astype(np.int64)
+        exponents = (y1 + y2 + 2 * swaps).reshape(-1) - np.sum(x & z, axis=1)
+        phases = np.array([1, 1j, -1, -1j])[exponents % 4]
+
+        coefficients = (lhs._coefficients[:, np.newaxis] * rhs._coefficients).reshape(-1)
+        return PackedPauliSum(lhs._qubits, x, z, coefficients * phases).simplify()
+
+    def __add__(self, other: Any) -> 'PackedPauliSum':
+        other = _as_packed(other)
+        if other is None:
+            return NotImplemented
+        lhs, rhs = _aligned(self, other)
+        return PackedPauliSum(
+            lhs._qubits,
+            np.concatenate([lhs._x_bits, rhs._x_bits]),
+            np.concatenate([lhs._z_bits, rhs._z_bits]),
+            np.concatenate([lhs._coefficients, rhs._coefficients]),
+        ).simplify()
+
+    def __radd__(self, other: Any) -> 'PackedPauliSum':
+        return self.__add__(other)
+
+    def __neg__(self) -> 'PackedPauliSum':
+        return PackedPauliSum(self._qubits, self._x_bits, self._z_bits, -self._coefficients)
+
+    def __sub__(self, other: Any) -> 'PackedPauliSum':
+        other = _as_packed(other)
+        if other is None:
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other: Any) -> 'PackedPauliSum':
+        return -self + other
+
+    def __mul__(self, other: Any) -> 'PackedPauliSum':
+        if isinstance(other, numbers.Complex):
+            return PackedPauliSum(
+                self._qubits, self._x_bits, self._z_bits, self._coefficients * other
+            ).simplify()
+        other = _as_packed(other)
+        if other is None:
+            return NotImplemented
+        return self._product(other)
+
+    def __rmul__(self, other: Any) -> 'PackedPauliSum':
+        if isinstance(other, numbers.Complex):
+            return self * other
+        other = _as_packed(other)
+        if other is None:
+            return NotImplemented
+        return other._product(self)
+
+    def __truediv__(self, other: Any) -> 'PackedPauliSum':
+        if isinstance(other, numbers.Complex):
+            return self * (1 / other)
+        return NotImplemented
+
+    def _value_equality_values_(self):
+        simplified = self.simplify()
+        return (
+            simplified._qubits,
+            simplified._x_bits.tobytes(),
+            simplified._z_bits.tobytes(),
+            tuple(simplified._coefficients.tolist()),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.PackedPauliSum(qubits={self._qubits!r}, '
+            f'x_bits={self._x_bits.tolist()!r}, '
+            f'z_bits={self._z_bits.tolist()!r}, '
+            f'coefficients={self._coefficients.tolist()!r})'
+        )
+
+    def __str__(self) -> str:
+        return str(self.to_pauli_sum())
+
+
+def _as_packed(val: Any) -> Optional[PackedPauliSum]:
+    if isinstance(val, PackedPauliSum):
+        return val
+    if isinstance(
+        val, (numbers.Complex, PauliString, SingleQubitPauliStringGateOperation, PauliSum)
+    ):
+        return PackedPauliSum.from_pauli_sum(val)
+    return None
+
+
+def _as_bit_array(bits: Any, shape: Tuple[int, int]) -> np.ndarray:
+    result = np.array(bits, dtype=bool)
+    return result.reshape(shape) if result.size == 0 else result
+
+
+def _aligned(lhs: PackedPauliSum, rhs: PackedPauliSum) -> Tuple[PackedPauliSum, PackedPauliSum]:
+    """Re-expresses two sums over the same qubits."""
+    if lhs.qubits == rhs.qubits:
+        return lhs, rhs
+    qubits = tuple(sorted(set(lhs.qubits) | set(rhs.qubits)))
+    return lhs.with_qubits(qubits), rhs.with_qubits(qubits)
@@ -0,0 +1,230 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def _random_pauli_sum(qubits, num_terms, prng):
+    paulis = [cirq.I, cirq.X, cirq.Y, cirq.Z]
+    return cirq.PauliSum.from_pauli_strings(
+        [
+            cirq.PauliString(
+                {q: paulis[prng.randint(4)] for q in qubits},
+                coefficient=prng.randn() + 1j * prng.randn(),
+            )
+            for _ in range(num_terms)
+        ]
+    )
+
+
+def test_init():
+    a, b = cirq.LineQubit.range(2)
+    packed = cirq.PackedPauliSum([a, b], [[1, 0], [1, 1]], [[0, 0], [1, 1]], [2, -1j])
+    assert packed.qubits == (a, b)
+    assert len(packed) == 2
+    assert packed.x_bits.dtype == bool
+    np.testing.assert_array_equal(packed.z_bits, [[False, False], [True, True]])
+    np.testing.assert_array_equal(packed.coefficients, [2, -1j])
+    assert packed.to_pauli_sum() == 2 * cirq.X(a) - 1j * cirq.Y(a) * cirq.Y(b)
+    with pytest.raises(ValueError):
+        packed.coefficients[0] = 1
+
+    empty = cirq.PackedPauliSum([a], [], [], [])
+    assert len(empty) == 0
+    assert empty.x_bits.shape == (0, 1)
+    assert empty.to_pauli_sum() == cirq.PauliSum()
+
+    with pytest.raises(ValueError, match='distinct'):
+        _ = cirq.PackedPauliSum([a, a], [[0, 0]], [[0, 0]], [1])
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.PackedPauliSum([a, b], [[0, 0]], [[0, 0]], [1, 2])
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.PackedPauliSum([a, b], [[0]], [[0]], [1])
+
+
+def test_pauli_sum_round_trip():
+    prng = np.random.RandomState(0)
+    qubits = cirq.LineQubit.range(4)
+    psum = _random_pauli_sum(qubits, 20, prng) + 3
+    packed = cirq.PackedPauliSum.from_pauli_sum(psum)
+    assert packed.qubits == psum.qubits
+    assert len(packed) == len(psum)
+    assert packed.to_pauli_sum() == psum
+
+    q = cirq.NamedQubit('q')
+    packed = cirq.PackedPauliSum.from_pauli_sum(2 * cirq.Z(q), qubits=iter([qubits[0], q]))
+    np.testing.assert_array_equal(packed.x_bits, [[False, False]])
+    np.testing.assert_array_equal(packed.z_bits, [[False, True]])
+    assert cirq.PackedPauliSum.from_pauli_sum(cirq.X(q)).to_pauli_sum() == cirq.PauliSum.wrap(
+        cirq.X(q)
+    )
+    assert cirq.PackedPauliSum.from_pauli_sum(2).to_pauli_sum() == cirq.PauliSum.wrap(2)
+    with pytest.raises(ValueError, match='not among'):
+        _ = cirq.PackedPauliSum.from_pauli_sum(cirq.Z(q), qubits=qubits)
+
+
+def test_dense_pauli_strings_round_trip():
+    strings = [cirq.DensePauliString('IXYZ', coefficient=2), cirq.DensePauliString('ZZII')]
+    packed = cirq.PackedPauliSum.from_dense_pauli_strings(strings)
+    assert packed.qubits == tuple(cirq.LineQubit.range(4))
+    assert packed.to_dense_pauli_strings() == strings
+    assert packed.to_pauli_sum() == sum(s.sparse() for s in strings)
+
+    qubits = cirq.GridQubit.rect(1, 4)
+    packed = cirq.PackedPauliSum.from_dense_pauli_strings(strings, qubits=qubits)
+    assert packed.to_pauli_sum() == sum(s.sparse(qubits) for s in strings)
+
+    assert len(cirq.PackedPauliSum.from_dense_pauli_strings([], qubits=qubits)) == 0
+    with pytest.raises(ValueError, match='different lengths'):
+        _ = cirq.PackedPauliSum.from_dense_pauli_strings(strings + [cirq.DensePauliString('X')])
+    with pytest.raises(ValueError, match='do not act'):
+        _ = cirq.PackedPauliSum.from_dense_pauli_strings(strings, qubits=qubits[:3])
+
+
+def test_simplify():
+    a, b = cirq.LineQubit.range(2)
+    packed = cirq.PackedPauliSum(
+        [a, b],
+        [[1, 0], [0, 0], [1, 0], [0, 1]],
+        [[0, 0], [0, 0], [0, 0], [0, 1]],
+        [1, 2, 3, 1e-12],
+    )
+    simplified = packed.simplify()
+    assert len(simplified) == 3
+    assert simplified.to_pauli_sum() == packed.to_pauli_sum()
+    assert len(packed.simplify(atol=1e-9)) == 2
+
+    identities = cirq.PackedPauliSum([], np.zeros((3, 0)), np.zeros((3, 0)), [1, 2, -3])
+    assert len(identities.simplify()) == 0
+    assert len(identities.simplify(atol=-1)) == 1
+
+
+def test_add_sub_neg():
+    prng = np.random.RandomState(1)
+    qubits = cirq.LineQubit.range(4)
+    a = _random_pauli_sum(qubits[:3], 10, prng)
+    b = _random_pauli_sum(qubits[1:], 10, prng)
+    pa = cirq.PackedPauliSum.from_pauli_sum(a)
+    pb = cirq.PackedPauliSum.from_pauli_sum(b)
+    assert cirq.approx_eq((pa + pb).to_pauli_sum(), a + b)
+    assert cirq.approx_eq((pa - pb).to_pauli_sum(), a - b)
+    assert cirq.approx_eq((-pa).to_pauli_sum(), -a)
+    assert cirq.approx_eq((pa + b).to_pauli_sum(), a + b)
+    assert cirq.approx_eq((a + pb).to_pauli_sum(), a + b)
+    assert cirq.approx_eq((1 - pa).to_pauli_sum(), 1 - a)
+    assert cirq.approx_eq((pa - cirq.X(qubits[0])).to_pauli_sum(), a - cirq.X(qubits[0]))
+    assert len(pa - pa) == 0
+    with pytest.raises(TypeError):
+        _ = pa + 'a'
+    with pytest.raises(TypeError):
+        _ = pa - 'a'
+
+
+def test_mul():
+    prng = np.random.RandomState(2)
+    qubits = cirq.LineQubit.range(4)
+    a = _random_pauli_sum(qubits[:3], 10, prng)
+    b = _random_pauli_sum(qubits[1:], 10, prng)
+    expected = cirq.PauliSum.from_pauli_strings([s * t for s in a for t in b])
+    pa = cirq.PackedPauliSum.from_pauli_sum(a)
+    pb = cirq.PackedPauliSum.from_pauli_sum(b)
+    assert cirq.approx_eq((pa * pb).to_pauli_sum(), expected)
+    assert cirq.approx_eq((pa * b).to_pauli_sum(), expected)
+    assert cirq.approx_eq((a * pb).to_pauli_sum(), expected)
+    assert cirq.approx_eq((2 * pa).to_pauli_sum(), 2 * a)
+    assert cirq.approx_eq((pa * 2).to_pauli_sum(), 2 * a)
+    assert cirq.approx_eq((pa / 2).to_pauli_sum(), a / 2)
+    assert len(pa * 0) == 0
+    with pytest.raises(TypeError):
+        _ = pa * 'a'
+    with pytest.raises(TypeError):
+        _ = 'a' * pa
+    with pytest.raises(TypeError):
+        _ = pa / pb
+
+
+@pytest.mark.parametrize(
+    'lhs, rhs, product',
+    [
+        ('X', 'Y', 1j * cirq.DensePauliString('Z')),
+        ('Y', 'X', -1j * cirq.DensePauliString('Z')),
+        ('YZ', 'ZX', -1 * cirq.DensePauliString('XY')),
+        ('XYZI', 'XYZI', cirq.DensePauliString('IIII')),
+    ],
+)
+def test_product_phases(lhs, rhs, product):
+    packed = cirq.PackedPauliSum.from_dense_pauli_strings(
+        [cirq.DensePauliString(lhs)]
+    ) * cirq.PackedPauliSum.from_dense_pauli_strings([cirq.DensePauliString(rhs)])
+    assert packed.to_dense_pauli_strings() == [product]
+
+
+def test_pauli_sum_multiplication_delegates():
+    prng = np.random.RandomState(3)
+    qubits = cirq.LineQubit.range(3)
+    a = _random_pauli_sum(qubits, 15, prng)
+    b = _random_pauli_sum(qubits[1:], 15, prng)
+    expected = cirq.PauliSum.from_pauli_strings([s * t for s in a for t in b])
+    assert cirq.approx_eq(a * b, expected)
+
+    def matrix(psum):
+        return sum(p.matrix(qubits) for p in psum)
+
+    np.testing.assert_allclose(matrix(a * b), matrix(a) @ matrix(b), atol=1e-8)
+
+
+def test_multiplication_of_scalar_sums():
+    a = cirq.PauliSum.wrap(2.0)
+    b = cirq.PauliSum.wrap(3.0)
+    assert a * b == cirq.PauliSum.wrap(6.0)
+    a *= b
+    assert a == cirq.PauliSum.wrap(6.0)
+    q = cirq.LineQubit(0)
+    assert b * cirq.PauliSum.wrap(cirq.X(q)) == cirq.PauliSum.wrap(3 * cirq.X(q))
+    assert len(cirq.PauliSum() * b) == 0
+
+
+def test_commutes():
+    prng = np.random.RandomState(4)
+    qubits = cirq.LineQubit.range(4)
+    a = _random_pauli_sum(qubits[:3], 8, prng)
+    b = _random_pauli_sum(qubits[1:], 8, prng)
+    commutes = cirq.PackedPauliSum.from_pauli_sum(a).commutes(cirq.PackedPauliSum.from_pauli_sum(b))
+    # Packed terms are in the order the sums iterate over them.
+    np.testing.assert_array_equal(commutes, [[cirq.commutes(s, t) for t in b] for s in a])
+
+
+def test_equality():
+    a, b = cirq.LineQubit.range(2)
+    eq = cirq.testing.EqualsTester()
+    eq.add_equality_group(
+        cirq.PackedPauliSum([a, b], [[1, 0]], [[0, 0]], [2]),
+        cirq.PackedPauliSum([a, b], [[1, 0], [1, 0]], [[0, 0], [0, 0]], [1, 1]),
+    )
+    eq.add_equality_group(cirq.PackedPauliSum([a, b], [[1, 0]], [[0, 0]], [3]))
+    eq.add_equality_group(cirq.PackedPauliSum([a], [[1]], [[0]], [2]))
+    assert cirq.approx_eq(
+        cirq.PackedPauliSum([a], [[1]], [[0]], [2]),
+        cirq.PackedPauliSum([a], [[1]], [[0]], [2 + 1e-10]),
+    )
+
+
+def test_repr_str():
+    a, b = cirq.LineQubit.range(2)
+    packed = cirq.PackedPauliSum([a, b], [[1, 0]], [[0, 1]], [2])
+    cirq.testing.assert_equivalent_repr(packed)
+    assert str(packed) == str(packed.to_pauli_sum())
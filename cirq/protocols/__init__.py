@@ -81,6 +81,10 @@ from cirq.protocols.json_serialization import (
     json_serializable_dataclass,
     to_json_gzip,
     read_json_gzip,
+    to_json_binary,
+    read_json_binary,
+    to_json_lines,
+    read_json_lines,
     to_json,
     read_json,
     obj_to_dict_helper,
@@ -14,9 +14,11 @@
 import dataclasses
 import functools
 import gzip
+import io
 import json
 import numbers
 import pathlib
+import struct
 from typing import (
     Any,
     Callable,
@@ -24,10 +26,12 @@ from typing import (
     Dict,
     IO,
     Iterable,
+    Iterator,
     List,
     Optional,
     overload,
     Sequence,
+    Tuple,
     Type,
     TYPE_CHECKING,
     Union,
@@ -155,6 +159,7 @@ def _cirq_class_resolver_dictionary() -> Dict[str, ObjectFactory]:
         'PhysicalZTag': cirq.google.PhysicalZTag,
         'RandomGateChannel': cirq.RandomGateChannel,
         'QuantumFourierTransformGate': cirq.QuantumFourierTransformGate,
+        'RepetitionsStoppingCriteria': cirq.work.RepetitionsStoppingCriteria,
         'ResetChannel': cirq.ResetChannel,
         'SingleQubitMatrixGate': single_qubit_matrix_gate,
         'SingleQubitPauliStringGateOperation': cirq.SingleQubitPauliStringGateOperation,
@@ -170,6 +175,7 @@ def _cirq_class_resolver_dictionary() -> Dict[str, ObjectFactory]:
         'TwoQubitMatrixGate': two_qubit_matrix_gate,
         'TwoQubitDiagonalGate': cirq.TwoQubitDiagonalGate,
         '_UnconstrainedDevice': cirq.devices.unconstrained_device._UnconstrainedDevice,
+        'VarianceStoppingCriteria': cirq.work.VarianceStoppingCriteria,
         'VirtualTag': cirq.VirtualTag,
         'WaitGate': cirq.WaitGate,
         '_QubitAsQid': raw_types._QubitAsQid,
@@ -417,35 +423,105 @@ class CirqEncoder(json.JSONEncoder):
         return super().default(o)  # coverage: ignore
 
 
-def _cirq_object_hook(d, resolvers: Sequence[JsonResolver], context_map: Dict[str, Any]):
-    if 'cirq_type' not in d:
-        return d
-
-    if d['cirq_type'] == '_SerializedKey':
-        return _SerializedKey.read_from_context(context_map, **d)
-
-    if d['cirq_type'] == '_SerializedContext':
-        _SerializedContext.update_context(context_map, **d)
-        return None
+@functools.lru_cache(maxsize=1)
+def _fast_decoders() -> Dict[ObjectFactory, Callable[[Dict[str, Any]], Any]]:
+    """Decoders for the most common classes, bypassing keyword dispatch.
 
-    if d['cirq_type'] == '_ContextualSerialization':
-        return _ContextualSerialization.deserialize_with_context(**d)
+    These are only used when a `cirq_type` resolves to exactly these classes,
+    so custom resolvers overriding them are unaffected.
+    """
+    import cirq
 
-    for resolver in resolvers:
-        cls = resolver(d['cirq_type'])
-        if cls is not None:
-            break
-    else:
-        raise ValueError(
-            "Could not resolve type '{}' during deserialization".format(d['cirq_type'])
+    def eigen_gate_decoder(cls):
+        return lambda d: cls(
+            exponent=d.get('exponent', 1.0), global_shift=d.get('global_shift', 0.0)
         )
 
-    from_json_dict = getattr(cls, '_from_json_dict_', None)
-    if from_json_dict is not None:
-        return from_json_dict(**d)
+    decoders: Dict[ObjectFactory, Callable[[Dict[str, Any]], Any]] = {
+        cirq.LineQubit: lambda d: cirq.LineQubit(d['x']),
+        cirq.GridQubit: lambda d: cirq.GridQubit(d['row'], d['col']),
+        cirq.GateOperation: lambda d: cirq.GateOperation(d['gate'], d['qubits']),
+        cirq.Moment: lambda d: cirq.Moment(d['operations']),
+        cirq.PhasedXZGate: lambda d: cirq.PhasedXZGate(
+            x_exponent=d['x_exponent'],
+            z_exponent=d['z_exponent'],
+            axis_phase_exponent=d['axis_phase_exponent'],
+        ),
+        cirq.PhasedXPowGate: lambda d: cirq.PhasedXPowGate(
+            phase_exponent=d['phase_exponent'],
+            exponent=d.get('exponent', 1.0),
+            global_shift=d.get('global_shift', 0.0),
+        ),
+        cirq.FSimGate: lambda d: cirq.FSimGate(d['theta'], d['phi']),
+    }
+    for cls in [
+        cirq.XPowGate,
+        cirq.YPowGate,
+        cirq.ZPowGate,
+        cirq.HPowGate,
+        cirq.CZPowGate,
+        cirq.CXPowGate,
+        cirq.ISwapPowGate,
+        cirq.SwapPowGate,
+    ]:
+        decoders[cls] = eigen_gate_decoder(cls)
+    return decoders
+
+
+class _ObjectHook:
+    """The object hook used by `read_json` to decode cirq objects.
+
+    The decoder for each `cirq_type` is looked up through the resolvers once
+    and then cached, so decoding many objects of the same type doesn't query
+    every resolver for each of them.
+    """
 
-    del d['cirq_type']
-    return cls(**d)
+    def __init__(self, resolvers: Sequence[JsonResolver], context_map: Dict[str, Any]) -> None:
+        self._resolvers = resolvers
+        self._context_map = context_map
+        self._decoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            '_SerializedKey': lambda d: _SerializedKey.read_from_context(context_map, **d),
+            '_SerializedContext': lambda d: _SerializedContext.update_context(context_map, **d),
+            '_ContextualSerialization': lambda d: (
+                _ContextualSerialization.deserialize_with_context(**d)
+            ),
+        }
+
+    def add_decoder(self, cirq_type: str, decoder: Callable[[Dict[str, Any]], Any]) -> None:
+        """Decodes objects of the given `cirq_type` with the given function."""
+        self._decoders[cirq_type] = decoder
+
+    def __call__(self, d: Dict[str, Any]) -> Any:
+        cirq_type = d.get('cirq_type')
+        if cirq_type is None:
+            return d
+        decoder = self._decoders.get(cirq_type)
+        if decoder is None:
+            decoder = self._decoder(cirq_type)
+            self._decoders[cirq_type] = decoder
+        return decoder(d)
+
+    def _decoder(self, cirq_type: str) -> Callable[[Dict[str, Any]], Any]:
+        for resolver in self._resolvers:
+            cls = resolver(cirq_type)
+            if cls is not None:
+                break
+        else:
+            raise ValueError("Could not resolve type '{}' during deserialization".format(cirq_type))
+
+        fast_decoder = _fast_decoders().get(cls)
+        if fast_decoder is not None:
+            return fast_decoder
+
+        from_json_dict = getattr(cls, '_from_json_dict_', None)
+        if from_json_dict is not None:
+            return lambda d: from_json_dict(**d)
+
+        def decode(d):
+            del d['cirq_type']
+            return cls(**d)
+
+        return decode
 
 
 class SerializableByKey(SupportsJSON):
@@ -544,15 +620,27 @@ class _ContextualSerialization(SupportsJSON):
         return object_dag[-1]
 
 
+def _json_dict_of(obj: Any) -> Any:
+    """The JSON dict of obj, used to look for SerializableByKey objects in it.
+
+    The binary and text JSON dicts of an object hold the same objects, but the
+    binary one skips packing arrays, so it is preferred.
+    """
+    json_dict_fn = getattr(obj, '_binary_json_dict_', None) or getattr(obj, '_json_dict_', None)
+    return json_dict_fn() if json_dict_fn is not None else None
+
+
 def has_serializable_by_keys(obj: Any) -> bool:
     """Returns true if obj contains one or more SerializableByKey objects."""
     if hasattr(obj, '_serialization_key_'):
         return True
-    json_dict = getattr(obj, '_json_dict_', lambda: None)()
+    json_dict = _json_dict_of(obj)
     if isinstance(json_dict, Dict):
         return any(has_serializable_by_keys(v) for v in json_dict.values())
 
     # Handle primitive container types.
+    if isinstance(obj, np.ndarray) and obj.dtype != object:
+        return False
     if isinstance(obj, Dict):
         return any(has_serializable_by_keys(elem) for pair in obj.items() for elem in pair)
     if hasattr(obj, '__iter__') and not isinstance(obj, str):
@@ -569,7 +657,7 @@ def get_serializable_by_keys(obj: Any) -> List[SerializableByKey]:
     result = []
     if hasattr(obj, '_serialization_key_'):
         result.append(obj)
-    json_dict = getattr(obj, '_json_dict_', lambda: None)()
+    json_dict = _json_dict_of(obj)
     if isinstance(json_dict, Dict):
         for v in json_dict.values():
             result = get_serializable_by_keys(v) + result
@@ -577,6 +665,8 @@ def get_serializable_by_keys(obj: Any) -> List[SerializableByKey]:
         return result
 
     # Handle primitive container types.
+    if isinstance(obj, np.ndarray) and obj.dtype != object:
+        return []
     if isinstance(obj, Dict):
         return [sbk for pair in obj.items() for sbk in get_serializable_by_keys(pair)]
     if hasattr(obj, '__iter__') and not isinstance(obj, str):
@@ -623,6 +713,25 @@ def to_json(
             party classes, prefer adding the _json_dict_ magic method
             to your classes rather than overriding this default.
     """
+    obj, cls = _with_context(obj, cls)
+
+    if file_or_fn is None:
+        return json.dumps(obj, indent=indent, cls=cls)
+
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'w') as actually_a_file:
+            json.dump(obj, actually_a_file, indent=indent, cls=cls)
+            return None
+
+    json.dump(obj, file_or_fn, indent=indent, cls=cls)
+    return None
+
+
+# pylint: enable=function-redefined
+
+
+def _with_context(obj: Any, cls: Type[json.JSONEncoder]) -> Tuple[Any, Type[json.JSONEncoder]]:
+    """Wraps obj and cls for contextual serialization, if obj requires it."""
     if has_serializable_by_keys(obj):
 
         class ContextualEncoder(cls):  # type: ignore
@@ -648,20 +757,7 @@ def to_json(
 
         obj = _ContextualSerialization(obj)
         cls = ContextualEncoder
-
-    if file_or_fn is None:
-        return json.dumps(obj, indent=indent, cls=cls)
-
-    if isinstance(file_or_fn, (str, pathlib.Path)):
-        with open(file_or_fn, 'w') as actually_a_file:
-            json.dump(obj, actually_a_file, indent=indent, cls=cls)
-            return None
-
-    json.dump(obj, file_or_fn, indent=indent, cls=cls)
-    return None
-
-
-# pylint: enable=function-redefined
+    return obj, cls
 
 
 def read_json(
@@ -694,10 +790,7 @@ def read_json(
     if resolvers is None:
         resolvers = DEFAULT_RESOLVERS
 
-    context_map: Dict[str, 'SerializableByKey'] = {}
-
-    def obj_hook(x):
-        return _cirq_object_hook(x, resolvers, context_map)
+    obj_hook = _ObjectHook(resolvers, {})
 
     if json_text is not None:
         return json.loads(json_text, object_hook=obj_hook)
@@ -745,3 +838,249 @@ def read_json_gzip(
 
     with gzip.open(file_or_fn, 'rt') as json_file:  # type: ignore
         return read_json(cast(IO, json_file), resolvers=resolvers)
+
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def to_json_lines(
+    objs: Iterable[Any],
+    file_or_fn: Union[IO, pathlib.Path, str],
+    *,
+    compress: Optional[bool] = None,
+    append: bool = False,
+    cls: Type[json.JSONEncoder] = CirqEncoder,
+) -> int:
+    """Write a sequence of objects to a JSON Lines file, one per line.
+
+    Objects are serialized and written one at a time as they are drawn from
+    `objs`, so a generator of results (e.g. from a long-running batch) can be
+    written with memory bounded by the largest single object. Each line is a
+    self-contained JSON document that `cirq.read_json` could also parse.
+
+    Args:
+        objs: The objects to write.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or
+            a text IO object to write to.
+        compress: Whether to gzip the file. Defaults to True for filenames
+            ending in '.gz' and False otherwise. Ignored for IO objects.
+        append: If True, add the objects to the end of an existing file
+            instead of overwriting it.
+        cls: The JSON encoder to use; see `cirq.to_json`.
+
+    Returns:
+        The number of objects written.
+    """
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        if compress is None:
+            compress = str(file_or_fn).endswith('.gz')
+        mode = 'at' if append else 'wt'
+        opener = functools.partial(gzip.open, encoding='utf-8') if compress else open
+        with opener(file_or_fn, mode) as actually_a_file:  # type: ignore
+            return to_json_lines(objs, actually_a_file, cls=cls)
+
+    count = 0
+    for obj in objs:
+        obj, obj_cls = _with_context(obj, cls)
+        file_or_fn.write(json.dumps(obj, cls=obj_cls))
+        file_or_fn.write('\n')
+        count += 1
+    return count
+
+
+def read_json_lines(
+    file_or_fn: Union[IO, pathlib.Path, str],
+    *,
+    resolvers: Optional[Sequence[JsonResolver]] = None,
+) -> Iterator[Any]:
+    """Lazily read the objects in a JSON Lines file, one per line.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or
+            a text IO object to read from. Gzipped files are detected and
+            decompressed automatically.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class. See
+            `cirq.read_json`.
+
+    Yields:
+        The objects in the file, in order. Only one line is held in memory at
+        a time.
+    """
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'rb') as raw:
+            compressed = raw.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC
+        opener = functools.partial(gzip.open, encoding='utf-8') if compressed else open
+        with opener(file_or_fn, 'rt') as actually_a_file:  # type: ignore
+            yield from read_json_lines(actually_a_file, resolvers=resolvers)
+        return
+
+    if resolvers is None:
+        resolvers = DEFAULT_RESOLVERS
+    # Decoders are shared between lines, but each line has its own context.
+    context_map: Dict[str, 'SerializableByKey'] = {}
+    obj_hook = _ObjectHook(resolvers, context_map)
+    for line in file_or_fn:
+        if line.strip():
+            context_map.clear()
+            yield json.loads(line, object_hook=obj_hook)
+
+
+# Binary files start with this magic string, followed by a little-endian uint32
+# format version and a uint64 length of the JSON header.
+_BINARY_MAGIC = b'\x93CIRQBIN'
+_BINARY_PREAMBLE = struct.Struct('<8sIQ')
+_BINARY_VERSION = 1
+# Array buffers are aligned to this many bytes within the file.
+_BINARY_ALIGNMENT = 64
+# Arrays smaller than this are stored inline as lists, as in JSON.
+_MIN_BINARY_ARRAY_NBYTES = 1024
+
+
+def _binary_encoder(cls: Type[json.JSONEncoder], buffers: List[np.ndarray]):
+    # The offset of the next buffer, relative to the first one.
+    end = 0
+
+    class BinaryEncoder(cls):  # type: ignore
+        """An encoder which stores large numeric arrays out of line."""
+
+        def default(self, o):
+            nonlocal end
+            if hasattr(o, '_binary_json_dict_'):
+                return o._binary_json_dict_()
+            if (
+                isinstance(o, np.ndarray)
+                and o.dtype.kind in 'biufc'
+                and o.nbytes >= _MIN_BINARY_ARRAY_NBYTES
+            ):
+                offset = end
+                end += _aligned(o.nbytes)
+                buffers.append(np.ascontiguousarray(o))
+                return {
+                    'cirq_type': '_BinaryArray',
+                    'offset': offset,
+                    'dtype': o.dtype.str,
+                    'shape': o.shape,
+                }
+            return super().default(o)
+
+    return BinaryEncoder
+
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+
+
+def to_json_binary(
+    obj: Any,
+    file_or_fn: Union[None, IO, pathlib.Path, str] = None,
+    *,
+    cls: Type[json.JSONEncoder] = CirqEncoder,
+) -> Optional[bytes]:
+    """Write a binary file containing a representation of obj.
+
+    This uses the same `_json_dict_` protocol as `cirq.to_json`, but numeric
+    numpy arrays larger than 1KB are written as raw buffers after the JSON
+    header instead of as nested lists of numbers. This makes objects holding
+    large arrays much faster to save and load, and `cirq.read_json_binary`
+    can memory-map those arrays instead of reading them.
+
+    Objects which encode arrays in a compact text form in `_json_dict_` (such
+    as the packed measurements of `cirq.Result`) can define
+    `_binary_json_dict_`, which is used instead of `_json_dict_` by this
+    method and may return the arrays themselves.
+
+    Args:
+        obj: An object which can be serialized to a JSON representation.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or
+            a binary IO object to write to, or `None` to indicate that the
+            method should return the serialized bytes as its result.
+        cls: The JSON encoder to extend; see `cirq.to_json`.
+    """
+    buffers: List[np.ndarray] = []
+    obj, cls = _with_context(obj, _binary_encoder(cls, buffers))
+    header = json.dumps(obj, cls=cls, separators=(',', ':')).encode('utf-8')
+    preamble = _BINARY_PREAMBLE.pack(_BINARY_MAGIC, _BINARY_VERSION, len(header))
+    header_padding = _aligned(len(preamble) + len(header)) - len(preamble) - len(header)
+
+    def write(out: IO) -> None:
+        out.write(preamble)
+        out.write(header)
+        out.write(b'\0' * header_padding)
+        for buffer in buffers:
+            out.write(buffer.reshape(-1).view(np.uint8))
+            out.write(b'\0' * (_aligned(buffer.nbytes) - buffer.nbytes))
+
+    if file_or_fn is None:
+        out = io.BytesIO()
+        write(out)
+        return out.getvalue()
+
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'wb') as actually_a_file:
+            write(actually_a_file)
+            return None
+
+    write(file_or_fn)
+    return None
+
+
+def read_json_binary(
+    file_or_fn: Union[None, IO, pathlib.Path, str] = None,
+    *,
+    binary: Optional[bytes] = None,
+    resolvers: Optional[Sequence[JsonResolver]] = None,
+    mmap: bool = True,
+):
+    """Read a binary file written by `cirq.to_json_binary`.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or
+            a binary IO object to read from, or `None` to indicate that the
+            `binary` argument should be used.
+        binary: The serialized bytes, or else `None` indicating `file_or_fn`
+            should be used.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class. See
+            `cirq.read_json`.
+        mmap: If True (the default) and `file_or_fn` is a filename, the arrays
+            in the file are memory-mapped copy-on-write rather than read, so
+            they are only loaded from disk when accessed.
+    """
+    if (file_or_fn is None) == (binary is None):
+        raise ValueError('Must specify ONE of "file_or_fn" or "binary".')
+
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        if mmap:
+            data = np.memmap(file_or_fn, dtype=np.uint8, mode='c')
+        else:
+            data = np.fromfile(file_or_fn, dtype=np.uint8)
+    else:
+        if binary is None:
+            binary = cast(IO, file_or_fn).read()
+        data = np.frombuffer(bytearray(binary), dtype=np.uint8)
+
+    if len(data) < _BINARY_PREAMBLE.size:
+        raise ValueError('Not a cirq binary file: too short.')
+    magic, version, header_size = _BINARY_PREAMBLE.unpack(bytes(data[: _BINARY_PREAMBLE.size]))
+    if magic != _BINARY_MAGIC:
+        raise ValueError('Not a cirq binary file: bad magic string.')
+    if version != _BINARY_VERSION:
+        raise ValueError(f'Unsupported cirq binary file version: {version}.')
+    header_end = _BINARY_PREAMBLE.size + header_size
+    header = bytes(data[_BINARY_PREAMBLE.size : header_end]).decode('utf-8')
+    buffers_start = _aligned(header_end)
+
+    if resolvers is None:
+        resolvers = DEFAULT_RESOLVERS
+
+    def read_array(x):
+        dtype = np.dtype(x['dtype'])
+        start = buffers_start + x['offset']
+        nbytes = int(np.prod(x['shape'], dtype=np.int64)) * dtype.itemsize
+        return data[start : start + nbytes].view(dtype).reshape(x['shape'])
+
+    obj_hook = _ObjectHook(resolvers, {})
+    obj_hook.add_decoder('_BinaryArray', read_array)
+
+    return json.loads(header, object_hook=obj_hook)
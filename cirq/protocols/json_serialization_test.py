@@ -118,6 +118,58 @@ def test_op_roundtrip_file_obj(tmpdir):
         assert op1 == op3
 
 
+def test_binary_roundtrip(tmpdir):
+    q = cirq.LineQubit.range(4)
+    matrix = cirq.testing.random_unitary(16, random_state=1234)
+    circuit = cirq.Circuit(cirq.MatrixGate(matrix).on(*q), cirq.rx(0.123).on(q[0]))
+    obj = {
+        'circuit': circuit,
+        'floats': np.linspace(0, 1, 1000),
+        'bits': np.ones((100, 100), dtype=bool),
+        'small': np.arange(3),
+    }
+
+    binary = cirq.to_json_binary(obj)
+    # The large arrays are stored as raw (aligned) buffers.
+    assert len(binary) < 8000 + 10000 + 16 * 16 * 16 + 2000
+    result = cirq.read_json_binary(binary=binary)
+    assert result['circuit'] == circuit
+    np.testing.assert_array_equal(result['floats'], obj['floats'])
+    np.testing.assert_array_equal(result['bits'], obj['bits'])
+    assert result['bits'].dtype == bool
+    assert result['small'] == [0, 1, 2]
+    result['floats'][0] = 5
+
+    filename = f'{tmpdir}/obj.bin'
+    cirq.to_json_binary(obj, filename)
+    for mmap in [True, False]:
+        result = cirq.read_json_binary(filename, mmap=mmap)
+        assert result['circuit'] == circuit
+        np.testing.assert_array_equal(result['floats'], obj['floats'])
+        # Arrays can be modified without affecting the file.
+        result['floats'][0] = 5
+    assert cirq.read_json_binary(pathlib.Path(filename))['floats'][0] == 0
+
+    with open(filename, 'w+b') as file:
+        cirq.to_json_binary(circuit, file)
+        file.seek(0)
+        assert cirq.read_json_binary(file) == circuit
+
+
+def test_binary_read_errors():
+    binary = cirq.to_json_binary(cirq.LineQubit(0))
+    with pytest.raises(ValueError, match='Must specify ONE'):
+        cirq.read_json_binary()
+    with pytest.raises(ValueError, match='Must specify ONE'):
+        cirq.read_json_binary(io.BytesIO(binary), binary=binary)
+    with pytest.raises(ValueError, match='too short'):
+        cirq.read_json_binary(binary=binary[:10])
+    with pytest.raises(ValueError, match='bad magic'):
+        cirq.read_json_binary(binary=b'x' + binary[1:])
+    with pytest.raises(ValueError, match='version'):
+        cirq.read_json_binary(binary=binary[:8] + b'\x02' + binary[9:])
+
+
 def test_fail_to_resolve():
     buffer = io.StringIO()
     buffer.write(
@@ -135,6 +187,63 @@ def test_fail_to_resolve():
     assert e.match("Could not resolve type 'MyCustomClass' during deserialization")
 
 
+def test_resolvers_are_queried_once_per_type():
+    queried = []
+
+    def counting_resolver(cirq_type):
+        queried.append(cirq_type)
+        return None
+
+    q = cirq.GridQubit.rect(1, 3)
+    circuit = cirq.Circuit(cirq.X.on_each(*q), cirq.CZ(q[0], q[1]), cirq.CZ(q[1], q[2]))
+    json_text = cirq.to_json(circuit)
+    resolvers = [counting_resolver] + cirq.DEFAULT_RESOLVERS
+    assert cirq.read_json(json_text=json_text, resolvers=resolvers) == circuit
+    assert sorted(queried) == sorted(set(queried))
+    assert 'GridQubit' in queried
+
+
+def test_custom_resolvers_override_fast_decoders():
+    class MyLineQubit(cirq.LineQubit):
+        pass
+
+    def custom_resolver(cirq_type):
+        if cirq_type == 'LineQubit':
+            return MyLineQubit
+
+    json_text = cirq.to_json([cirq.LineQubit(1), cirq.LineQubit(2)])
+    result = cirq.read_json(
+        json_text=json_text, resolvers=[custom_resolver] + cirq.DEFAULT_RESOLVERS
+    )
+    assert [type(q) for q in result] == [MyLineQubit, MyLineQubit]
+    assert [q.x for q in result] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    'gate',
+    [
+        cirq.X ** 0.5,
+        cirq.Y ** sympy.Symbol('t'),
+        cirq.Z ** 0.5,
+        cirq.H ** 0.25,
+        cirq.CZ ** 0.5,
+        cirq.CNOT,
+        cirq.ISWAP ** 0.5,
+        cirq.SWAP,
+        cirq.rx(0.3),
+        cirq.PhasedXZGate(x_exponent=0.1, z_exponent=0.2, axis_phase_exponent=0.3),
+        cirq.PhasedXPowGate(phase_exponent=0.2, exponent=0.5, global_shift=0.1),
+        cirq.FSimGate(theta=0.1, phi=0.2),
+    ],
+)
+def test_fast_decoded_gates_roundtrip(gate):
+    assert type(gate) in json_serialization._fast_decoders()
+    op = gate.on(*cirq.LineQubit.range(cirq.num_qubits(gate)))
+    result = cirq.read_json(json_text=cirq.to_json(op))
+    assert result == op
+    assert type(result.gate) is type(gate)
+
+
 QUBITS = cirq.LineQubit.range(5)
 Q0, Q1, Q2, Q3, Q4 = QUBITS
 
@@ -230,9 +339,11 @@ SHOULDNT_BE_SERIALIZED = [
     'AnnealSequenceSearchStrategy',
     'CliffordSimulator',
     'DeserializingArg',
+    'ExecutorSampler',
     'GateOpDeserializer',
     'GateOpSerializer',
     'GreedySequenceSearchStrategy',
+    'ProcessPoolSampler',
     'SerializingArg',
     'Simulator',
     'StabilizerSampler',
@@ -243,6 +354,7 @@ SHOULDNT_BE_SERIALIZED = [
     'CircuitWithCalibration',
     'Engine',
     'EngineJob',
+    'EngineJobWaiter',
     'EngineProcessor',
     'EngineProgram',
     'EngineTimeSlot',
@@ -315,9 +427,11 @@ NOT_YET_SERIALIZABLE = [
     'CircuitDiagramInfo',
     'CircuitDiagramInfoArgs',
     'CircuitSampleJob',
+    'CircuitTemplate',
     'CliffordSimulatorStepResult',
     'CliffordState',
     'CliffordTrialResult',
+    'CompactCircuitDag',
     'ConstantQubitNoiseModel',
     'DensityMatrixSimulator',
     'DensityMatrixSimulatorState',
@@ -334,6 +448,7 @@ NOT_YET_SERIALIZABLE = [
     'Linspace',
     'ListSweep',
     'NeutralAtomDevice',
+    'PackedPauliSum',
     'PauliInteractionGate',
     'PauliStringPhasor',
     'PauliSum',
@@ -558,6 +673,25 @@ def test_context_serialization():
         _ = cirq.to_json(sbki_other_list)
 
 
+def test_binary_context_serialization():
+    def custom_resolver(name):
+        if name == 'SBKImpl':
+            return SBKImpl
+
+    sbki_empty = SBKImpl('sbki_empty', data_list=[np.arange(1000)])
+    sbki_dict = SBKImpl('sbki_dict', data_dict={'a': sbki_empty, 'b': sbki_empty})
+    binary = cirq.to_json_binary(sbki_dict)
+    assert binary.count(b'"_SerializedContext"') == 2
+    assert binary.count(b'"_BinaryArray"') == 1
+
+    result = cirq.read_json_binary(
+        binary=binary, resolvers=[custom_resolver] + cirq.DEFAULT_RESOLVERS
+    )
+    assert result.name == 'sbki_dict'
+    np.testing.assert_array_equal(result.data_dict['a'].data_list[0], np.arange(1000))
+    assert result.data_dict['b'] is result.data_dict['a']
+
+
 def test_internal_serializer_types():
     sbki = SBKImpl('test_key')
     test_key = json_serialization._SerializedKey(sbki)
@@ -684,6 +818,54 @@ def test_to_from_json_gzip():
         _ = cirq.read_json_gzip()
 
 
+def _circuits(count):
+    q = cirq.LineQubit.range(3)
+    for i in range(count):
+        yield cirq.Circuit(cirq.X(q[i % 3]) ** (i / 4), cirq.measure(*q, key=f'm{i}'))
+
+
+@pytest.mark.parametrize('filename', ['circuits.jsonl', 'circuits.jsonl.gz'])
+def test_json_lines_roundtrip(tmpdir, filename):
+    path = pathlib.Path(tmpdir) / filename
+    assert cirq.to_json_lines(_circuits(4), path) == 4
+    assert cirq.to_json_lines(_circuits(1), str(path), append=True) == 1
+    with open(path, 'rb') as f:
+        assert (f.read(2) == b'\x1f\x8b') == filename.endswith('.gz')
+
+    loaded = cirq.read_json_lines(path)
+    assert isinstance(loaded, Iterator)
+    assert list(loaded) == list(_circuits(4)) + list(_circuits(1))
+
+    # Compression is detected from the contents, not the file name.
+    other = pathlib.Path(tmpdir) / 'other.jsonl'
+    cirq.to_json_lines([cirq.X, cirq.LineQubit(1)], other, compress=True)
+    assert list(cirq.read_json_lines(str(other))) == [cirq.X, cirq.LineQubit(1)]
+
+
+def test_json_lines_file_objects():
+    buffer = io.StringIO()
+    objs = [cirq.X, cirq.Circuit(cirq.H(cirq.LineQubit(0))), [1, 2], None]
+    assert cirq.to_json_lines(iter(objs), buffer) == 4
+    text = buffer.getvalue()
+    assert text.count('\n') == 4
+    assert cirq.read_json(json_text=text.splitlines()[1]) == objs[1]
+
+    buffer = io.StringIO(text + '\n  \n')
+    assert list(cirq.read_json_lines(buffer)) == objs
+
+
+def test_json_lines_context_serialization():
+    sbki = SBKImpl('sbki', data_list=[1, 2])
+    objs = [[sbki, sbki], [SBKImpl('other'), sbki]]
+    buffer = io.StringIO()
+    cirq.to_json_lines(objs, buffer)
+    buffer.seek(0)
+    resolvers = [lambda name: SBKImpl if name == 'SBKImpl' else None] + cirq.DEFAULT_RESOLVERS
+    loaded = list(cirq.read_json_lines(buffer, resolvers=resolvers))
+    assert loaded == objs
+    assert loaded[0][0] is loaded[0][1]
+
+
 def _eval_repr_data_file(path: pathlib.Path):
     return eval(
         path.read_text(),
@@ -19,15 +19,21 @@ from typing import Any, Dict, Iterator, List, TYPE_CHECKING, Tuple, Type, Union
 
 import numpy as np
 
-from cirq import circuits, ops, protocols, qis, study, value, devices
+from cirq import circuits, linalg, ops, protocols, qis, study, value, devices
 from cirq.sim import density_matrix_utils, simulator
-from cirq.sim.simulator import check_all_resolved
+from cirq.sim.simulator import check_all_resolved, _resolve_unless_resolved
 
 if TYPE_CHECKING:
     from typing import Tuple
     import cirq
 
 
+# Repeated CircuitOperations acting on a Hilbert space of at most this
+# dimension are applied through their superoperator raised to the number of
+# repetitions, instead of being decomposed into one copy per repetition.
+_MAX_SUPEROPERATOR_DIMENSION = 2 ** 5
+
+
 class _StateAndBuffers:
     def __init__(self, num_qubits: int, tensor: np.ndarray):
         self.num_qubits = num_qubits
@@ -164,8 +170,7 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
     ) -> Dict[str, np.ndarray]:
         """See definition in `cirq.SimulatesSamples`."""
-        param_resolver = param_resolver or study.ParamResolver({})
-        resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
+        resolved_circuit = _resolve_unless_resolved(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
 
         if circuit.are_all_measurements_terminal():
@@ -256,10 +261,15 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
             )
 
         def keep(potential_op: ops.Operation) -> bool:
-            return protocols.has_channel(potential_op, allow_decompose=False) or isinstance(
-                potential_op.gate, ops.MeasurementGate
+            return (
+                protocols.has_channel(potential_op, allow_decompose=False)
+                or isinstance(potential_op.gate, ops.MeasurementGate)
+                or _is_repeated_channel_circuit_op(potential_op)
             )
 
+        # Superoperators of repeated CircuitOperations, computed on first use.
+        superoperators: Dict['cirq.CircuitOperation', np.ndarray] = {}
+
         noisy_moments = self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
 
         for moment in noisy_moments:
@@ -298,6 +308,19 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
                         ]
                         key = protocols.measurement_key(meas)
                         measurements[key].extend(corrected)
+                elif isinstance(op, circuits.CircuitOperation) and not protocols.has_channel(
+                    op, allow_decompose=False
+                ):
+                    if op not in superoperators:
+                        superoperators[op] = self._repeated_superoperator(op)
+                    result = linalg.targeted_left_multiply(
+                        superoperators[op],
+                        state.tensor,
+                        target_axes=indices + [e + state.num_qubits for e in indices],
+                        out=state.buffers[0],
+                    )
+                    state.buffers[0] = state.tensor
+                    state.tensor = result
                 else:
                     self._apply_op_channel(op, state, indices)
             yield DensityMatrixStepResult(
@@ -307,6 +330,34 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
                 dtype=self._dtype,
             )
 
+    def _repeated_superoperator(self, op: 'cirq.CircuitOperation') -> np.ndarray:
+        """The superoperator of a repeated CircuitOperation.
+
+        The superoperator of a single repetition is computed by applying the
+        operations of the circuit to the identity superoperator, and is then
+        raised to the number of repetitions by repeated squaring.
+
+        Returns:
+            A tensor with shape `qid_shape * 4` where the first half of the
+            axes index the output and the second half the input density matrix
+            (each as row axes followed by column axes).
+        """
+        qid_shape = protocols.qid_shape(op)
+        dim = int(np.prod(qid_shape, dtype=np.int64))
+        qubit_map = {q: i for i, q in enumerate(op.qubits)}
+        identity = np.eye(dim * dim, dtype=self._dtype).reshape(qid_shape * 4)
+        superoperator = _StateAndBuffers(len(qid_shape), identity)
+        for sub_op in protocols.decompose(
+            op.replace(repetitions=1),
+            keep=lambda e: protocols.has_channel(e, allow_decompose=False),
+        ):
+            indices = [qubit_map[qubit] for qubit in sub_op.qubits]
+            self._apply_op_channel(sub_op, superoperator, indices)
+        matrix = np.linalg.matrix_power(
+            superoperator.tensor.reshape(dim * dim, dim * dim), op.repetitions
+        )
+        return matrix.reshape(qid_shape * 4)
+
     def _create_simulator_trial_result(
         self,
         params: study.ParamResolver,
@@ -318,6 +369,17 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         )
 
 
+def _is_repeated_channel_circuit_op(op: ops.Operation) -> bool:
+    """Whether op is a small, repeated CircuitOperation made up of channels."""
+    return (
+        isinstance(op, circuits.CircuitOperation)
+        and op.repetitions > 1
+        and np.prod(protocols.qid_shape(op), dtype=np.int64) <= _MAX_SUPEROPERATOR_DIMENSION
+        and not protocols.is_measurement(op.circuit)
+        and protocols.has_channel(op.replace(repetitions=1))
+    )
+
+
 class DensityMatrixStepResult(simulator.StepResult):
     """A single step in the simulation of the DensityMatrixSimulator.
 
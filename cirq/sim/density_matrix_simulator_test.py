@@ -1310,3 +1310,40 @@ def test_final_density_matrix_is_not_last_object():
     assert result.final_density_matrix is not initial_state
     assert not np.shares_memory(result.final_density_matrix, initial_state)
     np.testing.assert_equal(result.final_density_matrix, initial_state)
+
+
+def test_simulate_repeated_noisy_circuit_operation():
+    a, b = cirq.LineQubit.range(2)
+    subcircuit = cirq.FrozenCircuit(
+        cirq.H(a), cirq.CX(a, b), cirq.amplitude_damp(0.1).on(b), cirq.depolarize(0.05).on(a)
+    )
+    op = cirq.CircuitOperation(subcircuit).repeat(25)
+    circuit = cirq.Circuit(cirq.X(b), op)
+    expected = cirq.Circuit(cirq.X(b), cirq.decompose_once(op))
+
+    simulator = cirq.DensityMatrixSimulator()
+    np.testing.assert_allclose(
+        simulator.simulate(circuit).final_density_matrix,
+        simulator.simulate(expected).final_density_matrix,
+        atol=1e-6,
+    )
+
+
+def test_simulate_repeated_unitary_circuit_operation():
+    q = cirq.LineQubit.range(3)
+    subcircuit = cirq.FrozenCircuit(cirq.X(q[0]) ** 0.1, cirq.CZ(q[0], q[1]), cirq.H(q[1]))
+    op = cirq.CircuitOperation(subcircuit).with_qubits(q[2], q[1]).repeat(10 ** 6)
+    circuit = cirq.Circuit(cirq.H(q[0]), op, cirq.measure(*q, key='m'))
+
+    u = np.linalg.matrix_power(cirq.unitary(subcircuit), 10 ** 6)
+    expected = cirq.Circuit(cirq.H(q[0]), cirq.MatrixGate(u).on(q[2], q[1]))
+    result = cirq.DensityMatrixSimulator().simulate(circuit[:-1])
+    np.testing.assert_allclose(
+        result.final_density_matrix,
+        cirq.final_density_matrix(expected, qubit_order=q),
+        atol=1e-6,
+    )
+    assert cirq.DensityMatrixSimulator().run(circuit, repetitions=3).measurements['m'].shape == (
+        3,
+        3,
+    )
@@ -85,9 +85,13 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         _verify_unique_measurement_keys(program)
 
         trial_results = []  # type: List[study.Result]
+        # Resolve only the parameterized operations of the program per point.
+        template = circuits.CircuitTemplate(program)
         for param_resolver in study.to_resolvers(params):
             measurements = self._run(
-                circuit=program, param_resolver=param_resolver, repetitions=repetitions
+                circuit=template.resolve(param_resolver),
+                param_resolver=param_resolver,
+                repetitions=repetitions,
             )
             trial_results.append(
                 study.Result.from_single_parameter_set(
@@ -102,6 +106,11 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
     ) -> Dict[str, np.ndarray]:
         """Run a simulation, mimicking quantum hardware.
 
+        When called from `run_sweep`, `circuit` has already been resolved
+        with `param_resolver`, so implementations need not resolve it again.
+        `param_resolver` is still passed for implementations which use it
+        otherwise, and resolving the circuit with it again is harmless.
+
         Args:
             circuit: The circuit to simulate.
             param_resolver: Parameters to run with the program.
@@ -402,9 +411,10 @@ class SimulatesIntermediateState(SimulatesFinalState, metaclass=abc.ABCMeta):
         """
         trial_results = []
         qubit_order = ops.QubitOrder.as_qubit_order(qubit_order)
+        template = circuits.CircuitTemplate(program)
         for param_resolver in study.to_resolvers(params):
             all_step_results = self.simulate_moment_steps(
-                program, param_resolver, qubit_order, initial_state
+                template.resolve(param_resolver), param_resolver, qubit_order, initial_state
             )
             measurements = {}  # type: Dict[str, np.ndarray]
             for step_result in all_step_results:
@@ -481,8 +491,7 @@ class SimulatesIntermediateState(SimulatesFinalState, metaclass=abc.ABCMeta):
         Yields:
             StepResults from simulating a Moment of the Circuit.
         """
-        param_resolver = param_resolver or study.ParamResolver({})
-        resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
+        resolved_circuit = _resolve_unless_resolved(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
         actual_initial_state = 0 if initial_state is None else initial_state
         return self._base_iterator(resolved_circuit, qubit_order, actual_initial_state)
@@ -748,6 +757,15 @@ def _verify_unique_measurement_keys(circuit: circuits.Circuit):
             raise ValueError('Measurement key {} repeated'.format(",".join(duplicates)))
 
 
+def _resolve_unless_resolved(
+    circuit: 'cirq.Circuit', param_resolver: 'cirq.ParamResolverOrSimilarType'
+) -> 'cirq.Circuit':
+    """Resolves `circuit`, skipping the copy if it has no parameters left."""
+    if not protocols.is_parameterized(circuit):
+        return circuit
+    return protocols.resolve_parameters(circuit, param_resolver)
+
+
 def check_all_resolved(circuit):
     """Raises if the circuit contains unresolved symbols."""
     if protocols.is_parameterized(circuit):
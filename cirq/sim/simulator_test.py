@@ -15,6 +15,7 @@
 
 from unittest import mock
 import numpy as np
+import sympy
 import pytest
 
 import cirq
@@ -26,6 +27,7 @@ def test_run_simulator_run():
     expected_measurements = {'a': np.array([[1]])}
     simulator._run.return_value = expected_measurements
     circuit = mock.Mock(cirq.Circuit)
+    circuit.moments = []
     circuit.__iter__ = mock.Mock(return_value=iter([]))
     param_resolver = mock.Mock(cirq.ParamResolver)
     param_resolver.param_dict = {}
@@ -46,6 +48,7 @@ def test_run_simulator_sweeps():
     expected_measurements = {'a': np.array([[1]])}
     simulator._run.return_value = expected_measurements
     circuit = mock.Mock(cirq.Circuit)
+    circuit.moments = []
     circuit.__iter__ = mock.Mock(return_value=iter([]))
     param_resolvers = [mock.Mock(cirq.ParamResolver), mock.Mock(cirq.ParamResolver)]
     for resolver in param_resolvers:
@@ -65,6 +68,23 @@ def test_run_simulator_sweeps():
     assert simulator._run.call_count == 2
 
 
+def test_run_sweep_passes_resolved_circuit_and_resolver():
+    class ResolverSampler(cirq.SimulatesSamples):
+        """Reads the parameter from the resolver rather than the circuit."""
+
+        def _run(self, circuit, param_resolver, repetitions):
+            assert not cirq.is_parameterized(circuit)
+            assert cirq.resolve_parameters(circuit, param_resolver) == circuit
+            value = int(param_resolver.value_of('t'))
+            return {'m': np.full((repetitions, 1), value, dtype=np.uint8)}
+
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+    results = ResolverSampler().run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=2)
+    assert [r.measurements['m'].tolist() for r in results] == [[[0], [0]], [[1], [1]]]
+    assert [r.params for r in results] == list(cirq.to_resolvers(cirq.Points('t', [0, 1])))
+
+
 @mock.patch.multiple(
     cirq.SimulatesIntermediateState, __abstractmethods__=set(), _simulator_iterator=mock.Mock()
 )
@@ -84,6 +104,7 @@ def test_intermediate_simulator():
 
     simulator._simulator_iterator.side_effect = steps
     circuit = mock.Mock(cirq.Circuit)
+    circuit.moments = []
     param_resolver = mock.Mock(cirq.ParamResolver)
     param_resolver.param_dict = {}
     qubit_order = mock.Mock(cirq.QubitOrder)
@@ -113,6 +134,7 @@ def test_intermediate_sweeps():
 
     simulator._simulator_iterator.side_effect = steps
     circuit = mock.Mock(cirq.Circuit)
+    circuit.moments = []
     param_resolvers = [mock.Mock(cirq.ParamResolver), mock.Mock(cirq.ParamResolver)]
     for resolver in param_resolvers:
         resolver.param_dict = {}
@@ -38,7 +38,7 @@ from cirq.sim import (
     state_vector_simulator,
     act_on_state_vector_args,
 )
-from cirq.sim.simulator import check_all_resolved
+from cirq.sim.simulator import check_all_resolved, _resolve_unless_resolved
 
 if TYPE_CHECKING:
     import cirq
@@ -165,8 +165,7 @@ class Simulator(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
     ) -> Dict[str, np.ndarray]:
         """See definition in `cirq.SimulatesSamples`."""
-        param_resolver = param_resolver or study.ParamResolver({})
-        resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
+        resolved_circuit = _resolve_unless_resolved(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
         qubit_order = sorted(resolved_circuit.all_qubits())
 
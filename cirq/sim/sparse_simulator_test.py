@@ -1227,3 +1227,27 @@ def test_final_state_vector_is_not_last_object():
     assert result.state_vector() is not initial_state
     assert not np.shares_memory(result.state_vector(), initial_state)
     np.testing.assert_equal(result.state_vector(), initial_state)
+
+
+def test_simulate_repeated_circuit_operation():
+    q = cirq.LineQubit.range(3)
+    subcircuit = cirq.FrozenCircuit(cirq.X(q[0]) ** 0.1, cirq.CZ(q[0], q[1]), cirq.H(q[1]))
+    op = cirq.CircuitOperation(subcircuit).with_qubits(q[2], q[1]).repeat(10 ** 6)
+    circuit = cirq.Circuit(cirq.H(q[0]), op)
+
+    u = np.linalg.matrix_power(cirq.unitary(subcircuit), 10 ** 6)
+    expected = cirq.Circuit(cirq.H(q[0]), cirq.MatrixGate(u).on(q[2], q[1]))
+    np.testing.assert_allclose(
+        cirq.Simulator().simulate(circuit, qubit_order=q).final_state_vector,
+        cirq.final_state_vector(expected, qubit_order=q),
+        atol=1e-6,
+    )
+
+    small = cirq.Circuit(cirq.H(q[0]), op.replace(repetitions=5))
+    np.testing.assert_allclose(
+        cirq.Simulator().simulate(small, qubit_order=q).final_state_vector,
+        cirq.Simulator()
+        .simulate(cirq.Circuit(cirq.decompose(small)), qubit_order=q)
+        .final_state_vector,
+        atol=1e-6,
+    )
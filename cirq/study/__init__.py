@@ -44,6 +44,7 @@ from cirq.study.sweeps import (
     Zip,
     dict_to_product_sweep,
     dict_to_zip_sweep,
+    resolve_values_over_sweep,
 )
 
 from cirq.study.result import (
@@ -342,14 +342,18 @@ class ExpressionMap(dict):
             sweep: The sweep to transform.
         """
         sweep = sweepable.to_sweep(sweep)
-        param_list = []
-        for r in sweep:
-            param_dict = {}
-            for formula, sym in self.items():
-                if isinstance(sym, (sympy.Symbol, str)):
-                    param_dict[str(sym)] = protocols.resolve_parameters(formula, r)
-            param_list.append(param_dict)
-        return sweeps.ListSweep(param_list)
+        formulas = {
+            formula: str(sym)
+            for formula, sym in self.items()
+            if isinstance(sym, (sympy.Symbol, str))
+        }
+        if not formulas:
+            return sweeps.ListSweep([{}] * len(sweep))
+        # Evaluate each formula over all points of the sweep at once.
+        values = sweeps.resolve_values_over_sweep(formulas, sweep)
+        names = list(formulas.values())
+        columns = [values[formula].tolist() for formula in formulas]
+        return sweeps.ListSweep([dict(zip(names, row)) for row in zip(*columns)])
 
     def transform_params(
         self, params: resolver.ParamResolverOrSimilarType
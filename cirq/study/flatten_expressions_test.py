@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import sympy
 import cirq
 from cirq.study import flatten_expressions
@@ -169,6 +170,33 @@ def test_transformed_sweep():
     assert params[1] == (('x0', 1 / 4), ('x1', 1 - 1 / 2))
 
 
+def test_transformed_sweep_is_columnar():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    sweep = cirq.Linspace('a', start=0, stop=1, length=3) * cirq.Points('b', [1, 2])
+    expr_map = cirq.ExpressionMap({sympy.sin(a) * b: 'x0', a + sympy.Symbol('c'): 'x1', b: 3})
+    transformed = expr_map.transform_sweep(sweep)
+    assert isinstance(transformed, cirq.ListSweep)
+    assert transformed == cirq.ListSweep(
+        [
+            {'x0': np.sin(a) * b, 'x1': a + sympy.Symbol('c')}
+            for a in [0.0, 0.5, 1.0]
+            for b in [1, 2]
+        ]
+    )
+
+    assert cirq.ExpressionMap({a: 3}).transform_sweep(sweep) == cirq.ListSweep([{}] * 6)
+
+
+def test_transformed_heterogeneous_list_sweep():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    sweep = cirq.ListSweep([{'a': 1}, {'a': 2, 'b': 3}, {'a': 'b', 'b': 0.5}])
+    expr_map = cirq.ExpressionMap({a * b: 'x0', sympy.sin(a): 'x1'})
+    assert expr_map.transform_sweep(sweep) == cirq.ListSweep(
+        [{'x0': r.value_of(a * b), 'x1': r.value_of(sympy.sin(a))} for r in sweep]
+    )
+    assert expr_map.transform_sweep(sweep)[0].value_of('x0') == b
+
+
 def test_transformed_sweep_equality():
     a = sympy.Symbol('a')
     sweep = cirq.Linspace('a', start=0, stop=3, length=4)
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 """Resolves ParameterValues to assigned values."""
+import functools
 import numbers
-from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING, Union, cast
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TYPE_CHECKING, Union, cast
 import numpy as np
 import sympy
 from sympy.core import numbers as sympy_numbers
@@ -34,6 +35,10 @@ document(
     """Something that can be used to turn parameters into values.""",
 )
 
+# Upper bound on the number of distinct sympy expressions whose compiled
+# numeric forms are kept around between resolutions.
+_MAX_COMPILED_EXPRESSIONS = 4096
+
 
 class ParamResolver:
     """Resolves parameters to actual values.
@@ -147,6 +152,13 @@ class ParamResolver:
             # No known way to resolve this variable, return unchanged.
             return value
 
+        # Formulas whose symbols all resolve to numbers are evaluated with a
+        # compiled numpy function instead of sympy substitution.
+        if not isinstance(value, sympy.Symbol):
+            v = self._value_of_compiled(value, recursive)
+            if v is not None:
+                return v
+
         # Input is either a sympy formula or the dictionary maps to a
         # formula.  Use sympy to resolve the value.
         # Note that sympy.subs() is slow, so we want to avoid this and
@@ -181,6 +193,37 @@ class ParamResolver:
             self._deep_eval_map[value] = self.value_of(v, recursive)
         return self._deep_eval_map[value]
 
+    def _value_of_compiled(self, value: sympy.Basic, recursive: bool) -> Optional[complex]:
+        """Evaluates a formula numerically, or returns None if that fails.
+
+        None is also returned when the result is not a finite number, so that
+        these cases are resolved by sympy exactly as before.
+        """
+        compiled = compile_expression(value)
+        if compiled is None:
+            return None
+        symbols, func = compiled
+        args = []
+        for symbol in symbols:
+            if recursive:
+                arg = self.value_of(symbol, recursive)
+            else:
+                arg = self.param_dict.get(symbol, self.param_dict.get(symbol.name))
+                arg = _sympy_pass_through(arg)
+            if not isinstance(arg, numbers.Number) or isinstance(arg, sympy.Basic):
+                return None
+            args.append(arg)
+        # Results outside the real domain of a function (e.g. log(-1)) or
+        # overflowing it are left to sympy, which handles complex values.
+        try:
+            with np.errstate(all='raise'):
+                result = _to_python_number(func(*args))
+        except (ArithmeticError, TypeError, ValueError):
+            return None
+        if not np.isfinite(result):
+            return None
+        return result
+
     def _resolve_parameters_(
         self, param_resolver: 'ParamResolver', recursive: bool
     ) -> 'ParamResolver':
@@ -245,3 +288,36 @@ def _sympy_pass_through(val: Any) -> Optional[Any]:
     if val == sympy.pi:
         return np.pi
     return None
+
+
+def _to_python_number(val: Any) -> Union[float, complex]:
+    v = complex(val)
+    return v if v.imag else v.real
+
+
+@functools.lru_cache(maxsize=_MAX_COMPILED_EXPRESSIONS)
+def compile_expression(
+    expr: sympy.Basic,
+) -> Optional[Tuple[Tuple[sympy.Symbol, ...], Callable[..., Any]]]:
+    """Compiles a sympy expression into a vectorized numpy function.
+
+    Compiled forms are cached per distinct expression, so repeated resolution
+    of the same formula (e.g. across the points of a sweep, or across sweeps)
+    only pays for the sympy compilation once.
+
+    Args:
+        expr: The sympy expression to compile.
+
+    Returns:
+        A tuple `(symbols, func)` where `symbols` are the free symbols of the
+        expression sorted by name and `func(*values)` evaluates the expression
+        with `values` substituted positionally for `symbols`. The values may be
+        numbers or numpy arrays, in which case the result is broadcast. Returns
+        None if the expression cannot be compiled.
+    """
+    symbols = tuple(sorted(expr.free_symbols, key=lambda s: s.name))
+    try:
+        func = sympy.lambdify(symbols, expr, modules='numpy', dummify=True)
+    except Exception:
+        return None
+    return symbols, func
@@ -129,6 +129,39 @@ def test_value_of_calculations():
     assert r.value_of(sympy.Symbol('b') / 0.1 - sympy.Symbol('a')) == 0.5
 
 
+def test_value_of_compiled_formulas():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    r = cirq.ParamResolver({'a': 0.5, b: 2, 'c': 'b'})
+
+    assert np.isclose(r.value_of(sympy.sin(a * sympy.pi)), 1)
+    assert np.isclose(r.value_of(sympy.exp(sympy.I * sympy.pi * a)), 1j)
+    assert isinstance(r.value_of(sympy.cos(a)), float)
+    assert r.value_of(sympy.Mod(b + 1, 2)) == 1
+    assert r.value_of(sympy.sin(sympy.Symbol('c'))) == np.sin(2)
+    assert r.value_of(sympy.sin(sympy.Symbol('c')), recursive=False) == sympy.sin(b)
+    assert r.value_of(sympy.sin(sympy.Symbol('d'))) == sympy.sin(sympy.Symbol('d'))
+
+
+def test_value_of_compiled_formulas_outside_real_domain():
+    a = sympy.Symbol('a')
+    r = cirq.ParamResolver({'a': 1})
+
+    assert np.isclose(r.value_of(sympy.log(a - 2)), np.pi * 1j)
+    assert np.isclose(r.value_of(sympy.asin(a + 1)), np.pi / 2 - np.log(2 + np.sqrt(3)) * 1j)
+    assert np.isclose(r.value_of(sympy.acos(2 * a)), np.log(2 + np.sqrt(3)) * 1j)
+    assert np.isnan(cirq.ParamResolver({'a': 0}).value_of(sympy.log(a)))
+    assert cirq.ParamResolver({'a': 1000.0}).value_of(sympy.exp(a)) == np.inf
+
+
+def test_compile_expression_is_cached():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    compiled = cirq.study.resolver.compile_expression(sympy.sin(b) + a)
+    assert compiled is cirq.study.resolver.compile_expression(sympy.sin(b) + a)
+    symbols, func = compiled
+    assert symbols == (a, b)
+    np.testing.assert_allclose(func(np.array([1, 2]), 0), [1, 2])
+
+
 def test_param_dict():
     r = cirq.ParamResolver({'a': 0.5, 'b': 0.1})
     r2 = cirq.ParamResolver(r)
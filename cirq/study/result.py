@@ -109,8 +109,14 @@ class Result:
                 measurements.
         """
         self.params = params
+        self._measurements: Optional[Dict[str, np.ndarray]] = measurements
+        self._packed_measurements: Optional[Dict[str, np.ndarray]] = None
+
+        # These variables are derived from the measurements when first needed.
+        self._qubit_counts: Optional[Dict[str, int]] = None
         self._data: Optional[pd.DataFrame] = None
-        self._measurements = measurements
+        self._integer_columns: Dict[str, np.ndarray] = {}
+        self._histograms: Dict[Tuple[str, ...], collections.Counter] = {}
 
     @property
     def data(self) -> pd.DataFrame:
@@ -118,8 +124,9 @@ class Result:
             # Convert to a DataFrame with columns as measurement keys, rows as
             # repetitions and a big endian integer for individual measurements.
             converted_dict = {}
-            for key, val in self._measurements.items():
-                converted_dict[key] = [value.big_endian_bits_to_int(m_vals) for m_vals in val]
+            for key in self._measured_qubit_counts():
+                column = self._integer_column(key)
+                converted_dict[key] = list(column) if column.dtype == object else column
             # Note that when a numpy array is produced from this data frame,
             # Pandas will try to use np.int64 as dtype, but will upgrade to
             # object if any value is too large to fit.
@@ -144,13 +151,151 @@ class Result:
         """
         return Result(params=params, measurements=measurements)
 
+    @staticmethod
+    def from_packed_measurements(
+        *,  # Forces keyword args.
+        params: resolver.ParamResolver,
+        packed_measurements: Dict[str, np.ndarray],
+        qubit_counts: Dict[str, int],
+    ) -> 'Result':
+        """Creates a Result that stores its measurements as packed bits.
+
+        Such a result uses an eighth of the memory of one storing a byte per
+        measured bit. Its histograms and `data` are computed directly from
+        the packed bits; the `measurements` property unpacks them (as uint8
+        arrays) on first access.
+
+        Args:
+            params: A ParamResolver of settings used for this result.
+            packed_measurements: A dictionary from measurement gate key to
+                measurement results, with the bits of each repetition packed
+                big-endian into bytes as by `np.packbits(bits, axis=1)`. The
+                first index runs over the repetitions and the second over the
+                bytes for the corresponding measurement.
+            qubit_counts: A dictionary from measurement gate key to the number
+                of qubits measured, i.e. the number of valid bits in each row
+                of the packed array.
+
+        Raises:
+            ValueError: The packed measurements do not match the qubit counts.
+        """
+        if packed_measurements.keys() != qubit_counts.keys():
+            raise ValueError(
+                'Packed measurements and qubit counts have different keys: '
+                f'{sorted(packed_measurements)} != {sorted(qubit_counts)}'
+            )
+        for key, packed in packed_measurements.items():
+            num_bytes = (qubit_counts[key] + 7) // 8
+            if packed.ndim != 2 or packed.shape[1] != num_bytes or packed.dtype != np.uint8:
+                raise ValueError(
+                    f'Packed measurements for key {key!r} should be a uint8 array with '
+                    f'{num_bytes} bytes per repetition, but got {packed.dtype} array '
+                    f'with shape {packed.shape}.'
+                )
+        result = Result(params=params, measurements={})
+        result._measurements = None
+        result._packed_measurements = dict(packed_measurements)
+        result._qubit_counts = dict(qubit_counts)
+        return result
+
     @property
     def measurements(self) -> Dict[str, np.ndarray]:
+        """A dictionary from measurement gate key to measurement results.
+
+        Once histograms, `data` or the packed measurements have been computed
+        from them, which are cached, these are read-only copies of the arrays
+        given to the constructor.
+        """
+        if self._measurements is None:
+            self._measurements = {
+                key: np.unpackbits(packed, axis=1)[:, : self._measured_qubit_counts()[key]]
+                for key, packed in self.packed_measurements.items()
+            }
+            self._freeze_measurements()
         return self._measurements
 
+    @property
+    def packed_measurements(self) -> Dict[str, np.ndarray]:
+        """The measurements with the bits of each repetition packed into bytes.
+
+        Each value is the uint8 array `np.packbits(bits, axis=1)` of the bits
+        in `measurements`, where any non-zero digit counts as a set bit.
+        """
+        if self._packed_measurements is None:
+            self._packed_measurements = {
+                key: np.packbits(np.asarray(digits) != 0, axis=1)
+                for key, digits in self.measurements.items()
+            }
+            self._freeze_measurements()
+        return self._packed_measurements
+
+    def _freeze_measurements(self) -> None:
+        """Replaces the measurement arrays by read-only ones.
+
+        This is done once values derived from the measurements, like the
+        packed bits or histograms, are cached, so that the cached values cannot
+        go stale by modifying the arrays in place. Writable arrays are copied
+        first, so the arrays given to the constructor stay writable.
+        """
+        if self._measurements is not None:
+            self._measurements = _read_only(self._measurements)
+        if self._packed_measurements is not None:
+            self._packed_measurements = _read_only(self._packed_measurements)
+
     @property
     def repetitions(self) -> int:
-        return self.data.shape[0]
+        arrays = self._measurements or self._packed_measurements or {}
+        for array in arrays.values():
+            return len(array)
+        return 0
+
+    def _measured_qubit_counts(self) -> Dict[str, int]:
+        """Returns the number of qubits measured for each key."""
+        if self._qubit_counts is None:
+            self._qubit_counts = {k: np.shape(v)[1] for k, v in self.measurements.items()}
+        return self._qubit_counts
+
+    def _integer_column(self, key: str) -> np.ndarray:
+        """Returns the big endian integers measured for the given key.
+
+        The result is an int64 array, or an object array of Python ints if
+        more than 63 qubits were measured.
+        """
+        column = self._integer_columns.get(key)
+        if column is None:
+            self._freeze_measurements()
+            column = _packed_bits_to_big_endian_ints(
+                self.packed_measurements[key], self._measured_qubit_counts()[key]
+            )
+            self._integer_columns[key] = column
+        return column
+
+    def _integer_histogram(self, keys: Tuple[str, ...]) -> collections.Counter:
+        """Counts the combined big endian integer results of measurements."""
+        counts = self._histograms.get(keys)
+        if counts is None:
+            columns = [self._integer_column(key) for key in keys]
+            bit_counts = [self._measured_qubit_counts()[key] for key in keys]
+            if not keys:
+                counts = collections.Counter({(): self.repetitions} if self.repetitions else {})
+            elif sum(bit_counts) < 64:
+                # Concatenate the bits of all keys into one integer per
+                # repetition, count those and split them up again.
+                combined = np.zeros(self.repetitions, dtype=np.int64)
+                for column, bit_count in zip(columns, bit_counts):
+                    combined = (combined << bit_count) | column
+                values, value_counts = _count_integers(combined, sum(bit_counts))
+                split = []
+                for bit_count in reversed(bit_counts):
+                    split.append(values & ((1 << bit_count) - 1))
+                    values = values >> bit_count
+                counts = collections.Counter(
+                    dict(zip(zip(*(c.tolist() for c in reversed(split))), value_counts.tolist()))
+                )
+            else:
+                counts = collections.Counter(zip(*(column.tolist() for column in columns)))
+            self._histograms[keys] = counts
+        return counts
 
     # Reason for 'type: ignore': https://github.com/python/mypy/issues/5273
     def multi_measurement_histogram(  # type: ignore
@@ -204,14 +349,19 @@ class Result:
             results.
         """
         fixed_keys = tuple(_key_to_str(key) for key in keys)
-        samples = zip(
-            *(self.measurements[sub_key] for sub_key in fixed_keys)
-        )  # type: Iterable[Any]
-        if len(fixed_keys) == 0:
-            samples = [()] * self.repetitions
+        if fold_func is _tuple_of_big_endian_int:
+            return collections.Counter(self._integer_histogram(fixed_keys))
+
+        # Fold each distinct combination of results once, and weight it by the
+        # number of repetitions it occurred in.
+        arrays = [self.measurements[sub_key] for sub_key in fixed_keys]
         c = collections.Counter()  # type: collections.Counter
-        for sample in samples:
-            c[fold_func(sample)] += 1
+        if len(fixed_keys) == 0:
+            if self.repetitions:
+                c[fold_func(())] += self.repetitions
+            return c
+        for index, count in zip(*_unique_rows(arrays)):
+            c[fold_func(tuple(array[index] for array in arrays))] += count
         return c
 
     # Reason for 'type: ignore': https://github.com/python/mypy/issues/5273
@@ -257,6 +407,9 @@ class Result:
             A counter indicating how often a measurement sampled various
             results.
         """
+        if fold_func is value.big_endian_bits_to_int:
+            counts = self._integer_histogram((_key_to_str(key),))
+            return collections.Counter({k: v for (k,), v in counts.items()})
         return self.multi_measurement_histogram(keys=[key], fold_func=lambda e: fold_func(e[0]))
 
     def __repr__(self) -> str:
@@ -287,7 +440,7 @@ class Result:
         return self.data.equals(other.data) and self.params == other.params
 
     def _measurement_shape(self):
-        return self.params, {k: v.shape[1] for k, v in self.measurements.items()}
+        return self.params, self._measured_qubit_counts()
 
     def __add__(self, other: 'cirq.Result') -> 'cirq.Result':
         if not isinstance(other, type(self)):
@@ -297,6 +450,15 @@ class Result:
                 'TrialResults do not have the same parameters or do '
                 'not have the same measurement keys.'
             )
+        if self._measurements is None and other._measurements is None:
+            return Result.from_packed_measurements(
+                params=self.params,
+                packed_measurements={
+                    key: np.append(packed, other.packed_measurements[key], axis=0)
+                    for key, packed in self.packed_measurements.items()
+                },
+                qubit_counts=self._measured_qubit_counts(),
+            )
         all_measurements: Dict[str, np.ndarray] = {}
         for key in other.measurements:
             all_measurements[key] = np.append(
@@ -320,11 +482,21 @@ class Result:
             'measurements': packed_measurements,
         }
 
+    def _binary_json_dict_(self):
+        return {
+            'cirq_type': self.__class__.__name__,
+            'params': self.params,
+            'measurements': {key: _raw_digits(digits) for key, digits in self.measurements.items()},
+        }
+
     @classmethod
     def _from_json_dict_(cls, params, measurements, **kwargs):
         return cls(
             params=params,
-            measurements={key: _unpack_digits(**val) for key, val in measurements.items()},
+            measurements={
+                key: _unpack_digits(**val) if 'packed_digits' in val else _unpack_raw_digits(**val)
+                for key, val in measurements.items()
+            },
         )
 
 
@@ -333,6 +505,72 @@ class TrialResult(Result):
     pass
 
 
+def _read_only(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Returns the arrays, with read-only copies of the writable ones."""
+    frozen = {}
+    for key, array in arrays.items():
+        if isinstance(array, np.ndarray) and array.flags.writeable:
+            array = array.copy()
+            array.setflags(write=False)
+        frozen[key] = array
+    return frozen
+
+
+def _packed_bits_to_big_endian_ints(packed: np.ndarray, bit_count: int) -> np.ndarray:
+    """Returns the big endian integers of rows of bits packed into bytes.
+
+    Args:
+        packed: A uint8 array of shape (rows, ceil(bit_count / 8)), as
+            returned by `np.packbits(bits, axis=1)`.
+        bit_count: The number of bits in each row.
+
+    Returns:
+        An int64 array with one integer per row, or an object array of Python
+        ints if the integers may not fit in an int64.
+    """
+    rows, num_bytes = packed.shape
+    if bit_count == 0:
+        return np.zeros(rows, dtype=np.int64)
+    if bit_count < 64:
+        # Read the bits of each row as a big endian 64 bit integer, and drop
+        # the padding at the end.
+        padded = np.zeros((rows, 8), dtype=np.uint8)
+        padded[:, :num_bytes] = packed
+        ints = padded.view('>u8')[:, 0] >> np.uint64(64 - bit_count)
+        return ints.astype(np.int64)
+    shift = 8 * num_bytes - bit_count
+    return np.array([int.from_bytes(row.tobytes(), 'big') >> shift for row in packed], dtype=object)
+
+
+def _count_integers(values: np.ndarray, bit_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the distinct non-negative integers of `bit_count` bits in an
+    array, and the number of times each occurs."""
+    if bit_count <= 16:
+        counts = np.bincount(values, minlength=1 << bit_count)
+        distinct = np.flatnonzero(counts)
+        return distinct, counts[distinct]
+    return np.unique(values, return_counts=True)
+
+
+def _unique_rows(arrays: Sequence[np.ndarray]) -> Tuple[Sequence[int], Sequence[int]]:
+    """Finds the distinct rows across side by side 2-D arrays.
+
+    Returns:
+        The index of a representative of each distinct row, and the number of
+        times each distinct row occurs.
+    """
+    rows = arrays[0].shape[0]
+    if rows == 0:
+        return [], []
+    if not all(a.dtype.kind in 'biu' for a in arrays):
+        return range(rows), [1] * rows
+    combined = np.concatenate([a.reshape(rows, -1) for a in arrays], axis=1)
+    if combined.shape[1] == 0:
+        return [0], [rows]
+    _, indices, counts = np.unique(combined, axis=0, return_index=True, return_counts=True)
+    return indices.tolist(), counts.tolist()
+
+
 def _pack_digits(digits: np.ndarray, pack_bits: str = 'auto') -> Tuple[str, bool]:
     """Returns a string of packed digits and a boolean indicating whether the
     digits were packed as binary values.
@@ -398,6 +636,20 @@ def _unpack_digits(
     return digits
 
 
+def _raw_digits(digits: np.ndarray) -> Dict[str, Any]:
+    """The counterpart of `_pack_digits` for `cirq.to_json_binary`.
+
+    The array is kept as is, so that it is stored as a raw buffer if it is
+    large enough, and otherwise as a list.
+    """
+    return {'digits': digits, 'dtype': digits.dtype.str, 'shape': digits.shape}
+
+
+def _unpack_raw_digits(digits: Any, dtype: str, shape: Sequence[int]) -> np.ndarray:
+    """The opposite of `_raw_digits`."""
+    return np.asarray(digits, dtype=dtype).reshape(shape)
+
+
 def _unpack_bits(packed_bits: str, dtype: str, shape: Sequence[int]) -> np.ndarray:
     bits_bytes = bytes.fromhex(packed_bits)
     bits = np.unpackbits(np.frombuffer(bits_bytes, dtype=np.uint8))
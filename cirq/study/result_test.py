@@ -159,6 +159,161 @@ def test_multi_measurement_histogram():
     )
 
 
+def _slow_histogram(measurements, keys, fold_func):
+    samples = zip(*(measurements[key] for key in keys)) if keys else [()] * 500
+    return collections.Counter(fold_func(sample) for sample in samples)
+
+
+@pytest.mark.parametrize('packed', [False, True])
+def test_histograms_match_per_repetition_folding(packed):
+    prng = np.random.RandomState(1234)
+    measurements = {
+        'a': prng.randint(2, size=(500, 3)).astype(np.uint8),
+        'b': prng.randint(2, size=(500, 1)).astype(np.uint8),
+        'c': prng.randint(2, size=(500, 70)).astype(np.uint8),
+        'd': np.zeros((500, 0), dtype=np.uint8),
+    }
+    result = cirq.Result(params=cirq.ParamResolver(), measurements=measurements)
+    if packed:
+        result = cirq.Result.from_packed_measurements(
+            params=cirq.ParamResolver(),
+            packed_measurements=result.packed_measurements,
+            qubit_counts={k: v.shape[1] for k, v in measurements.items()},
+        )
+    ints = cirq.study.result._tuple_of_big_endian_int
+    for keys in [['a'], ['a', 'b'], ['c'], ['b', 'c', 'd'], ['d'], []]:
+        assert result.multi_measurement_histogram(keys=keys) == _slow_histogram(
+            measurements, keys, ints
+        )
+        fold_func = lambda e: sum(int(np.sum(bits)) for bits in e)
+        assert result.multi_measurement_histogram(
+            keys=keys, fold_func=fold_func
+        ) == _slow_histogram(measurements, keys, fold_func)
+    for key in 'abcd':
+        expected = _slow_histogram(measurements, [key], lambda e: cirq.big_endian_bits_to_int(e[0]))
+        assert result.histogram(key=key) == expected
+        assert result.histogram(key=key, fold_func=tuple) == _slow_histogram(
+            measurements, [key], lambda e: tuple(e[0])
+        )
+        assert result._integer_column(key).tolist() == [
+            cirq.big_endian_bits_to_int(m) for m in measurements[key]
+        ]
+
+    # Cached histograms are not shared with callers.
+    counts = result.histogram(key='a')
+    counts.clear()
+    assert result.histogram(key='a') == _slow_histogram(
+        measurements, ['a'], lambda e: cirq.big_endian_bits_to_int(e[0])
+    )
+
+
+def test_histogram_of_qudit_digits():
+    result = cirq.Result(
+        params=cirq.ParamResolver(),
+        measurements={'q': np.array([[0, 2], [1, 0], [0, 1], [0, 2]])},
+    )
+    # Non-zero digits count as set bits for integer conversion.
+    assert result.histogram(key='q') == collections.Counter({1: 3, 2: 1})
+    assert result.histogram(key='q', fold_func=tuple) == collections.Counter(
+        {(0, 2): 2, (1, 0): 1, (0, 1): 1}
+    )
+
+
+def test_packed_measurements():
+    bits = np.array([[0, 1, 1, 0, 0, 0, 0, 0, 1], [1, 0, 0, 0, 0, 0, 0, 0, 0]], dtype=np.uint8)
+    packed = np.packbits(bits, axis=1)
+    result = cirq.Result.from_packed_measurements(
+        params=cirq.ParamResolver({'a': 1}),
+        packed_measurements={'m': packed},
+        qubit_counts={'m': 9},
+    )
+    assert result.repetitions == 2
+    np.testing.assert_array_equal(result.packed_measurements['m'], packed)
+    assert list(result.data['m']) == [0b011000001, 0b100000000]
+    assert result._measurements is None
+    np.testing.assert_array_equal(result.measurements['m'], bits)
+    assert result == cirq.Result(params=cirq.ParamResolver({'a': 1}), measurements={'m': bits})
+
+    unpacked = cirq.Result(params=cirq.ParamResolver(), measurements={'m': bits.astype(bool)})
+    np.testing.assert_array_equal(unpacked.packed_measurements['m'], packed)
+
+    empty = cirq.Result.from_packed_measurements(
+        params=cirq.ParamResolver(), packed_measurements={}, qubit_counts={}
+    )
+    assert empty.repetitions == 0
+    assert empty.measurements == {}
+
+
+def test_cached_measurements_are_read_only():
+    bits = np.array([[0, 1], [1, 1], [0, 1]], dtype=np.uint8)
+    result = cirq.Result(params=cirq.ParamResolver(), measurements={'m': bits})
+    # Measurements can be modified until values are derived from them.
+    bits[0, 0] = 1
+    assert result.histogram(key='m') == collections.Counter({3: 2, 1: 1})
+    with pytest.raises(ValueError, match='read-only'):
+        result.measurements['m'][0, 0] = 0
+    with pytest.raises(ValueError, match='read-only'):
+        result.packed_measurements['m'][0, 0] = 0
+    # The caller's array is copied, and stays writable.
+    bits[0, 0] = 0
+    assert result.histogram(key='m') == collections.Counter({3: 2, 1: 1})
+    assert result.measurements['m'].tolist() == [[1, 1], [1, 1], [0, 1]]
+
+    packed_bits = np.packbits(bits, axis=1)
+    packed = cirq.Result.from_packed_measurements(
+        params=cirq.ParamResolver(),
+        packed_measurements={'m': packed_bits},
+        qubit_counts={'m': 2},
+    )
+    with pytest.raises(ValueError, match='read-only'):
+        packed.measurements['m'][0, 0] = 0
+    with pytest.raises(ValueError, match='read-only'):
+        packed.packed_measurements['m'][0, 0] = 0
+    packed_bits[0, 0] = 0
+    assert packed.histogram(key='m') == collections.Counter({3: 1, 1: 2})
+
+
+def test_packed_measurements_invalid():
+    packed = np.zeros((3, 2), dtype=np.uint8)
+    with pytest.raises(ValueError, match='different keys'):
+        cirq.Result.from_packed_measurements(
+            params=cirq.ParamResolver(), packed_measurements={'m': packed}, qubit_counts={'n': 9}
+        )
+    with pytest.raises(ValueError, match='2 bytes per repetition'):
+        cirq.Result.from_packed_measurements(
+            params=cirq.ParamResolver(),
+            packed_measurements={'m': packed[:, :1]},
+            qubit_counts={'m': 9},
+        )
+    with pytest.raises(ValueError, match='uint8'):
+        cirq.Result.from_packed_measurements(
+            params=cirq.ParamResolver(),
+            packed_measurements={'m': packed.astype(int)},
+            qubit_counts={'m': 9},
+        )
+
+
+def test_packed_result_addition():
+    def packed_result(rows):
+        bits = np.array(rows, dtype=np.uint8)
+        return cirq.Result.from_packed_measurements(
+            params=cirq.ParamResolver(),
+            packed_measurements={'m': np.packbits(bits, axis=1)},
+            qubit_counts={'m': bits.shape[1]},
+        )
+
+    total = packed_result([[0, 1]]) + packed_result([[1, 1], [1, 0]])
+    assert total._measurements is None
+    np.testing.assert_array_equal(total.measurements['m'], [[0, 1], [1, 1], [1, 0]])
+
+    mixed = packed_result([[0, 1]]) + cirq.Result(
+        params=cirq.ParamResolver(), measurements={'m': np.array([[1, 1]])}
+    )
+    np.testing.assert_array_equal(mixed.measurements['m'], [[0, 1], [1, 1]])
+    with pytest.raises(ValueError):
+        _ = packed_result([[0, 1]]) + packed_result([[0, 1, 1]])
+
+
 def test_trial_result_equality():
     et = cirq.testing.EqualsTester()
     et.add_equality_group(
@@ -301,6 +456,26 @@ def test_json_bit_packing_and_dtype():
     np.testing.assert_allclose(len(bits_json), len(digits_json) / 8, rtol=0.02)
 
 
+def test_json_binary_keeps_raw_measurements():
+    prng = np.random.RandomState(1234)
+    digits = prng.randint(256, size=(1000, 4)).astype(np.uint8)
+    result = cirq.Result(
+        params=cirq.ParamResolver({'a': 1}),
+        measurements={'m': digits, 'empty': np.zeros((1000, 0), dtype=np.int64)},
+    )
+
+    binary = cirq.to_json_binary(result)
+    # The large array is stored as a raw buffer rather than a hex string.
+    assert b'_BinaryArray' in binary
+    assert b'packed_digits' not in binary
+    assert len(binary) < 2 * digits.nbytes
+    loaded = cirq.read_json_binary(binary=binary)
+    assert loaded == result
+    # Small arrays are stored as lists, keeping their dtype and shape.
+    assert loaded.measurements['empty'].dtype == np.int64
+    assert loaded.measurements['empty'].shape == (1000, 0)
+
+
 def test_json_bit_packing_error():
     with pytest.raises(ValueError):
         _pack_digits(np.ones(10), pack_bits='hi mom')
@@ -18,6 +18,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Optional,
     overload,
     Sequence,
     TYPE_CHECKING,
@@ -28,6 +29,8 @@ from typing import (
 import abc
 import collections
 import itertools
+
+import numpy as np
 import sympy
 
 from cirq._doc import document
@@ -153,6 +156,28 @@ class Sweep(metaclass=abc.ABCMeta):
     def param_tuples(self) -> Iterator[Params]:
         """An iterator over (key, value) pairs assigning Symbol key to value."""
 
+    def columns(self) -> Dict['cirq.TParamKey', np.ndarray]:
+        """The values assigned to each key over the sweep, as arrays.
+
+        Subclasses compute these without iterating over the points of the
+        sweep where they can, so that large sweeps can be transformed or
+        serialized without creating a `ParamResolver` per point.
+
+        Returns:
+            A dictionary from each key of the sweep to a one-dimensional array
+            whose i'th entry is the value assigned to the key by the i'th
+            resolver of the sweep. Numeric values are stored in numeric
+            arrays, anything else in arrays of dtype object. Keys which are
+            not assigned by every resolver of the sweep are left out.
+        """
+        columns: Dict['cirq.TParamKey', List[Any]] = {}
+        length = 0
+        for params in self.param_tuples():
+            length += 1
+            for key, val in params:
+                columns.setdefault(key, []).append(val)
+        return {key: _to_column(values) for key, values in columns.items() if len(values) == length}
+
     def __str__(self) -> str:
         length = len(self)
         max_show = 10
@@ -244,6 +269,17 @@ class Product(Sweep):
 
         return _gen(self.factors)
 
+    def columns(self) -> Dict['cirq.TParamKey', np.ndarray]:
+        lengths = [len(factor) for factor in self.factors]
+        columns: Dict['cirq.TParamKey', np.ndarray] = {}
+        for i, factor in enumerate(self.factors):
+            # Earlier factors vary more slowly than later ones.
+            outer = int(np.prod(lengths[:i], dtype=np.int64))
+            inner = int(np.prod(lengths[i + 1 :], dtype=np.int64))
+            for key, column in factor.columns().items():
+                columns[key] = np.tile(np.repeat(column, inner), outer)
+        return columns
+
     def __repr__(self) -> str:
         factors_repr = ', '.join(repr(f) for f in self.factors)
         return f'cirq.Product({factors_repr})'
@@ -298,6 +334,12 @@ class Zip(Sweep):
         for values in zip(*iters):
             yield sum(values, ())
 
+    def columns(self) -> Dict['cirq.TParamKey', np.ndarray]:
+        length = len(self)
+        return {
+            key: column[:length] for sweep in self.sweeps for key, column in sweep.columns().items()
+        }
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(s) for s in self.sweeps)
         return f'cirq.Zip({sweeps_repr})'
@@ -357,6 +399,9 @@ class Points(SingleSweep):
     def _values(self) -> Iterator[float]:
         return iter(self.points)
 
+    def columns(self) -> Dict['cirq.TParamKey', np.ndarray]:
+        return {self.key: _to_column(self.points)}
+
     def __repr__(self) -> str:
         return f'cirq.Points({self.key!r}, {self.points!r})'
 
@@ -389,6 +434,12 @@ class Linspace(SingleSweep):
                 p = i / (self.length - 1)
                 yield self.start * (1 - p) + self.stop * p
 
+    def columns(self) -> Dict['cirq.TParamKey', np.ndarray]:
+        if self.length == 1:
+            return {self.key: _to_column([self.start])}
+        p = np.arange(self.length) / (self.length - 1)
+        return {self.key: self.start * (1 - p) + self.stop * p}
+
     def __repr__(self) -> str:
         return (
             f'cirq.Linspace({self.key!r}, start={self.start!r}, '
@@ -437,6 +488,16 @@ class ListSweep(Sweep):
         return f'cirq.ListSweep({self.resolver_list!r})'
 
 
+def _to_column(values: Sequence[Any]) -> np.ndarray:
+    column = np.array(values)
+    if column.ndim == 1 and column.dtype.kind in 'biufc':
+        return column
+    column = np.empty(len(values), dtype=object)
+    for i, val in enumerate(values):
+        column[i] = val
+    return column
+
+
 def _params_without_symbols(resolver: resolver.ParamResolver) -> Params:
     for sym, val in resolver.param_dict.items():
         if isinstance(sym, sympy.Symbol):
@@ -476,3 +537,73 @@ def dict_to_zip_sweep(factor_dict: ProductOrZipSweepLike) -> Zip:
         Zip product of the sweeps.
     """
     return Zip(*(Points(k, v if isinstance(v, Sequence) else [v]) for k, v in factor_dict.items()))
+
+
+def resolve_values_over_sweep(
+    values: Iterable[Union['cirq.TParamVal', str]], sweep: Sweep
+) -> Dict[Any, np.ndarray]:
+    """Resolves each value at every point of a sweep, one array per value.
+
+    This is equivalent to calling `resolver.value_of(value)` for every
+    resolver in the sweep, but formulas whose symbols are all swept over
+    numeric values are compiled once (see `cirq.study.resolver.
+    compile_expression`) and evaluated for all points in a single vectorized
+    call, instead of being substituted point by point.
+
+    Args:
+        values: The parameter values to resolve, e.g. the exponents of the
+            parameterized gates in a circuit.
+        sweep: The sweep whose points the values are resolved against.
+
+    Returns:
+        A dictionary from each of the given values to an array of length
+        `len(sweep)` holding its resolved value at each point of the sweep.
+    """
+    values = list(values)
+    numeric_columns: Dict[str, np.ndarray] = {}
+    for key, column in sweep.columns().items():
+        name = key.name if isinstance(key, sympy.Symbol) else key
+        if column.dtype != object:
+            numeric_columns[name] = column
+            continue
+        converted = [resolver._sympy_pass_through(val) for val in column]
+        if all(val is not None for val in converted):
+            numeric_columns[name] = np.array(converted)
+
+    n = len(sweep)
+    fallback_resolvers: Optional[List[resolver.ParamResolver]] = None
+    result: Dict[Any, np.ndarray] = {}
+    for value in values:
+        if value in result:
+            continue
+        expr = sympy.Symbol(value) if isinstance(value, str) else value
+        resolved: Optional[np.ndarray] = None
+        v = resolver._sympy_pass_through(expr)
+        if v is not None:
+            resolved = np.full(n, v)
+        elif isinstance(expr, sympy.Symbol) and expr.name in numeric_columns:
+            resolved = numeric_columns[expr.name]
+        elif isinstance(expr, sympy.Basic):
+            compiled = resolver.compile_expression(expr)
+            if compiled is not None and all(s.name in numeric_columns for s in compiled[0]):
+                symbols, func = compiled
+                # Points outside the real domain of a function are left to
+                # the per-point fallback, like in `ParamResolver.value_of`.
+                try:
+                    with np.errstate(all='raise'):
+                        resolved = np.asarray(func(*(numeric_columns[s.name] for s in symbols)))
+                except (ArithmeticError, TypeError, ValueError):
+                    resolved = None
+                if resolved is not None:
+                    # Only formulas of no symbols evaluate to a single value.
+                    resolved = np.full(n, resolved) if resolved.ndim == 0 else resolved
+                    if resolved.shape != (n,):
+                        resolved = None
+                if resolved is not None and not np.all(np.isfinite(resolved)):
+                    resolved = None
+        if resolved is None:
+            if fallback_resolvers is None:
+                fallback_resolvers = list(sweep)
+            resolved = np.array([r.value_of(value) for r in fallback_resolvers])
+        result[value] = resolved
+    return result
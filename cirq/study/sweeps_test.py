@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 import pytest
 import sympy
 import cirq
@@ -299,3 +300,90 @@ def test_dict_to_zip_sweep():
     assert cirq.dict_to_zip_sweep({'t': [0, 1], 's': [2, 3], 'r': 4}) == (
         cirq.Zip(cirq.Points('t', [0, 1]), cirq.Points('s', [2, 3]), cirq.Points('r', [4]))
     )
+
+
+def test_resolve_values_over_sweep():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    sweep = cirq.Linspace('a', 0, 1, 3) * cirq.Points(b, [1, 2])
+    values = [0.25, 'a', b, sympy.sin(a * sympy.pi) + b, 2 * sympy.Symbol('x'), 'a']
+    result = cirq.resolve_values_over_sweep(values, sweep)
+
+    assert list(result) == values[:-1]
+    for value, resolved in result.items():
+        assert len(resolved) == len(sweep)
+        for r, v in zip(sweep, resolved):
+            expected = r.value_of(value)
+            if isinstance(expected, sympy.Basic):
+                assert v == expected
+            else:
+                assert np.isclose(v, expected)
+
+
+def test_resolve_values_over_sweep_fallbacks():
+    a = sympy.Symbol('a')
+    sweep = cirq.ListSweep([{'a': 1, 'b': a + 1}, {'a': 2, 'b': a + 2}])
+    result = cirq.resolve_values_over_sweep([sympy.Symbol('b') * 2, 1 / a], sweep)
+    np.testing.assert_allclose(result[sympy.Symbol('b') * 2].astype(float), [4, 8])
+    np.testing.assert_allclose(result[1 / a], [1, 0.5])
+
+    assert len(cirq.resolve_values_over_sweep(['a'], cirq.UnitSweep)['a']) == 1
+
+
+def test_resolve_values_over_sweep_outside_real_domain():
+    a = sympy.Symbol('a')
+    sweep = cirq.Linspace('a', 0, 3, 4)
+    values = [sympy.log(a - 2), sympy.asin(a), sympy.log(a)]
+    result = cirq.resolve_values_over_sweep(values, sweep)
+    for value in values:
+        expected = [r.value_of(value) for r in sweep]
+        np.testing.assert_allclose(result[value], expected)
+
+
+def test_resolve_values_over_sweep_missing_keys():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    sweep = cirq.ListSweep([{'a': 1}, {'a': 2, 'b': 3}])
+    assert sweep.columns().keys() == {'a'}
+    result = cirq.resolve_values_over_sweep([a * b, b], sweep)
+    assert result[a * b].tolist() == [b, 6]
+    assert result[b].tolist() == [b, 3]
+
+    sweep = cirq.ListSweep([{'a': 1, 'b': 2}, {'b': 3}])
+    assert sweep.columns().keys() == {'b'}
+    result = cirq.resolve_values_over_sweep([a, sympy.sin(a)], sweep)
+    assert result[a].tolist() == [1, a]
+    assert result[sympy.sin(a)].tolist() == [np.sin(1), sympy.sin(a)]
+
+
+@pytest.mark.parametrize(
+    'sweep',
+    [
+        cirq.UnitSweep,
+        cirq.Points('a', [1, 2, 3]),
+        cirq.Points('a', [sympy.Symbol('x'), 1]),
+        cirq.Linspace('a', 0, 1, 5),
+        cirq.Linspace('a', 2, 2, 1),
+        cirq.Linspace('a', 0, 1, 5) * cirq.Points('b', [3, 4]) * cirq.Points('c', [5, 6, 7]),
+        cirq.Zip(cirq.Linspace('a', 0, 1, 5), cirq.Points('b', [3, 4])),
+        cirq.Product(
+            cirq.Points('a', [1, 2]), cirq.Zip(cirq.Points('b', [3]), cirq.Points('c', [4]))
+        ),
+        cirq.ListSweep([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]),
+    ],
+)
+def test_columns_match_param_tuples(sweep):
+    columns = sweep.columns()
+    assert list(columns) == sweep.keys
+    for column in columns.values():
+        assert column.shape == (len(sweep),)
+    for i, params in enumerate(sweep.param_tuples()):
+        for key, val in params:
+            assert columns[key][i] == val
+
+
+def test_product_columns_do_not_iterate_over_points(monkeypatch):
+    sweep = cirq.Product(*(cirq.Linspace(f'x{i}', 0, 1, 10) for i in range(6)))
+    monkeypatch.setattr(cirq.Product, 'param_tuples', None)
+    columns = sweep.columns()
+    assert len(columns['x0']) == 10 ** 6
+    assert columns['x5'][:11].tolist() == list(cirq.Linspace('x', 0, 1, 10)._values()) + [0]
+    assert np.isclose(columns['x0'][10 ** 5], 1 / 9)
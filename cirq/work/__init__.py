@@ -27,16 +27,31 @@ from cirq.work.observable_settings import (
     observables_to_settings,
 )
 from cirq.work.observable_grouping import (
+    allocate_repetitions,
     group_settings_greedy,
+    group_settings_sorted_insertion,
 )
 from cirq.work.observable_measurement_data import (
     ObservableMeasuredResult,
     BitstringAccumulator,
     flatten_grouped_results,
 )
+from cirq.work.observable_measurement import (
+    measure_grouped_settings,
+    measure_observables,
+    RepetitionsStoppingCriteria,
+    StoppingCriteria,
+    VarianceStoppingCriteria,
+)
 from cirq.work.sampler import (
     Sampler,
 )
+from cirq.work.executor_sampler import (
+    ExecutorSampler,
+)
+from cirq.work.process_pool_sampler import (
+    ProcessPoolSampler,
+)
 from cirq.work.zeros_sampler import (
     ZerosSampler,
 )
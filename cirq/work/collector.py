@@ -118,7 +118,9 @@ class Collector(metaclass=abc.ABCMeta):
         Args:
             sampler: The simulator or service to collect samples from.
             concurrency: Desired number of sampling jobs to have in flight at
-                any given time.
+                any given time. Samplers without native asynchronous support
+                run one job at a time; wrap them in a `cirq.ExecutorSampler`
+                to run several jobs at once.
             max_total_samples: Optional limit on the maximum number of samples
                 to collect.
 
@@ -156,7 +158,9 @@ class Collector(metaclass=abc.ABCMeta):
         Args:
             sampler: The simulator or service to collect samples from.
             concurrency: Desired number of sampling jobs to have in flight at
-                any given time.
+                any given time. Samplers without native asynchronous support
+                run one job at a time; wrap them in a `cirq.ExecutorSampler`
+                to run several jobs at once.
             max_total_samples: Optional limit on the maximum number of samples
                 to collect.
 
@@ -0,0 +1,165 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A sampler running another sampler's work on a thread or process pool."""
+
+import asyncio
+import concurrent.futures
+import copy
+import functools
+from typing import Any, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import value
+from cirq.work import sampler
+
+if TYPE_CHECKING:
+    import cirq
+
+
+def _reseeded(wrapped: 'cirq.Sampler', prng: np.random.RandomState) -> 'cirq.Sampler':
+    """Returns a copy of `wrapped` drawing its samples from `prng`.
+
+    Samplers keeping their random state in a `_prng` attribute are copied with
+    that attribute replaced, as are the samplers they wrap. Other state is
+    shared with `wrapped`, which is not modified.
+    """
+    wrapped = copy.copy(wrapped)
+    if hasattr(wrapped, '_prng'):
+        wrapped._prng = prng  # type: ignore
+    for name, attr in list(vars(wrapped).items()):
+        if isinstance(attr, sampler.Sampler):
+            setattr(wrapped, name, _reseeded(attr, prng))
+    return wrapped
+
+
+class ExecutorSampler(sampler.Sampler):
+    """Runs the sampling calls of a wrapped sampler on an executor.
+
+    Synchronous calls are forwarded to the wrapped sampler unchanged. The
+    asynchronous methods (`run_async`, `run_sweep_async` and therefore
+    `run_batch_async` and `cirq.Collector.collect`) run each call on the
+    executor, so as many calls as the executor has workers run at once:
+
+        with cirq.ExecutorSampler(cirq.Simulator(), max_workers=4) as sampler:
+            collector.collect(sampler, concurrency=4)
+
+    Threads overlap calls which wait on I/O or spend their time in numpy
+    routines releasing the GIL, such as large state vector simulations. On a
+    thread pool, all calls share the wrapped sampler and its random state, so
+    the order in which they draw samples depends on scheduling.
+
+    Any other executor, such as a `concurrent.futures.ProcessPoolExecutor`,
+    also runs Python-heavy simulations on several cores. The wrapped sampler,
+    circuits and results are then pickled, so every call would otherwise run
+    on an identical copy of the sampler and produce the same samples. Instead,
+    each call runs on a copy whose random state is seeded from a stream
+    derived from `seed`. This covers samplers keeping their random state in a
+    `_prng` attribute, such as `cirq.Simulator`, `cirq.DensityMatrixSimulator`
+    and `cirq.StabilizerSampler`, including when they are wrapped by another
+    sampler.
+    """
+
+    def __init__(
+        self,
+        sampler: 'cirq.Sampler',
+        executor: Optional[concurrent.futures.Executor] = None,
+        *,
+        max_workers: Optional[int] = None,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+    ):
+        """Inits ExecutorSampler.
+
+        Args:
+            sampler: The sampler doing the work.
+            executor: The executor to run calls on. By default, a
+                `concurrent.futures.ThreadPoolExecutor` owned by this object
+                is created, which is shut down by `close`.
+            max_workers: The number of threads of the default executor. Must
+                not be given together with `executor`.
+            seed: The random seed or generator from which the seeds of calls
+                on executors other than thread pools are drawn.
+        """
+        if executor is not None and max_workers is not None:
+            raise ValueError('Specify at most one of `executor` and `max_workers`.')
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._sampler = sampler
+        self._executor = executor
+        self._prng = value.parse_random_state(seed)
+
+    @property
+    def sampler(self) -> 'cirq.Sampler':
+        return self._sampler
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        return self._executor
+
+    def run_sweep(
+        self,
+        program: 'cirq.Circuit',
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        return self._sampler.run_sweep(program, params, repetitions)
+
+    def run_batch(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions=1,
+    ) -> List[List['cirq.Result']]:
+        return self._sampler.run_batch(programs, params_list, repetitions)
+
+    def close(self) -> None:
+        """Shuts down the default executor.
+
+        Executors passed to the constructor are left running.
+        """
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def __enter__(self) -> 'ExecutorSampler':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _run_in_executor(self, method: str, *args, **kwargs) -> Any:
+        wrapped = self._sampler
+        if not isinstance(self._executor, concurrent.futures.ThreadPoolExecutor):
+            # This also makes unseeded simulators, which refer to the
+            # np.random module, picklable.
+            wrapped = _reseeded(wrapped, np.random.RandomState(self._prng.randint(2 ** 31)))
+        call = functools.partial(getattr(wrapped, method), *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def run_async(self, program: 'cirq.Circuit', *, repetitions: int) -> 'cirq.Result':
+        return await self._run_in_executor('run', program, repetitions=repetitions)
+
+    async def run_sweep_async(
+        self,
+        program: 'cirq.Circuit',
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        return await self._run_in_executor(
+            'run_sweep', program, params=params, repetitions=repetitions
+        )
+
+    def __repr__(self) -> str:
+        return f'cirq.ExecutorSampler({self._sampler!r}, {self._executor!r})'
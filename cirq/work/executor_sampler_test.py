@@ -0,0 +1,130 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+class BarrierSampler(cirq.Sampler):
+    """Only completes once `parties` calls are running at the same time."""
+
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties, timeout=10)
+
+    def run_sweep(self, program, params, repetitions=1):
+        self.barrier.wait()
+        return cirq.ZerosSampler().run_sweep(program, params, repetitions)
+
+
+def test_executor_sampler_sync_calls_delegate():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'))
+    sampler = cirq.ExecutorSampler(cirq.Simulator(), max_workers=2)
+    assert isinstance(sampler.sampler, cirq.Simulator)
+    assert isinstance(sampler.executor, concurrent.futures.ThreadPoolExecutor)
+    assert sampler.run(circuit, repetitions=3).measurements['m'].tolist() == [[1]] * 3
+    results = sampler.run_batch([circuit] * 2, repetitions=[1, 2])
+    assert [r[0].repetitions for r in results] == [1, 2]
+
+    with pytest.raises(ValueError, match='at most one'):
+        _ = cirq.ExecutorSampler(cirq.Simulator(), sampler.executor, max_workers=2)
+
+
+@pytest.mark.asyncio
+async def test_executor_sampler_runs_concurrently():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q, key='m'))
+    sampler = cirq.ExecutorSampler(BarrierSampler(3), max_workers=3)
+    results = await sampler.run_batch_async([circuit] * 3, repetitions=[1, 2, 3], concurrency=3)
+    assert [r[0].repetitions for r in results] == [1, 2, 3]
+
+    result = await cirq.ExecutorSampler(cirq.ZerosSampler()).run_async(circuit, repetitions=4)
+    assert result.measurements['m'].shape == (4, 1)
+
+
+def test_executor_sampler_collect():
+    received = []
+
+    class TestCollector(cirq.Collector):
+        def next_job(self):
+            q = cirq.LineQubit(0)
+            circuit = cirq.Circuit(cirq.measure(q, key='m'))
+            return cirq.CircuitSampleJob(circuit=circuit, repetitions=1, tag=len(received))
+
+        def on_job_result(self, job, result):
+            received.append(job.tag)
+
+    sampler = cirq.ExecutorSampler(BarrierSampler(2), max_workers=2)
+    TestCollector().collect(sampler, concurrency=2, max_total_samples=4)
+    assert len(received) == 4
+
+
+@pytest.mark.asyncio
+async def test_executor_sampler_process_pool():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'))
+    noisy = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        sampler = cirq.ExecutorSampler(cirq.Simulator(seed=1), pool, seed=2)
+        results = await sampler.run_batch_async([circuit] * 2, repetitions=[2, 3])
+        result = await sampler.run_async(circuit, repetitions=2)
+        # Every call draws different samples, reproducibly for a fixed seed.
+        samples = [await sampler.run_async(noisy, repetitions=50) for _ in range(2)]
+        sampler = cirq.ExecutorSampler(cirq.Simulator(seed=1), pool, seed=2)
+        _ = await sampler.run_batch_async([circuit] * 2, repetitions=[2, 3])
+        _ = await sampler.run_async(circuit, repetitions=2)
+        repeated = await sampler.run_async(noisy, repetitions=50)
+        # Unseeded simulators can be used too.
+        unseeded = cirq.ExecutorSampler(cirq.Simulator(), pool)
+        _ = await unseeded.run_async(circuit, repetitions=2)
+        # The wrapped sampler is not modified.
+        assert sampler.sampler._prng is not unseeded.sampler._prng
+    assert [r[0].repetitions for r in results] == [2, 3]
+    np.testing.assert_array_equal(result.measurements['m'], [[1], [1]])
+    assert samples[0] != samples[1]
+    assert repeated == samples[0]
+
+
+def test_reseeded_copies_wrapped_samplers():
+    simulator = cirq.Simulator(seed=1)
+    prng = simulator._prng
+    wrapper = cirq.ExecutorSampler(simulator)
+    copied = cirq.work.executor_sampler._reseeded(wrapper, np.random.RandomState(5))
+    assert copied.sampler is not simulator
+    assert copied.sampler._prng is copied._prng
+    assert simulator._prng is prng
+    wrapper.close()
+
+
+def test_executor_sampler_close():
+    with cirq.ExecutorSampler(cirq.ZerosSampler()) as sampler:
+        pass
+    with pytest.raises(RuntimeError, match='shutdown'):
+        sampler.executor.submit(print)
+
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        with cirq.ExecutorSampler(cirq.ZerosSampler(), pool):
+            pass
+        # Executors passed in are not shut down.
+        assert pool.submit(int).result() == 0
+
+
+def test_executor_sampler_repr():
+    sampler = cirq.ExecutorSampler(cirq.ZerosSampler())
+    assert repr(sampler).startswith(f'cirq.ExecutorSampler({sampler.sampler!r}, ')
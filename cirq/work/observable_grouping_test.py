@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 import cirq
 
 
@@ -155,3 +157,92 @@ def test_group_settings_greedy_hydrogen():
     assert len(groups[2]) == 1
     assert len(groups[3]) == 1
     assert len(groups[4]) == len(terms) - 4
+
+
+def test_group_settings_greedy_many_qubits():
+    # Settings on more than 64 qubits span several words of bit masks.
+    qubits = cirq.LineQubit.range(70)
+    terms = [
+        cirq.X(qubits[0]) * cirq.Z(qubits[69]),
+        cirq.Y(qubits[69]),
+        cirq.Z(qubits[65]) * cirq.Z(qubits[69]),
+        cirq.X(qubits[1]),
+    ]
+    settings = list(cirq.work.observables_to_settings(terms, qubits))
+    grouped_settings = cirq.work.group_settings_greedy(settings)
+    assert list(grouped_settings.values()) == [
+        [settings[0], settings[2]],
+        [settings[1], settings[3]],
+    ]
+    assert [max_setting.observable for max_setting in grouped_settings] == [
+        cirq.X(qubits[0]) * cirq.Z(qubits[65]) * cirq.Z(qubits[69]),
+        cirq.X(qubits[1]) * cirq.Y(qubits[69]),
+    ]
+
+
+def test_group_settings_greedy_tries_least_recently_updated_group_first():
+    q0, q1 = cirq.LineQubit.range(2)
+    terms = [cirq.X(q0), cirq.Z(q0), cirq.X(q0) * cirq.Z(q1), cirq.Z(q1)]
+    settings = list(cirq.work.observables_to_settings(terms, [q0, q1]))
+    grouped_settings = cirq.work.group_settings_greedy(settings)
+    # The last setting fits in both groups, and goes to the Z(q0) group since
+    # the X(q0) group was updated more recently.
+    assert list(grouped_settings.values()) == [
+        [settings[0], settings[2]],
+        [settings[1], settings[3]],
+    ]
+
+
+def test_group_settings_sorted_insertion():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    terms = [
+        0.1 * cirq.X(q0),
+        -2.0 * cirq.Z(q0) * cirq.Z(q1),
+        0.5 * cirq.X(q1),
+        1.0 * cirq.Z(q2),
+        -0.3 * cirq.X(q0) * cirq.X(q1),
+    ]
+    settings = list(cirq.work.observables_to_settings(terms, [q0, q1, q2]))
+    grouped_settings = cirq.work.group_settings_sorted_insertion(settings)
+    assert list(grouped_settings.values()) == [
+        [settings[1], settings[3]],
+        [settings[2], settings[4], settings[0]],
+    ]
+    assert list(grouped_settings.keys()) == list(
+        cirq.work.observables_to_settings(
+            [cirq.Z(q0) * cirq.Z(q1) * cirq.Z(q2), cirq.X(q0) * cirq.X(q1)], [q0, q1, q2]
+        )
+    )
+    assert cirq.work.group_settings_sorted_insertion([]) == {}
+
+
+def test_group_settings_sorted_insertion_init_state_compat():
+    q0, q1 = cirq.LineQubit.range(2)
+    settings = [
+        cirq.work.InitObsSetting(init_state=cirq.KET_PLUS(q0), observable=cirq.X(q0)),
+        cirq.work.InitObsSetting(init_state=cirq.KET_MINUS(q0), observable=2 * cirq.Z(q1)),
+        cirq.work.InitObsSetting(init_state=cirq.KET_ZERO(q1), observable=cirq.Z(q1)),
+    ]
+    grouped_settings = cirq.work.group_settings_sorted_insertion(settings)
+    assert list(grouped_settings.values()) == [[settings[1], settings[2]], [settings[0]]]
+
+
+def test_allocate_repetitions():
+    q0, q1 = cirq.LineQubit.range(2)
+    terms = [3 * cirq.Z(q0), -1 * cirq.Z(q1), 0.5 * cirq.X(q0), 0.5 * cirq.X(q1)]
+    settings = list(cirq.work.observables_to_settings(terms, [q0, q1]))
+    grouped_settings = cirq.work.group_settings_sorted_insertion(settings)
+    z_key, x_key = grouped_settings.keys()
+
+    assert cirq.work.allocate_repetitions(grouped_settings, 2) == {z_key: 1, x_key: 1}
+    assert cirq.work.allocate_repetitions(grouped_settings, 6) == {z_key: 4, x_key: 2}
+    # 998 spare repetitions split 4:1, i.e. 798.4 and 199.6, with the largest
+    # remainder rounded up.
+    assert cirq.work.allocate_repetitions(grouped_settings, 1000) == {z_key: 799, x_key: 201}
+    assert cirq.work.allocate_repetitions({}, 10) == {}
+    with pytest.raises(ValueError, match='Cannot allocate'):
+        _ = cirq.work.allocate_repetitions(grouped_settings, 1)
+
+    zero = list(cirq.work.observables_to_settings([0 * cirq.Z(q0), 0 * cirq.X(q0)], [q0]))
+    counts = cirq.work.allocate_repetitions(cirq.work.group_settings_greedy(zero), 5)
+    assert sorted(counts.values()) == [2, 3]
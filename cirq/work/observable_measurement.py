@@ -0,0 +1,404 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import concurrent.futures
+import dataclasses
+import itertools
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from cirq import circuits, ops, study
+from cirq.work.observable_grouping import (
+    group_settings_greedy,
+    group_settings_sorted_insertion,
+)
+from cirq.work.observable_measurement_data import (
+    BitstringAccumulator,
+    ObservableMeasuredResult,
+    flatten_grouped_results,
+)
+from cirq.work.observable_settings import (
+    InitObsSetting,
+    _MeasurementSpec,
+    observables_to_settings,
+)
+
+if TYPE_CHECKING:
+    import cirq
+
+    # Workaround for mypy custom dataclasses
+    from dataclasses import dataclass as json_serializable_dataclass
+else:
+    from cirq.protocols import json_serializable_dataclass
+
+MEASURE_KEY = 'observables'
+"""The measurement key used for the basis-rotated readout of all qubits."""
+
+GROUPER_T = Union[
+    str, Callable[[Iterable[InitObsSetting]], Dict[InitObsSetting, List[InitObsSetting]]]
+]
+
+_GROUPING_FUNCS = {
+    'greedy': group_settings_greedy,
+    'sorted_insertion': group_settings_sorted_insertion,
+}
+
+
+class StoppingCriteria(metaclass=abc.ABCMeta):
+    """An abstract object that queries a BitstringAccumulator to figure out
+    whether that `meas_spec` is complete."""
+
+    @abc.abstractmethod
+    def more_repetitions(self, accumulator: BitstringAccumulator) -> int:
+        """Return the number of additional repetitions to take.
+
+        StoppingCriteria should be respectful and have some notion of a
+        maximum number of repetitions per chunk.
+        """
+
+
+@json_serializable_dataclass(frozen=True)
+class VarianceStoppingCriteria(StoppingCriteria):
+    """Stop sampling when the variance of every setting's estimated mean is
+    at most `variance_bound`.
+
+    After the first chunk, the number of further repetitions is estimated
+    from the worst observed variance so the final chunk is not much larger
+    than needed.
+
+    Args:
+        variance_bound: The largest acceptable variance (squared standard
+            error) of any setting's mean.
+        repetitions_per_chunk: The maximum number of repetitions requested
+            for one measurement spec in one round.
+    """
+
+    variance_bound: float
+    repetitions_per_chunk: int = 10_000
+
+    def more_repetitions(self, accumulator: BitstringAccumulator) -> int:
+        n = accumulator.n_repetitions
+        if n < 2:
+            return self.repetitions_per_chunk
+
+        worst = max(accumulator.variance(setting) for setting in accumulator.simul_settings)
+        if not worst > self.variance_bound:
+            return 0
+        if not np.isfinite(worst):
+            return self.repetitions_per_chunk
+
+        # The variance of the mean shrinks like 1/n.
+        needed = int(np.ceil(n * worst / self.variance_bound)) - n
+        return int(np.clip(needed, 1, self.repetitions_per_chunk))
+
+    def __repr__(self):
+        return (
+            f'cirq.work.VarianceStoppingCriteria('
+            f'variance_bound={self.variance_bound!r}, '
+            f'repetitions_per_chunk={self.repetitions_per_chunk!r})'
+        )
+
+
+@json_serializable_dataclass(frozen=True)
+class RepetitionsStoppingCriteria(StoppingCriteria):
+    """Stop sampling when the number of repetitions has been reached.
+
+    Args:
+        total_repetitions: The number of repetitions to take for every
+            measurement spec.
+        repetitions_per_chunk: The maximum number of repetitions requested
+            for one measurement spec in one round.
+    """
+
+    total_repetitions: int
+    repetitions_per_chunk: int = 10_000
+
+    def more_repetitions(self, accumulator: BitstringAccumulator) -> int:
+        todo = self.total_repetitions - accumulator.n_repetitions
+        return max(0, min(todo, self.repetitions_per_chunk))
+
+    def __repr__(self):
+        return (
+            f'cirq.work.RepetitionsStoppingCriteria('
+            f'total_repetitions={self.total_repetitions!r}, '
+            f'repetitions_per_chunk={self.repetitions_per_chunk!r})'
+        )
+
+
+def _state_prep_ops(init_state: 'cirq.ProductState') -> List['cirq.Operation']:
+    """Operations taking |00..00> to `init_state`."""
+    prep = []
+    for q, named_state in init_state:
+        eigenvalue, pauli = named_state.stabilized_by()
+        if pauli == ops.X:
+            prep.append(ops.Y(q) ** (0.5 * eigenvalue))
+        elif pauli == ops.Y:
+            prep.append(ops.X(q) ** (-0.5 * eigenvalue))
+        elif eigenvalue == -1:
+            prep.append(ops.X(q))
+    return prep
+
+
+def _measurement_circuit(
+    circuit: 'cirq.Circuit', max_setting: InitObsSetting, qubits: Sequence['cirq.Qid']
+) -> 'cirq.Circuit':
+    """The circuit preparing `max_setting.init_state`, applying `circuit` and
+    measuring every qubit in the eigenbasis of `max_setting.observable`."""
+    prep = _state_prep_ops(max_setting.init_state)
+    to_rotate = {q: pauli for q, pauli in max_setting.observable.items() if pauli != ops.Z}
+    rotations = list(ops.PauliString(to_rotate).to_z_basis_ops())
+    moments = [ops.Moment(prep)] if prep else []
+    moments.extend(circuit)
+    if rotations:
+        moments.append(ops.Moment(rotations))
+    moments.append(ops.Moment([ops.measure(*qubits, key=MEASURE_KEY)]))
+    return circuits.Circuit(moments)
+
+
+def _circuit_params(resolver: 'cirq.ParamResolver') -> Dict[str, float]:
+    return {str(k): v for k, v in resolver.param_dict.items()}
+
+
+@dataclasses.dataclass
+class _SamplingJob:
+    """One program submitted in a `run_batch` call: a grouped setting with the
+    sweep points which still need `repetitions` more repetitions."""
+
+    program: 'cirq.Circuit'
+    accumulators: List[BitstringAccumulator]
+    resolvers: List['cirq.ParamResolver']
+    repetitions: int
+
+
+def _run_jobs(
+    sampler: 'cirq.Sampler',
+    jobs: List[_SamplingJob],
+    max_programs_per_batch: Optional[int],
+    concurrency: int,
+) -> None:
+    """Submit `jobs` through `sampler.run_batch` and stream the results into
+    each job's accumulators."""
+    if max_programs_per_batch is None:
+        max_programs_per_batch = len(jobs)
+    batches = [
+        jobs[i : i + max_programs_per_batch] for i in range(0, len(jobs), max_programs_per_batch)
+    ]
+
+    def run_batch(batch: List[_SamplingJob]) -> List[List['cirq.Result']]:
+        return sampler.run_batch(
+            programs=[job.program for job in batch],
+            params_list=[study.ListSweep(job.resolvers) for job in batch],
+            repetitions=[job.repetitions for job in batch],
+        )
+
+    def consume(batch: List[_SamplingJob], results: List[List['cirq.Result']]) -> None:
+        for job, job_results in zip(batch, results):
+            for accumulator, result in zip(job.accumulators, job_results):
+                bitstrings = np.asarray(result.measurements[MEASURE_KEY], dtype=np.uint8)
+                accumulator.consume_results(bitstrings)
+
+    if concurrency <= 1 or len(batches) <= 1:
+        for batch in batches:
+            consume(batch, run_batch(batch))
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(run_batch, batch): batch for batch in batches}
+        for future in concurrent.futures.as_completed(futures):
+            consume(futures[future], future.result())
+
+
+def measure_grouped_settings(
+    circuit: 'cirq.Circuit',
+    grouped_settings: Dict[InitObsSetting, List[InitObsSetting]],
+    sampler: 'cirq.Sampler',
+    stopping_criteria: StoppingCriteria,
+    *,
+    circuit_sweep: 'cirq.Sweepable' = None,
+    max_programs_per_batch: Optional[int] = None,
+    concurrency: int = 1,
+    retain_bitstrings: bool = True,
+) -> List[BitstringAccumulator]:
+    """Measure a suite of grouped InitObsSetting settings.
+
+    For each group, the circuit is prefixed with the preparation of the
+    group's initial state and suffixed with the single-qubit rotations into
+    the eigenbasis of its observable. All of these programs are run through
+    `sampler.run_batch` in rounds, with `circuit_sweep` supplied as each
+    program's sweep. After every round `stopping_criteria` is queried for each
+    (group, sweep point) pair and only the pairs needing more repetitions are
+    resubmitted.
+
+    Args:
+        circuit: The circuit. This can contain parameters, in which case
+            you should also specify `circuit_sweep`.
+        grouped_settings: A series of setting groups expressed as a dictionary.
+            The key is the max-weight setting used for preparing single-qubit
+            basis-change rotations. The value is a list of settings
+            compatible with the maximal setting you desire to measure.
+            Automated routing algorithms like `group_settings_greedy` can
+            be used to construct this input.
+        sampler: The sampler.
+        stopping_criteria: A StoppingCriteria object that can report
+            whether enough samples have been sampled.
+        circuit_sweep: Additional parameter sweeps for parameters contained
+            in `circuit`. Each sweep point gets its own accumulators and its
+            own number of repetitions.
+        max_programs_per_batch: The largest number of programs submitted in
+            one `run_batch` call. By default, each round is a single call.
+        concurrency: The number of `run_batch` calls which may be in flight
+            at once.
+        retain_bitstrings: Whether the returned accumulators keep the raw
+            bitstrings. See `BitstringAccumulator`.
+
+    Returns:
+        A list of `BitstringAccumulator`, one for each group and sweep point.
+    """
+    if max_programs_per_batch is not None and max_programs_per_batch < 1:
+        raise ValueError("`max_programs_per_batch` must be positive.")
+    if MEASURE_KEY in circuit.all_measurement_keys():
+        raise ValueError(f"The measurement key {MEASURE_KEY!r} is reserved.")
+
+    qubits = sorted(
+        set(circuit.all_qubits()).union(
+            *(setting.init_state.qubits for setting in grouped_settings)
+        )
+    )
+    qubit_to_index = {q: i for i, q in enumerate(qubits)}
+    resolvers = list(study.to_resolvers(circuit_sweep))
+
+    # Group-major order: the accumulators of one program are contiguous.
+    groups = []
+    accumulators = []
+    for max_setting, simul_settings in grouped_settings.items():
+        program = _measurement_circuit(circuit, max_setting, qubits)
+        group_accumulators = [
+            BitstringAccumulator(
+                meas_spec=_MeasurementSpec(max_setting, _circuit_params(resolver)),
+                simul_settings=simul_settings,
+                qubit_to_index=qubit_to_index,
+                retain_bitstrings=retain_bitstrings,
+            )
+            for resolver in resolvers
+        ]
+        groups.append((program, group_accumulators))
+        accumulators.extend(group_accumulators)
+
+    while True:
+        jobs = []
+        for program, group_accumulators in groups:
+            pending = []
+            for accumulator, resolver in zip(group_accumulators, resolvers):
+                more = stopping_criteria.more_repetitions(accumulator)
+                if more > 0:
+                    pending.append((more, accumulator, resolver))
+            # One `run_batch` program per distinct repetition count keeps
+            # every sweep point's sample budget exact.
+            pending.sort(key=lambda p: p[0])
+            for more, chunk in itertools.groupby(pending, key=lambda p: p[0]):
+                _, chunk_accumulators, chunk_resolvers = zip(*chunk)
+                jobs.append(
+                    _SamplingJob(
+                        program=program,
+                        accumulators=list(chunk_accumulators),
+                        resolvers=list(chunk_resolvers),
+                        repetitions=more,
+                    )
+                )
+        if not jobs:
+            return accumulators
+        _run_jobs(sampler, jobs, max_programs_per_batch, concurrency)
+
+
+def _parse_grouper(grouper: GROUPER_T = group_settings_greedy) -> Callable:
+    """Logic for turning a named grouper into one of the built-in
+    grouping functions in this module."""
+    if isinstance(grouper, str):
+        try:
+            grouper = _GROUPING_FUNCS[grouper.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown grouping function {grouper}")
+    return grouper
+
+
+def measure_observables(
+    circuit: 'cirq.Circuit',
+    observables: Iterable['cirq.PauliString'],
+    sampler: 'cirq.Sampler',
+    stopping_criteria: StoppingCriteria,
+    *,
+    circuit_sweep: 'cirq.Sweepable' = None,
+    grouper: GROUPER_T = group_settings_greedy,
+    max_programs_per_batch: Optional[int] = None,
+    concurrency: int = 1,
+) -> List[ObservableMeasuredResult]:
+    """Measure a collection of PauliString observables for a state prepared by a Circuit.
+
+    The observables are turned into settings initialized in the all-zeros
+    state, grouped into simultaneously-measurable sets by `grouper` and
+    measured with `measure_grouped_settings`. Please see that function for
+    the meaning of the sampling arguments. Only the flattened results are
+    returned, so raw bitstrings are not retained.
+
+    Args:
+        circuit: The circuit used to prepare the state to measure. This can
+            contain parameters, in which case you should also specify
+            `circuit_sweep`.
+        observables: A collection of PauliString observables to measure.
+            These will be grouped into simultaneously-measurable groups,
+            see `grouper` argument.
+        sampler: The sampler.
+        stopping_criteria: A StoppingCriteria object that can report
+            whether enough samples have been sampled.
+        circuit_sweep: Additional parameter sweeps for parameters contained
+            in `circuit`.
+        grouper: Either "greedy", "sorted_insertion" or a function that
+            groups lists of `InitObsSetting`. See the documentation for the
+            `grouped_settings` argument of `measure_grouped_settings` for
+            full details.
+        max_programs_per_batch: The largest number of programs submitted in
+            one `run_batch` call.
+        concurrency: The number of `run_batch` calls which may be in flight
+            at once.
+
+    Returns:
+        A list of ObservableMeasuredResult; one for each input PauliString.
+    """
+    observables = list(observables)
+    qubits = sorted({q for obs in observables for q in obs.qubits} | circuit.all_qubits())
+    settings = list(observables_to_settings(observables, qubits))
+    grouped_settings = _parse_grouper(grouper)(settings)
+
+    accumulators = measure_grouped_settings(
+        circuit=circuit,
+        grouped_settings=grouped_settings,
+        sampler=sampler,
+        stopping_criteria=stopping_criteria,
+        circuit_sweep=circuit_sweep,
+        max_programs_per_batch=max_programs_per_batch,
+        concurrency=concurrency,
+        retain_bitstrings=False,
+    )
+    return flatten_grouped_results(accumulators)
@@ -14,7 +14,7 @@
 
 import dataclasses
 import datetime
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Tuple, TYPE_CHECKING
 
 import numpy as np
 
@@ -185,6 +185,13 @@ class BitstringAccumulator:
             does *not* validate that both this parameter and the
             `BitstringAccumulator` under construction contain measurements taken
             with readout symmetrization turned on.
+        retain_bitstrings: Whether to keep the raw bitstrings. Means,
+            variances and covariances of the settings in `simul_settings` are
+            computed from running sums of parities which are updated as
+            results are consumed, so they do not need the raw bitstrings.
+            Without them, other compatible settings cannot be queried and
+            the accumulator cannot be serialized, but memory use no longer
+            grows with the number of repetitions.
 
     """
 
@@ -197,17 +204,19 @@ class BitstringAccumulator:
         chunksizes: np.ndarray = None,
         timestamps: np.ndarray = None,
         readout_calibration: 'BitstringAccumulator' = None,
+        retain_bitstrings: bool = True,
     ):
         self._meas_spec = meas_spec
         self._simul_settings = simul_settings
         self._qubit_to_index = qubit_to_index
         self._readout_calibration = readout_calibration
+        self._retain_bitstrings = retain_bitstrings
 
         if bitstrings is None:
             n_bits = len(qubit_to_index)
-            self.bitstrings = np.zeros((0, n_bits), dtype=np.uint8)
+            bitstrings = np.zeros((0, n_bits), dtype=np.uint8)
         else:
-            self.bitstrings = np.asarray(bitstrings, dtype=np.uint8)
+            bitstrings = np.asarray(bitstrings, dtype=np.uint8)
 
         if chunksizes is None:
             self.chunksizes = np.zeros((0,), dtype=np.int64)
@@ -225,12 +234,29 @@ class BitstringAccumulator:
                 "`chunksizes` and `timestamps` must have the same length."
             )
 
-        if np.sum(self.chunksizes) != len(self.bitstrings):
+        if np.sum(self.chunksizes) != len(bitstrings):
             raise ValueError(
                 "Invalid BitstringAccumulator state. "
                 "`chunksizes` must sum to the number of bitstrings."
             )
 
+        # Every setting's observed value is its coefficient times the parity
+        # of its qubits' bits, so we track one parity per distinct qubit set.
+        self._parity_index: Dict[FrozenSet['cirq.Qid'], int] = {}
+        for setting in simul_settings:
+            self._parity_index.setdefault(
+                frozenset(setting.observable.keys()), len(self._parity_index)
+            )
+        self._parity_masks = np.zeros((len(qubit_to_index), len(self._parity_index)))
+        for qubits, k in self._parity_index.items():
+            self._parity_masks[[qubit_to_index[q] for q in qubits], k] = 1
+        self._parity_sums = np.zeros(len(self._parity_index))
+        self._parity_products = np.zeros((len(self._parity_index), len(self._parity_index)))
+        self._update_parity_stats(bitstrings)
+
+        self._n_repetitions = len(bitstrings)
+        self._bitstring_chunks = [bitstrings] if retain_bitstrings else []
+
     @property
     def meas_spec(self):
         return self._meas_spec
@@ -251,6 +277,28 @@ class BitstringAccumulator:
     def qubit_to_index(self):
         return self._qubit_to_index
 
+    @property
+    def retain_bitstrings(self):
+        return self._retain_bitstrings
+
+    @property
+    def bitstrings(self) -> np.ndarray:
+        """All consumed bitstrings, one row per repetition."""
+        if not self._retain_bitstrings:
+            raise ValueError(
+                "This BitstringAccumulator was constructed with `retain_bitstrings=False`."
+            )
+        if len(self._bitstring_chunks) > 1:
+            self._bitstring_chunks = [np.concatenate(self._bitstring_chunks, axis=0)]
+        return self._bitstring_chunks[0]
+
+    def _update_parity_stats(self, bitstrings: np.ndarray):
+        # Float arithmetic uses BLAS and is exact for fewer than 2**53 repetitions.
+        parities = np.dot(bitstrings, self._parity_masks) % 2
+        signs = 1 - 2 * parities
+        self._parity_sums += np.sum(signs, axis=0)
+        self._parity_products += np.dot(signs.T, signs)
+
     def consume_results(self, bitstrings):
         """Add bitstrings sampled according to `meas_spec`.
 
@@ -261,13 +309,16 @@ class BitstringAccumulator:
         if bitstrings.dtype != np.uint8:
             raise ValueError("`bitstrings` should be of type np.uint8")
 
-        self.bitstrings = np.append(self.bitstrings, bitstrings, axis=0)
+        self._update_parity_stats(bitstrings)
+        self._n_repetitions += len(bitstrings)
+        if self._retain_bitstrings:
+            self._bitstring_chunks.append(bitstrings)
         self.chunksizes = np.append(self.chunksizes, [len(bitstrings)], axis=0)
         self.timestamps = np.append(self.timestamps, [np.datetime64(datetime.datetime.now())])
 
     @property
     def n_repetitions(self):
-        return len(self.bitstrings)
+        return self._n_repetitions
 
     @property
     def results(self):
@@ -278,7 +329,7 @@ class BitstringAccumulator:
                 setting=setting,
                 mean=self.mean(setting),
                 variance=self.variance(setting),
-                repetitions=len(self.bitstrings),
+                repetitions=self._n_repetitions,
                 circuit_params=self._meas_spec.circuit_params,
             )
 
@@ -296,18 +347,31 @@ class BitstringAccumulator:
             yield record
 
     def _json_dict_(self):
-        from cirq.study.result import _pack_digits
+        return self._serialized_dict(raw_arrays=False)
+
+    def _binary_json_dict_(self):
+        return self._serialized_dict(raw_arrays=True)
+
+    def _serialized_dict(self, raw_arrays: bool) -> Dict[str, Any]:
+        from cirq.study.result import _pack_digits, _raw_digits
 
         def ndarray_to_hex_str(a):
             return _pack_digits(a, pack_bits='never')[0]
 
+        # Timestamps are not numeric, so they are always packed.
+        encode_numeric = _raw_digits if raw_arrays else ndarray_to_hex_str
+
+        if not self._retain_bitstrings:
+            raise ValueError(
+                "Cannot serialize a BitstringAccumulator constructed with `retain_bitstrings=False`."
+            )
         return {
             'cirq_type': self.__class__.__name__,
             'meas_spec': self.meas_spec,
             'simul_settings': self.simul_settings,
             'qubit_to_index': list(self.qubit_to_index.items()),
-            'bitstrings': ndarray_to_hex_str(self.bitstrings),
-            'chunksizes': ndarray_to_hex_str(self.chunksizes),
+            'bitstrings': encode_numeric(self.bitstrings),
+            'chunksizes': encode_numeric(self.chunksizes),
             'timestamps': ndarray_to_hex_str(self.timestamps),
         }
 
@@ -323,9 +387,12 @@ class BitstringAccumulator:
         timestamps,
         **kwargs,
     ):
-        from cirq.study.result import _unpack_digits
+        from cirq.study.result import _unpack_digits, _unpack_raw_digits
 
         def hex_str_to_ndarray(hexstr):
+            # Arrays written by `cirq.to_json_binary` are not packed.
+            if isinstance(hexstr, dict):
+                return _unpack_raw_digits(**hexstr)
             # When binary=False, the other arguments are not needed.
             return _unpack_digits(hexstr, binary=False, dtype=None, shape=None)
 
@@ -350,7 +417,17 @@ class BitstringAccumulator:
         ):
             return False
 
-        if not np.array_equal(self.bitstrings, other.bitstrings):
+        if self._retain_bitstrings != other._retain_bitstrings:
+            return False
+
+        if self._retain_bitstrings:
+            if not np.array_equal(self.bitstrings, other.bitstrings):
+                return False
+        elif not (
+            self._n_repetitions == other._n_repetitions
+            and np.array_equal(self._parity_sums, other._parity_sums)
+            and np.array_equal(self._parity_products, other._parity_products)
+        ):
             return False
 
         if not np.array_equal(self.chunksizes, other.chunksizes):
@@ -367,6 +444,15 @@ class BitstringAccumulator:
         )
 
     def __repr__(self):
+        if not self._retain_bitstrings:
+            return (
+                f'cirq.work.BitstringAccumulator('
+                f'meas_spec={self.meas_spec!r}, '
+                f'simul_settings={self.simul_settings!r}, '
+                f'qubit_to_index={self.qubit_to_index!r}, '
+                f'readout_calibration={self._readout_calibration!r}, '
+                f'retain_bitstrings=False)'
+            )
         return (
             f'cirq.work.BitstringAccumulator('
             f'meas_spec={self.meas_spec!r}, '
@@ -393,27 +479,17 @@ class BitstringAccumulator:
         Args:
             atol: The absolute tolerance for asserting coefficients are real.
         """
-        if len(self.bitstrings) == 0:
+        if self._n_repetitions == 0:
             raise ValueError("No measurements")
 
-        all_obs_vals = np.array(
-            [
-                _obs_vals_from_measurements(
-                    bitstrings=self.bitstrings,
-                    qubit_to_index=self._qubit_to_index,
-                    observable=setting.observable,
-                    atol=atol,
-                )
-                for setting in self._simul_settings
-            ]
+        n = self._n_repetitions
+        idxs = [self._parity_index[frozenset(s.observable.keys())] for s in self._simul_settings]
+        coeffs = np.array(
+            [_check_and_get_real_coef(s.observable, atol=atol) for s in self._simul_settings]
         )
-
-        # https://github.com/numpy/numpy/issues/11502
-        if all_obs_vals.shape[0] == 1:
-            cov = np.array([[np.var(all_obs_vals[0], ddof=1)]])
-            return cov
-
-        cov = np.cov(all_obs_vals, ddof=1) / all_obs_vals.shape[1]
+        sums = self._parity_sums[idxs]
+        products = self._parity_products[np.ix_(idxs, idxs)]
+        cov = np.outer(coeffs, coeffs) * (products - np.outer(sums, sums) / n) / (n - 1) / n
         return cov
 
     def _validate_setting(self, setting: InitObsSetting, what: str):
@@ -425,6 +501,31 @@ class BitstringAccumulator:
                 f"with this BitstringAccumulator's meas_spec."
             )
 
+    def _stats(self, setting: InitObsSetting, atol: float) -> Tuple[float, float]:
+        """The mean and variance of the mean of `setting` without readout
+        correction."""
+        k = self._parity_index.get(frozenset(setting.observable.keys()))
+        if k is None:
+            if not self._retain_bitstrings:
+                raise ValueError(
+                    f"{setting} is not among this BitstringAccumulator's `simul_settings` "
+                    f"and the raw bitstrings were not retained."
+                )
+            return _stats_from_measurements(
+                bitstrings=self.bitstrings,
+                qubit_to_index=self._qubit_to_index,
+                observable=setting.observable,
+                atol=atol,
+            )
+
+        coeff = _check_and_get_real_coef(setting.observable, atol=atol)
+        n = self._n_repetitions
+        total = self._parity_sums[k]
+        # Parities are +-1 so the sum of their squares is `n`. Like
+        # `_stats_from_measurements`, this uses ddof=1.
+        var = coeff ** 2 * (n - total ** 2 / n) / np.float64(n - 1) / n
+        return (coeff * total / n).item(), var.item()
+
     def variance(self, setting: InitObsSetting, *, atol: float = 1e-8):
         """Compute the variance of the estimators of the given setting.
 
@@ -441,16 +542,11 @@ class BitstringAccumulator:
             setting: The setting
             atol: The absolute tolerance for asserting coefficients are real.
         """
-        if len(self.bitstrings) == 0:
+        if self._n_repetitions == 0:
             raise ValueError("No measurements")
         self._validate_setting(setting, what='variance')
 
-        mean, var = _stats_from_measurements(
-            bitstrings=self.bitstrings,
-            qubit_to_index=self._qubit_to_index,
-            observable=setting.observable,
-            atol=atol,
-        )
+        mean, var = self._stats(setting, atol=atol)
 
         if self._readout_calibration is not None:
             a = mean
@@ -480,16 +576,11 @@ class BitstringAccumulator:
 
     def mean(self, setting: InitObsSetting, *, atol: float = 1e-8):
         """Estimates of the mean of `setting`."""
-        if len(self.bitstrings) == 0:
+        if self._n_repetitions == 0:
             raise ValueError("No measurements")
         self._validate_setting(setting, what='mean')
 
-        mean, _ = _stats_from_measurements(
-            bitstrings=self.bitstrings,
-            qubit_to_index=self._qubit_to_index,
-            observable=setting.observable,
-            atol=atol,
-        )
+        mean, _ = self._stats(setting, atol=atol)
 
         if self._readout_calibration is not None:
             ro_setting = _setting_to_z_observable(setting)
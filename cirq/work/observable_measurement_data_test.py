@@ -24,7 +24,7 @@ from cirq.work.observable_measurement_data import (
     _obs_vals_from_measurements,
     _stats_from_measurements,
 )
-from cirq.work.observable_settings import _MeasurementSpec
+from cirq.work.observable_settings import _MeasurementSpec, zeros_state
 
 
 def test_get_real_coef():
@@ -202,6 +202,19 @@ def test_bitstring_accumulator_strings(example_bsa):
     )
 
 
+def test_bitstring_accumulator_json_binary(example_bsa):
+    bitstrings = np.random.RandomState(52).randint(2, size=(1000, 2)).astype(np.uint8)
+    example_bsa.consume_results(bitstrings)
+    example_bsa.consume_results(bitstrings[:10])
+
+    binary = cirq.to_json_binary(example_bsa)
+    assert b'_BinaryArray' in binary
+    loaded = cirq.read_json_binary(binary=binary)
+    assert loaded == example_bsa
+    np.testing.assert_array_equal(loaded.chunksizes, [1000, 10])
+    assert loaded.timestamps.dtype == example_bsa.timestamps.dtype
+
+
 def test_bitstring_accumulator_equality():
     et = cirq.testing.EqualsTester()
     bitstrings = np.array(
@@ -425,6 +438,82 @@ def test_bitstring_accumulator_stats_2():
         np.testing.assert_allclose(np.sqrt(var / 4 / (4 - 1)), bsa.stderr(setting))
 
 
+def _random_z_settings(qubits, prng, num_settings=6):
+    observables = []
+    for _ in range(num_settings):
+        # The last qubit is left out so that some compatible settings are not tracked.
+        support = [q for q in qubits[:-1] if prng.rand() < 0.5]
+        observables.append(cirq.PauliString({q: cirq.Z for q in support}, coefficient=prng.randn()))
+    return list(cw.observables_to_settings(observables, qubits=qubits))
+
+
+@pytest.mark.parametrize('retain_bitstrings', [True, False])
+def test_bitstring_accumulator_running_stats(retain_bitstrings):
+    prng = np.random.RandomState(11)
+    qubits = cirq.LineQubit.range(5)
+    qubit_to_index = {q: i for i, q in enumerate(qubits)}
+    settings = _random_z_settings(qubits, prng) + [_random_z_settings(qubits, prng, 1)[0]] * 2
+    max_setting = cw.InitObsSetting(
+        zeros_state(qubits), cirq.PauliString({q: cirq.Z for q in qubits})
+    )
+    bsa = cw.BitstringAccumulator(
+        meas_spec=_MeasurementSpec(max_setting, {}),
+        simul_settings=settings,
+        qubit_to_index=qubit_to_index,
+        retain_bitstrings=retain_bitstrings,
+    )
+    chunks = [prng.randint(2, size=(n, 5)).astype(np.uint8) for n in [7, 1, 30, 12]]
+    for chunk in chunks:
+        bsa.consume_results(chunk)
+    bitstrings = np.concatenate(chunks)
+    assert bsa.n_repetitions == 50
+    assert bsa.retain_bitstrings == retain_bitstrings
+
+    obs_vals = np.array(
+        [
+            _obs_vals_from_measurements(bitstrings, qubit_to_index, s.observable, atol=1e-8)
+            for s in settings
+        ]
+    )
+    np.testing.assert_allclose(bsa.means(), np.mean(obs_vals, axis=1), atol=1e-12)
+    np.testing.assert_allclose(bsa.covariance(), np.cov(obs_vals, ddof=1) / 50, atol=1e-12)
+    for setting in settings:
+        mean, var = _stats_from_measurements(bitstrings, qubit_to_index, setting.observable, 1e-8)
+        np.testing.assert_allclose(bsa.mean(setting), mean, atol=1e-12)
+        np.testing.assert_allclose(bsa.variance(setting), var, atol=1e-12)
+
+    # Settings which are not in `simul_settings` need the raw bitstrings.
+    other = cw.InitObsSetting(max_setting.init_state, cirq.Z(qubits[0]) * cirq.Z(qubits[4]) * 2)
+    if retain_bitstrings:
+        np.testing.assert_array_equal(bsa.bitstrings, bitstrings)
+        mean, _ = _stats_from_measurements(bitstrings, qubit_to_index, other.observable, 1e-8)
+        assert bsa.mean(other) == mean
+    else:
+        with pytest.raises(ValueError, match='retain_bitstrings'):
+            _ = bsa.bitstrings
+        with pytest.raises(ValueError, match='not retained'):
+            _ = bsa.mean(other)
+
+
+def test_bitstring_accumulator_without_bitstrings():
+    kwargs = _get_ZZ_Z_Z_bsa_constructor_args()
+    retained = cw.BitstringAccumulator(**kwargs)
+    dropped = cw.BitstringAccumulator(**kwargs, retain_bitstrings=False)
+    assert dropped.n_repetitions == 4
+    np.testing.assert_array_equal(dropped.chunksizes, [4])
+    np.testing.assert_allclose(dropped.covariance(), retained.covariance())
+    assert [r.repetitions for r in dropped.results] == [4, 4, 4]
+    assert repr(dropped).endswith('retain_bitstrings=False)')
+    with pytest.raises(ValueError, match='serialize'):
+        _ = cirq.to_json(dropped)
+
+    eq = cirq.testing.EqualsTester()
+    eq.add_equality_group(retained)
+    eq.add_equality_group(dropped, cw.BitstringAccumulator(**kwargs, retain_bitstrings=False))
+    kwargs['bitstrings'] = kwargs['bitstrings'][[0, 0, 2, 3]]
+    eq.add_equality_group(cw.BitstringAccumulator(**kwargs, retain_bitstrings=False))
+
+
 def test_bitstring_accumulator_errors():
     q0, q1 = cirq.LineQubit.range(2)
     settings = cw.observables_to_settings(
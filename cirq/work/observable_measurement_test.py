@@ -0,0 +1,242 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+import cirq.work as cw
+from cirq.work.observable_measurement import (
+    MEASURE_KEY,
+    _measurement_circuit,
+    _state_prep_ops,
+)
+
+
+class CountingSampler(cirq.Sampler):
+    """Records the programs and repetitions of every `run_batch` call."""
+
+    def __init__(self, seed=1234):
+        self._simulator = cirq.Simulator(seed=seed)
+        self.batches = []
+
+    def run_sweep(self, program, params, repetitions=1):
+        return self._simulator.run_sweep(program, params, repetitions)
+
+    def run_batch(self, programs, params_list=None, repetitions=1):
+        self.batches.append((len(programs), list(repetitions)))
+        return super().run_batch(programs, params_list, repetitions)
+
+
+@pytest.mark.parametrize(
+    'state',
+    [
+        cirq.KET_PLUS,
+        cirq.KET_MINUS,
+        cirq.KET_IMAG,
+        cirq.KET_MINUS_IMAG,
+        cirq.KET_ZERO,
+        cirq.KET_ONE,
+    ],
+)
+def test_state_prep_ops(state):
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.I(q), _state_prep_ops(state(q)))
+    cirq.testing.assert_allclose_up_to_global_phase(
+        circuit.final_state_vector(), state.state_vector(), atol=1e-7
+    )
+
+
+def test_measurement_circuit():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(a))
+    setting = cw.InitObsSetting(
+        init_state=cirq.KET_ONE(a) * cirq.KET_PLUS(b) * cirq.KET_ZERO(c),
+        observable=cirq.X(a) * cirq.Y(b),
+    )
+    program = _measurement_circuit(circuit, setting, [a, b, c])
+    assert len(program) == 4
+    assert program[1] == circuit[0]
+    assert program[-1] == cirq.Moment([cirq.measure(a, b, c, key=MEASURE_KEY)])
+
+    program = _measurement_circuit(circuit, cw.InitObsSetting(cirq.KET_ZERO(a), cirq.Z(a)), [a])
+    assert program == cirq.Circuit(cirq.H(a), cirq.measure(a, key=MEASURE_KEY))
+
+
+def test_measure_observables_bell_state():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(a), cirq.CNOT(a, b))
+    observables = [cirq.X(a) * cirq.X(b), cirq.Y(a) * cirq.Y(b), cirq.Z(a) * cirq.Z(b), cirq.Z(a)]
+    results = cw.measure_observables(
+        circuit,
+        observables,
+        cirq.Simulator(seed=52),
+        stopping_criteria=cw.RepetitionsStoppingCriteria(1000),
+    )
+    assert [result.observable for result in results] == observables
+    assert [result.repetitions for result in results] == [1000] * 4
+    np.testing.assert_allclose([result.mean for result in results[:3]], [1, -1, 1])
+    assert [result.variance for result in results[:3]] == [0, 0, 0]
+    assert abs(results[3].mean) < 0.15
+
+
+@pytest.mark.parametrize('grouper', ['greedy', 'sorted_insertion', cw.group_settings_greedy])
+def test_measure_observables_groupers(grouper):
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.H(b))
+    observables = [cirq.Z(a), 2 * cirq.X(b), -cirq.Z(a) * cirq.X(b), cirq.Z(b)]
+    sampler = CountingSampler()
+    results = cw.measure_observables(
+        circuit, observables, sampler, cw.RepetitionsStoppingCriteria(100), grouper=grouper
+    )
+    means = {result.observable: result.mean for result in results}
+    assert means[cirq.Z(a)] == -1
+    assert means[2 * cirq.X(b)] == 2
+    assert means[-cirq.Z(a) * cirq.X(b)] == 1
+    # Two groups, measured in a single batch.
+    assert sampler.batches == [(2, [100, 100])]
+
+    with pytest.raises(ValueError, match='Unknown grouping'):
+        _ = cw.measure_observables(
+            circuit, observables, sampler, cw.RepetitionsStoppingCriteria(100), grouper='bogus'
+        )
+
+
+def test_measure_grouped_settings_init_states():
+    q = cirq.LineQubit(0)
+    settings = [
+        cw.InitObsSetting(init_state=state(q), observable=pauli(q))
+        for state, pauli in [
+            (cirq.KET_PLUS, cirq.X),
+            (cirq.KET_MINUS, cirq.X),
+            (cirq.KET_IMAG, cirq.Y),
+            (cirq.KET_MINUS_IMAG, cirq.Y),
+            (cirq.KET_ONE, cirq.Z),
+        ]
+    ]
+    accumulators = cw.measure_grouped_settings(
+        cirq.Circuit(cirq.I(q)),
+        cw.group_settings_greedy(settings),
+        cirq.Simulator(seed=3),
+        cw.RepetitionsStoppingCriteria(50),
+    )
+    assert len(accumulators) == 5
+    means = {acc.simul_settings[0]: acc.means()[0] for acc in accumulators}
+    assert [means[setting] for setting in settings] == [1, -1, 1, -1, -1]
+
+
+def test_measure_grouped_settings_sweep():
+    q = cirq.LineQubit(0)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(cirq.X(q) ** t)
+    setting = cw.InitObsSetting(init_state=cirq.KET_ZERO(q), observable=cirq.Z(q))
+    sampler = CountingSampler()
+    accumulators = cw.measure_grouped_settings(
+        circuit,
+        {setting: [setting]},
+        sampler,
+        cw.RepetitionsStoppingCriteria(30, repetitions_per_chunk=20),
+        circuit_sweep=cirq.Points('t', [0, 1]),
+        retain_bitstrings=False,
+    )
+    assert not any(acc.retain_bitstrings for acc in accumulators)
+    assert [acc.circuit_params for acc in accumulators] == [{'t': 0}, {'t': 1}]
+    assert [acc.means()[0] for acc in accumulators] == [1, -1]
+    assert [acc.n_repetitions for acc in accumulators] == [30, 30]
+    np.testing.assert_array_equal(accumulators[0].chunksizes, [20, 10])
+    assert sampler.batches == [(1, [20]), (1, [10])]
+
+
+def test_variance_stopping_criteria():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(a), cirq.X(b) ** 0.25)
+    settings = list(cw.observables_to_settings([cirq.Z(a), cirq.Z(b), cirq.X(a)], [a, b]))
+    criteria = cw.VarianceStoppingCriteria(variance_bound=1e-3, repetitions_per_chunk=200)
+    sampler = CountingSampler()
+    accumulators = cw.measure_grouped_settings(
+        circuit, cw.group_settings_greedy(settings), sampler, criteria
+    )
+    for acc in accumulators:
+        assert criteria.more_repetitions(acc) == 0
+        for setting in acc.simul_settings:
+            assert acc.variance(setting) <= 1e-3
+    # Deterministic X(a) stops after the first chunk; Z(a) needs ~1000.
+    n_x, n_z = sorted(acc.n_repetitions for acc in accumulators)
+    assert n_x == 200
+    assert n_z >= 900
+    assert len(sampler.batches) > 1
+    assert all(max(reps) <= 200 for _, reps in sampler.batches)
+
+
+def test_variance_stopping_criteria_more_repetitions():
+    q = cirq.LineQubit(0)
+    setting = cw.InitObsSetting(init_state=cirq.KET_ZERO(q), observable=cirq.Z(q))
+    acc = cw.BitstringAccumulator(
+        meas_spec=cw._MeasurementSpec(setting, {}),
+        simul_settings=[setting],
+        qubit_to_index={q: 0},
+    )
+    criteria = cw.VarianceStoppingCriteria(variance_bound=0.01, repetitions_per_chunk=1000)
+    assert criteria.more_repetitions(acc) == 1000
+    acc.consume_results(np.array([[0], [1]] * 5, dtype=np.uint8))
+    # Variance of the mean is ~0.11; about 111 samples are needed in total.
+    assert criteria.more_repetitions(acc) == 102
+    acc.consume_results(np.array([[0], [1]] * 100, dtype=np.uint8))
+    assert criteria.more_repetitions(acc) == 0
+
+
+def test_max_programs_per_batch_and_concurrency():
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H.on_each(*qubits))
+    observables = [cirq.X(q) for q in qubits] + [cirq.Z(q) for q in qubits] + [cirq.Y(qubits[0])]
+    for concurrency in [1, 2]:
+        sampler = CountingSampler()
+        results = cw.measure_observables(
+            circuit,
+            observables,
+            sampler,
+            cw.RepetitionsStoppingCriteria(10),
+            max_programs_per_batch=1,
+            concurrency=concurrency,
+        )
+        assert sorted(sampler.batches) == [(1, [10])] * 3
+        assert [result.observable for result in results] == observables
+        assert [result.mean for result in results[:3]] == [1, 1, 1]
+        assert all(result.repetitions == 10 for result in results)
+
+    with pytest.raises(ValueError, match='positive'):
+        _ = cw.measure_observables(
+            circuit,
+            observables,
+            sampler,
+            cw.RepetitionsStoppingCriteria(10),
+            max_programs_per_batch=0,
+        )
+
+
+def test_reserved_measurement_key():
+    q = cirq.LineQubit(0)
+    with pytest.raises(ValueError, match='reserved'):
+        _ = cw.measure_observables(
+            cirq.Circuit(cirq.measure(q, key=MEASURE_KEY)),
+            [cirq.Z(q)],
+            cirq.Simulator(),
+            cw.RepetitionsStoppingCriteria(10),
+        )
+
+
+def test_stopping_criteria_repr():
+    cirq.testing.assert_equivalent_repr(cw.VarianceStoppingCriteria(1e-3))
+    cirq.testing.assert_equivalent_repr(cw.RepetitionsStoppingCriteria(100, 10))
@@ -0,0 +1,268 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A sampler sharding the work of another sampler across processes."""
+
+import collections
+import concurrent.futures
+import hashlib
+import multiprocessing
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
+
+import numpy as np
+
+from cirq import study, value
+from cirq.work import executor_sampler, sampler
+
+if TYPE_CHECKING:
+    import cirq
+
+# The number of unpickled circuits each worker process keeps.
+_WORKER_CACHE_SIZE = 32
+
+# The wrapped sampler and the circuits it has seen, in a worker process.
+_worker_sampler: Optional['cirq.Sampler'] = None
+_worker_programs: 'collections.OrderedDict[bytes, cirq.Circuit]' = collections.OrderedDict()
+
+
+def _set_worker_sampler(pickled_sampler: bytes):
+    global _worker_sampler
+    _worker_sampler = pickle.loads(pickled_sampler)
+    _worker_programs.clear()
+
+
+def _run_shard(
+    wrapped: 'cirq.Sampler',
+    program: 'cirq.Circuit',
+    resolvers: List['cirq.ParamResolver'],
+    repetitions: int,
+    seed: int,
+) -> List['cirq.Result']:
+    wrapped = executor_sampler._reseeded(wrapped, np.random.RandomState(seed))
+    return wrapped.run_sweep(program, study.ListSweep(resolvers), repetitions)
+
+
+def _run_worker_shard(
+    key: bytes,
+    pickled_program: bytes,
+    resolvers: List['cirq.ParamResolver'],
+    repetitions: int,
+    seed: int,
+) -> List['cirq.Result']:
+    assert _worker_sampler is not None
+    program = _worker_programs.get(key)
+    if program is None:
+        program = pickle.loads(pickled_program)
+        _worker_programs[key] = program
+        if len(_worker_programs) > _WORKER_CACHE_SIZE:
+            _worker_programs.popitem(last=False)
+    else:
+        _worker_programs.move_to_end(key)
+    return _run_shard(_worker_sampler, program, resolvers, repetitions, seed)
+
+
+def _chunks(total: int, size: int) -> List[Tuple[int, int]]:
+    """Splits range(total) into consecutive (start, stop) chunks of at most `size`."""
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+class ProcessPoolSampler(sampler.Sampler):
+    """Shards the sweeps and repetitions of a sampler across worker processes.
+
+    Every `run_sweep` (and every program of a `run_batch`) is split into
+    shards: contiguous chunks of its sweep points and, if
+    `repetitions_per_shard` is given, chunks of its repetitions. The shards of
+    a whole batch run on a pool of worker processes, and the results of the
+    repetition chunks of a sweep point are concatenated in order.
+
+    The random state of the wrapped sampler is replaced for every shard by one
+    seeded from a stream derived from `seed`, so the results do not depend on
+    how the shards are scheduled and are reproducible for a fixed `seed`. This
+    covers samplers keeping their random state in a `_prng` attribute, such as
+    `cirq.Simulator`, `cirq.DensityMatrixSimulator` and
+    `cirq.StabilizerSampler`, including when they are wrapped by another
+    sampler such as `cirq.google.PhasedFSimEngineSimulator`.
+
+    The worker processes are spawned when first needed and are reused by
+    later calls until `close` is called. They receive a pickled copy of the
+    wrapped sampler as it is at that time, once per worker, so the sampler
+    must be picklable apart from its random state; a `ValueError` is raised
+    otherwise. Any other state the wrapped sampler draws lazily, like the gate
+    drifts of a `PhasedFSimEngineSimulator` with random drifts, is drawn
+    independently by each worker: draw it beforehand, e.g. with
+    `get_calibrations`.
+
+    Each circuit is pickled once per call, and each worker keeps the circuits
+    it has unpickled so repeated calls with the same circuit skip that cost.
+
+    With `max_workers=1`, shards run in this process, each on a copy of the
+    wrapped sampler, which then need not be picklable.
+    """
+
+    def __init__(
+        self,
+        sampler: 'cirq.Sampler',
+        *,
+        max_workers: Optional[int] = None,
+        repetitions_per_shard: Optional[int] = None,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+    ):
+        """Inits ProcessPoolSampler.
+
+        Args:
+            sampler: The sampler doing the work. It is not modified; each
+                shard runs on a copy.
+            max_workers: The number of worker processes. Defaults to the
+                number of processors.
+            repetitions_per_shard: If given, the repetitions of every sweep
+                point are split into chunks of at most this size. This helps
+                when each repetition is simulated separately, e.g. for noisy
+                circuits or circuits with intermediate measurements, but adds
+                work when all repetitions are sampled from one final state.
+            seed: The random seed or generator from which shard seeds are
+                drawn.
+        """
+        if repetitions_per_shard is not None and repetitions_per_shard < 1:
+            raise ValueError('repetitions_per_shard must be positive.')
+        self._sampler = sampler
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._repetitions_per_shard = repetitions_per_shard
+        self._prng = value.parse_random_state(seed)
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def sampler(self) -> 'cirq.Sampler':
+        return self._sampler
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        if self._pool is None and self._max_workers > 1:
+            # Workers replace the random state for every shard. Replacing it
+            # here too lets unseeded simulators, which refer to the np.random
+            # module, be pickled.
+            wrapped = executor_sampler._reseeded(self._sampler, np.random.RandomState())
+            try:
+                pickled_sampler = pickle.dumps(wrapped)
+            except (AttributeError, TypeError, pickle.PicklingError) as error:
+                raise ValueError(
+                    f'The sampler cannot be sent to worker processes: {error}. '
+                    'Use max_workers=1 to run it in this process instead.'
+                ) from error
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_set_worker_sampler,
+                initargs=(pickled_sampler,),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> 'ProcessPoolSampler':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run_sweep(
+        self,
+        program: 'cirq.Circuit',
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        return self.run_batch([program], [params], repetitions)[0]
+
+    def run_batch(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions: Union[int, List[int]] = 1,
+    ) -> List[List['cirq.Result']]:
+        params_list, repetitions = sampler._normalize_batch_args(programs, params_list, repetitions)
+        resolvers_list = [list(study.to_resolvers(params)) for params in params_list]
+
+        # Each shard is (program index, sweep point chunk, repetitions).
+        shards: List[Tuple[int, Tuple[int, int], int]] = []
+        for i, (resolvers, reps) in enumerate(zip(resolvers_list, repetitions)):
+            points_per_shard = max(1, -(-len(resolvers) // self._max_workers))
+            rep_chunks = [(0, reps)]
+            if self._repetitions_per_shard is not None and reps > 0:
+                rep_chunks = _chunks(reps, self._repetitions_per_shard)
+            for point_chunk in _chunks(len(resolvers), points_per_shard):
+                for start, stop in rep_chunks:
+                    shards.append((i, point_chunk, stop - start))
+        # Seeds are drawn in shard order, independently of scheduling.
+        seeds = self._prng.randint(2 ** 31, size=len(shards))
+
+        pool = self._get_pool()
+        if pool is None:
+            shard_results = [
+                _run_shard(self._sampler, programs[i], resolvers_list[i][a:b], reps, seed)
+                for (i, (a, b), reps), seed in zip(shards, seeds)
+            ]
+        else:
+            pickled: Dict[int, Tuple[bytes, bytes]] = {}
+            for i in {i for i, _, _ in shards}:
+                blob = pickle.dumps(programs[i])
+                pickled[i] = (hashlib.sha1(blob).digest(), blob)
+            futures = [
+                pool.submit(_run_worker_shard, *pickled[i], resolvers_list[i][a:b], reps, int(seed))
+                for (i, (a, b), reps), seed in zip(shards, seeds)
+            ]
+            shard_results = [future.result() for future in futures]
+
+        # Concatenate the repetition chunks of every sweep point, in order.
+        merged: List[List[List['cirq.Result']]] = [
+            [[] for _ in resolvers] for resolvers in resolvers_list
+        ]
+        for (i, (a, _), _), results in zip(shards, shard_results):
+            for j, result in enumerate(results):
+                merged[i][a + j].append(result)
+        return [
+            [
+                _concatenate_results(resolver, parts)
+                for resolver, parts in zip(resolvers, point_parts)
+            ]
+            for resolvers, point_parts in zip(resolvers_list, merged)
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.ProcessPoolSampler({self._sampler!r}, '
+            f'max_workers={self._max_workers!r}, '
+            f'repetitions_per_shard={self._repetitions_per_shard!r})'
+        )
+
+
+def _concatenate_results(
+    resolver: 'cirq.ParamResolver', parts: List['cirq.Result']
+) -> 'cirq.Result':
+    if len(parts) == 1:
+        return parts[0]
+    return study.Result.from_single_parameter_set(
+        params=resolver,
+        measurements={
+            key: np.concatenate([part.measurements[key] for part in parts], axis=0)
+            for key in parts[0].measurements
+        },
+    )
@@ -0,0 +1,183 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from unittest import mock
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+import cirq.google
+from cirq.work import process_pool_sampler
+
+
+def _random_circuit():
+    a, b = cirq.LineQubit.range(2)
+    return cirq.Circuit(cirq.H(a), cirq.H(b), cirq.measure(a, b, key='m'))
+
+
+def test_process_pool_sampler_is_reproducible():
+    circuit = _random_circuit()
+    with cirq.ProcessPoolSampler(cirq.Simulator(), max_workers=2, seed=5) as sampler:
+        first = sampler.run(circuit, repetitions=100)
+    with cirq.ProcessPoolSampler(
+        cirq.Simulator(), max_workers=2, seed=np.random.RandomState(5)
+    ) as sampler:
+        second = sampler.run(circuit, repetitions=100)
+        third = sampler.run(circuit, repetitions=100)
+    assert first == second
+    assert first != third
+    assert first.measurements['m'].shape == (100, 2)
+
+
+def test_process_pool_sampler_repetition_shards():
+    circuit = _random_circuit()
+    with cirq.ProcessPoolSampler(
+        cirq.Simulator(), max_workers=2, repetitions_per_shard=10, seed=5
+    ) as sampler:
+        result = sampler.run(circuit, repetitions=25)
+    m = result.measurements['m']
+    assert m.shape == (25, 2)
+    # Each shard draws from its own stream.
+    assert not np.array_equal(m[:10], m[10:20])
+
+    with pytest.raises(ValueError, match='positive'):
+        _ = cirq.ProcessPoolSampler(cirq.Simulator(), repetitions_per_shard=0)
+
+
+def test_process_pool_sampler_sweep_order():
+    q = cirq.LineQubit(0)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(cirq.X(q) ** t, cirq.measure(q, key='m'))
+    sweep = cirq.Points('t', [0, 1, 1, 0, 1])
+    with cirq.ProcessPoolSampler(
+        cirq.Simulator(), max_workers=2, repetitions_per_shard=2
+    ) as sampler:
+        results = sampler.run_sweep(circuit, sweep, repetitions=3)
+    assert [r.params for r in results] == list(cirq.to_resolvers(sweep))
+    assert [r.measurements['m'][:, 0].tolist() for r in results] == [
+        [t] * 3 for t in [0, 1, 1, 0, 1]
+    ]
+
+
+class _WrappingSampler(cirq.Sampler):
+    def __init__(self, sampler):
+        self._sampler = sampler
+
+    def run_sweep(self, program, params, repetitions=1):
+        return self._sampler.run_sweep(program, params, repetitions)
+
+
+@pytest.mark.parametrize(
+    'make_sampler',
+    [
+        lambda: cirq.Simulator(),
+        lambda: cirq.DensityMatrixSimulator(),
+        lambda: cirq.StabilizerSampler(),
+        lambda: _WrappingSampler(cirq.Simulator()),
+        lambda: cirq.google.PhasedFSimEngineSimulator.create_with_ideal_sqrt_iswap(),
+    ],
+)
+def test_process_pool_sampler_wrapped_samplers(make_sampler):
+    circuit = _random_circuit()
+    results = []
+    for max_workers in [1, 2]:
+        with cirq.ProcessPoolSampler(
+            make_sampler(), max_workers=max_workers, repetitions_per_shard=5, seed=11
+        ) as sampler:
+            results.append(sampler.run(circuit, repetitions=20))
+    # Shards run in this process or in workers draw from the same streams.
+    assert results[0] == results[1]
+    m = results[0].measurements['m']
+    assert len({m[i : i + 5].tobytes() for i in range(0, 20, 5)}) > 1
+
+
+def test_process_pool_sampler_run_batch():
+    q = cirq.LineQubit(0)
+    circuits = [
+        cirq.Circuit(cirq.measure(q, key='m')),
+        cirq.Circuit(cirq.X(q), cirq.measure(q, key='m')),
+    ]
+    with cirq.ProcessPoolSampler(cirq.Simulator(), max_workers=3) as sampler:
+        results = sampler.run_batch(circuits, [None, [{}] * 4], repetitions=[2, 3])
+        # Reuses the pool and the programs cached by the workers.
+        again = sampler.run_batch(circuits, repetitions=1)
+    assert [len(r) for r in results] == [1, 4]
+    assert results[0][0].measurements['m'].tolist() == [[0]] * 2
+    assert all(r.measurements['m'].tolist() == [[1]] * 3 for r in results[1])
+    assert [r[0].measurements['m'].tolist() for r in again] == [[[0]], [[1]]]
+
+
+def test_process_pool_sampler_in_process():
+    simulator = cirq.google.PhasedFSimEngineSimulator.create_with_random_gaussian_sqrt_iswap(
+        random_or_seed=1
+    )
+    inner = simulator._simulator
+    prng = inner._prng
+    circuit = _random_circuit()
+    results = []
+    for _ in range(2):
+        sampler = cirq.ProcessPoolSampler(simulator, max_workers=1, seed=3)
+        results.append(sampler.run_sweep(circuit, [{}] * 3, repetitions=20))
+        assert sampler._pool is None
+    assert results[0] == results[1]
+    assert len({r.measurements['m'].tobytes() for r in results[0]}) > 1
+    # The wrapped sampler is not modified.
+    assert simulator._simulator is inner
+    assert inner._prng is prng
+
+
+def test_process_pool_sampler_empty_sweeps():
+    circuit = _random_circuit()
+    for max_workers in [1, 2]:
+        sampler = cirq.ProcessPoolSampler(cirq.Simulator(), max_workers=max_workers)
+        assert sampler.run_sweep(circuit, cirq.ListSweep([]), repetitions=3) == []
+        results = sampler.run_batch([circuit, circuit], [[], None], repetitions=3)
+        assert results[0] == []
+        assert results[1][0].measurements['m'].shape == (3, 2)
+        sampler.close()
+
+
+def test_process_pool_sampler_unpicklable_sampler():
+    sampler = cirq.ProcessPoolSampler(_WrappingSampler(lambda: None), max_workers=2)
+    with pytest.raises(ValueError, match='max_workers=1'):
+        _ = sampler.run(_random_circuit())
+    assert sampler._pool is None
+
+
+def test_process_pool_sampler_worker_cache():
+    q = cirq.LineQubit(0)
+    process_pool_sampler._set_worker_sampler(pickle.dumps(cirq.ZerosSampler()))
+    with mock.patch.object(process_pool_sampler, '_WORKER_CACHE_SIZE', 2):
+        for key in [b'0', b'1', b'2']:
+            circuit = cirq.Circuit(cirq.measure(q, key=key.decode()))
+            _ = process_pool_sampler._run_worker_shard(
+                key, pickle.dumps(circuit), [cirq.ParamResolver()], 1, 0
+            )
+        # Cached programs are not unpickled again.
+        results = process_pool_sampler._run_worker_shard(b'1', b'', [cirq.ParamResolver()], 1, 0)
+    assert list(results[0].measurements) == ['1']
+    assert list(process_pool_sampler._worker_programs) == [b'2', b'1']
+
+
+def test_process_pool_sampler_repr():
+    sampler = cirq.ProcessPoolSampler(cirq.ZerosSampler(), max_workers=2)
+    assert sampler.max_workers == 2
+    assert isinstance(sampler.sampler, cirq.ZerosSampler)
+    assert repr(sampler) == (
+        f'cirq.ProcessPoolSampler({sampler.sampler!r}, '
+        'max_workers=2, repetitions_per_shard=None)'
+    )
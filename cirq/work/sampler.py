@@ -13,8 +13,9 @@
 # limitations under the License.
 """Abstract base class for things sampling quantum circuits."""
 
-from typing import List, Optional, TYPE_CHECKING, Union
+from typing import List, Optional, Tuple, TYPE_CHECKING, Union
 import abc
+import asyncio
 
 import pandas as pd
 
@@ -161,6 +162,8 @@ class Sampler(metaclass=abc.ABCMeta):
         By default, this method invokes `run` synchronously and simply exposes
         its result is an awaitable. Child classes that are capable of true
         asynchronous sampling should override it to use other strategies.
+        Wrap a sampler in a `cirq.ExecutorSampler` to run its calls on a pool
+        of workers instead.
 
         Args:
             program: The circuit to sample from.
@@ -182,6 +185,8 @@ class Sampler(metaclass=abc.ABCMeta):
         By default, this method invokes `run_sweep` synchronously and simply
         exposes its result is an awaitable. Child classes that are capable of
         true asynchronous sampling should override it to use other strategies.
+        Wrap a sampler in a `cirq.ExecutorSampler` to run its calls on a pool
+        of workers instead.
 
         Args:
             program: The circuit to sample from.
@@ -235,21 +240,98 @@ class Sampler(metaclass=abc.ABCMeta):
             for the corresponding circuit, in the order imposed by the
             associated parameter sweep.
         """
-        if params_list is None:
-            params_list = [None] * len(programs)
-        if len(programs) != len(params_list):
-            raise ValueError(
-                'len(programs) and len(params_list) must match. '
-                f'Got {len(programs)} and {len(params_list)}.'
-            )
-        if isinstance(repetitions, int):
-            repetitions = [repetitions] * len(programs)
-        if len(programs) != len(repetitions):
-            raise ValueError(
-                'len(programs) and len(repetitions) must match. '
-                f'Got {len(programs)} and {len(repetitions)}.'
-            )
+        params_list, repetitions = _normalize_batch_args(programs, params_list, repetitions)
         return [
             self.run_sweep(circuit, params=params, repetitions=repetitions)
             for circuit, params, repetitions in zip(programs, params_list, repetitions)
         ]
+
+    async def run_batch_async(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions: Union[int, List[int]] = 1,
+        *,
+        concurrency: int = 2,
+        timeout: Optional[float] = None,
+    ) -> List[List['cirq.Result']]:
+        """Asynchronously runs the supplied circuits.
+
+        The arguments are paired up as in `run_batch`. Each (circuit,
+        parameter sweep, repetitions) tuple is run with `run_sweep_async`, and
+        at most `concurrency` of them are in flight at any given time. The
+        next one is only started once a running one completes, so a large
+        batch does not flood the sampler.
+
+        If any run fails or times out, the runs still in flight are cancelled
+        and the error is raised. Cancelling the returned awaitable likewise
+        cancels the runs in flight. Note that runs executing on a worker
+        thread cannot be interrupted; only their results are discarded.
+
+        Args:
+            programs: The circuits to execute as a batch.
+            params_list: Parameter sweeps to use with the circuits. The number
+                of sweeps should match the number of circuits and will be
+                paired in order with the circuits.
+            repetitions: Number of circuit repetitions to run. Can be specified
+                as a single value to use for all runs, or as a list of values,
+                one for each circuit.
+            concurrency: The maximum number of runs in flight at once.
+            timeout: If not None, the number of seconds each run may take
+                before it is cancelled and `asyncio.TimeoutError` is raised.
+
+        Returns:
+            An awaitable list of lists of TrialResults, in the same order as
+            returned by `run_batch`.
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be positive. Got {concurrency}.')
+        params_list, repetitions = _normalize_batch_args(programs, params_list, repetitions)
+        results: List[List['cirq.Result']] = [[] for _ in programs]
+        # Shared by all workers, so each index is claimed exactly once.
+        indices = iter(range(len(programs)))
+
+        async def worker():
+            for i in indices:
+                results[i] = await asyncio.wait_for(
+                    self.run_sweep_async(
+                        programs[i], params=params_list[i], repetitions=repetitions[i]
+                    ),
+                    timeout,
+                )
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(programs)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for w in workers:
+                w.cancel()
+            raise
+        return results
+
+
+def _normalize_batch_args(
+    programs: List['cirq.Circuit'],
+    params_list: Optional[List['cirq.Sweepable']],
+    repetitions: Union[int, List[int]],
+) -> Tuple[List['cirq.Sweepable'], List[int]]:
+    """Validates the arguments of `run_batch` and broadcasts defaults.
+
+    Returns:
+        The parameter sweeps and repetitions, one for each program.
+    """
+    if params_list is None:
+        params_list = [None] * len(programs)
+    if len(programs) != len(params_list):
+        raise ValueError(
+            'len(programs) and len(params_list) must match. '
+            f'Got {len(programs)} and {len(params_list)}.'
+        )
+    if isinstance(repetitions, int):
+        repetitions = [repetitions] * len(programs)
+    if len(programs) != len(repetitions):
+        raise ValueError(
+            'len(programs) and len(repetitions) must match. '
+            f'Got {len(programs)} and {len(repetitions)}.'
+        )
+    return params_list, repetitions
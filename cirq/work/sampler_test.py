@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for cirq.Sampler."""
+import asyncio
+import threading
+
 import pytest
 
 import numpy as np
@@ -198,3 +201,142 @@ def test_sampler_run_batch_bad_input_lengths():
         _ = sampler.run_batch(
             [circuit1, circuit2], params_list=[params1, params2], repetitions=[1, 2, 3]
         )
+
+
+@pytest.mark.asyncio
+async def test_sampler_async_runs_synchronously():
+    threads = []
+
+    class S(cirq.Sampler):
+        def run_sweep(self, program, params, repetitions: int = 1):
+            threads.append(threading.get_ident())
+            return cirq.ZerosSampler().run_sweep(program, params, repetitions)
+
+    q = cirq.LineQubit(0)
+    result = await S().run_async(cirq.Circuit(cirq.measure(q, key='m')), repetitions=3)
+    assert result.measurements['m'].shape == (3, 1)
+    assert threads == [threading.get_ident()]
+
+
+def test_sampler_collect_is_reproducible():
+    class TestCollector(cirq.Collector):
+        def __init__(self):
+            self.results = []
+
+        def next_job(self):
+            q = cirq.LineQubit(0)
+            circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+            return cirq.CircuitSampleJob(circuit=circuit, repetitions=10, tag=None)
+
+        def on_job_result(self, job, result):
+            self.results.append(result.measurements['m'].tolist())
+
+    collected = []
+    for _ in range(2):
+        collector = TestCollector()
+        collector.collect(cirq.Simulator(seed=5), concurrency=4, max_total_samples=80)
+        collected.append(collector.results)
+    assert collected[0] == collected[1]
+
+
+class SleepingSampler(cirq.Sampler):
+    """Sleeps for `delays[i]` seconds when asked to run the `i`th circuit."""
+
+    def __init__(self, delays, fail_on=None):
+        self.delays = delays
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+        self.cancelled = []
+
+    def run_sweep(self, program, params, repetitions: int = 1):
+        return cirq.ZerosSampler().run_sweep(program, params, repetitions)
+
+    async def run_sweep_async(self, program, params, repetitions: int = 1):
+        i = repetitions
+        self.started.append(i)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[i])
+            if i == self.fail_on:
+                raise ValueError(f'failed {i}')
+        except asyncio.CancelledError:
+            self.cancelled.append(i)
+            raise
+        finally:
+            self.in_flight -= 1
+        return self.run_sweep(program, params, repetitions)
+
+
+def _circuit():
+    q = cirq.LineQubit(0)
+    return cirq.Circuit(cirq.measure(q, key='m'))
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async():
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(a) ** sympy.Symbol('t'), cirq.measure(a, key='m'))
+    params_list = [cirq.Points('t', [0.3, 0.7]), cirq.Points('t', [0.4, 0.6])]
+    sampler = cirq.ZerosSampler()
+    expected = sampler.run_batch([circuit] * 2, params_list=params_list, repetitions=[1, 2])
+    results = await sampler.run_batch_async(
+        [circuit] * 2, params_list=params_list, repetitions=[1, 2]
+    )
+    assert results == expected
+    assert await sampler.run_batch_async([]) == []
+    with pytest.raises(ValueError, match='2 and 1'):
+        _ = await sampler.run_batch_async([circuit] * 2, params_list=params_list[:1])
+    with pytest.raises(ValueError, match='concurrency'):
+        _ = await sampler.run_batch_async([circuit], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_bounded_window():
+    # Repetitions double as indices into the delays.
+    sampler = SleepingSampler(delays=[0.03, 0.0, 0.01, 0.0, 0.02, 0.0])
+    results = await sampler.run_batch_async(
+        [_circuit()] * 6, repetitions=list(range(6)), concurrency=2
+    )
+    assert [r[0].repetitions for r in results] == list(range(6))
+    assert sampler.max_in_flight == 2
+    assert sorted(sampler.started) == list(range(6))
+    assert sampler.cancelled == []
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_failure_cancels_in_flight():
+    sampler = SleepingSampler(delays=[10, 0.01, 10, 10], fail_on=1)
+    with pytest.raises(ValueError, match='failed 1'):
+        _ = await sampler.run_batch_async(
+            [_circuit()] * 4, repetitions=list(range(4)), concurrency=3
+        )
+    await asyncio.sleep(0)
+    assert sorted(sampler.cancelled) == [0, 2]
+    assert 3 not in sampler.started
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_timeout():
+    sampler = SleepingSampler(delays=[0.0, 10, 0.0])
+    with pytest.raises(asyncio.TimeoutError):
+        _ = await sampler.run_batch_async(
+            [_circuit()] * 3, repetitions=list(range(3)), concurrency=1, timeout=0.05
+        )
+    assert sampler.cancelled == [1]
+    assert sampler.started == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_cancel():
+    sampler = SleepingSampler(delays=[10, 10])
+    task = asyncio.ensure_future(
+        sampler.run_batch_async([_circuit()] * 2, repetitions=[0, 1], concurrency=2)
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert sorted(sampler.cancelled) == [0, 1]
@@ -0,0 +1,93 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tool for benchmarking JSON decoding of large circuits.
+
+Unlike benchmark_serializers.py, which times full round trips, this only
+times `cirq.read_json` on pre-serialized text, which isolates the cost of
+resolving `cirq_type`s and constructing objects.
+
+Run this benchmark with the following command (make sure to install cirq-dev):
+
+    python3 dev_tools/profiling/benchmark_json_decoding.py \
+        --num_operations=<int> --num_qubits=<int> --num_repetitions=<int>
+"""
+
+import argparse
+import sys
+import timeit
+
+import numpy as np
+
+import cirq
+
+
+def circuit_json(num_operations: int, num_qubits: int, seed: int = 0) -> str:
+    """Returns the JSON of a random circuit of common gates on grid qubits."""
+    prng = np.random.RandomState(seed)
+    qubits = cirq.GridQubit.rect(1, num_qubits)
+    operations = []
+    for _ in range(num_operations):
+        which = prng.choice(['phxz', 'z', 'cz', 'sqrt_iswap'])
+        i = prng.randint(num_qubits - 1)
+        if which == 'phxz':
+            gate = cirq.PhasedXZGate(
+                x_exponent=prng.random_sample(),
+                z_exponent=prng.random_sample(),
+                axis_phase_exponent=prng.random_sample(),
+            )
+            operations.append(gate.on(qubits[i]))
+        elif which == 'z':
+            operations.append(cirq.Z(qubits[i]) ** prng.random_sample())
+        elif which == 'cz':
+            operations.append(cirq.CZ(qubits[i], qubits[i + 1]))
+        else:
+            operations.append(cirq.ISWAP(qubits[i], qubits[i + 1]) ** 0.5)
+    return cirq.to_json(cirq.Circuit(operations))
+
+
+def decode(json_text: str) -> 'cirq.Circuit':
+    """Decodes the given JSON text."""
+    return cirq.read_json(json_text=json_text)
+
+
+def main(
+    num_operations: int,
+    num_qubits: int,
+    num_repetitions: int,
+    setup: str = 'from __main__ import decode',
+):
+    json_text = circuit_json(num_operations, num_qubits)
+    time = timeit.timeit(
+        'decode(json_text)', setup, number=num_repetitions, globals={'json_text': json_text}
+    )
+    print(f'Decoding {num_operations} operations on {num_qubits} qubits:')
+    print(f'  {len(json_text) / 1024:.1f} kB of JSON')
+    print(f'  {time / num_repetitions:.4f}s per decode')
+
+
+def parse_arguments(args):
+    parser = argparse.ArgumentParser('Benchmark JSON decoding.')
+    parser.add_argument(
+        '--num_operations', default=10000, type=int, help='Number of operations in the circuit.'
+    )
+    parser.add_argument('--num_qubits', default=20, type=int, help='Number of qubits.')
+    parser.add_argument(
+        '--num_repetitions', default=5, type=int, help='Number of times to repeat decoding.'
+    )
+    return vars(parser.parse_args(args))
+
+
+if __name__ == '__main__':
+    main(**parse_arguments(sys.argv[1:]))
@@ -0,0 +1,50 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the JSON decoding benchmarker."""
+
+import cirq
+from dev_tools.profiling import benchmark_json_decoding
+
+
+def test_decode():
+    json_text = benchmark_json_decoding.circuit_json(20, 4)
+    circuit = benchmark_json_decoding.decode(json_text)
+    assert len(list(circuit.all_operations())) == 20
+    assert cirq.to_json(circuit) == json_text
+
+
+def test_args_have_defaults():
+    kwargs = benchmark_json_decoding.parse_arguments([])
+    for _, v in kwargs.items():
+        assert v is not None
+
+
+def test_main_loop():
+    benchmark_json_decoding.main(
+        num_operations=10,
+        num_qubits=3,
+        num_repetitions=1,
+        setup='from dev_tools.profiling.benchmark_json_decoding import decode',
+    )
+
+
+def test_parse_args():
+    args = '--num_operations 5 --num_qubits 3 --num_repetitions 2'.split()
+    kwargs = benchmark_json_decoding.parse_arguments(args)
+    assert kwargs == {
+        'num_operations': 5,
+        'num_qubits': 3,
+        'num_repetitions': 2,
+    }
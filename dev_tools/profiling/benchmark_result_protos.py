@@ -0,0 +1,108 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tool for benchmarking conversion of measurement results to and from protos.
+
+This times `cirq.google.api.v2.results_to_proto` and `results_from_proto`,
+which pack and unpack the measured bits of every qubit in every parameter
+point of a batch of sweeps.
+
+Run this benchmark with the following command (make sure to install cirq-dev):
+
+    python3 dev_tools/profiling/benchmark_result_protos.py \
+        --num_qubits=<int> --repetitions=<int> --num_points=<int> \
+        --num_sweeps=<int> --num_repetitions=<int>
+"""
+
+import argparse
+import sys
+import timeit
+from typing import List, Tuple
+
+import numpy as np
+
+import cirq
+from cirq.google.api import v2
+
+
+def trial_sweeps(
+    num_qubits: int, repetitions: int, num_points: int, num_sweeps: int, seed: int = 0
+) -> Tuple[List[List[cirq.Result]], List[v2.MeasureInfo]]:
+    """Returns random results of measuring all qubits in a sweep, and the
+    corresponding measurement info."""
+    prng = np.random.RandomState(seed)
+    qubits = cirq.GridQubit.rect(1, num_qubits)
+    measurements = v2.find_measurements(cirq.Circuit(cirq.measure(*qubits, key='m')))
+    sweeps = [
+        [
+            cirq.Result(
+                params=cirq.ParamResolver({'t': point}),
+                measurements={'m': prng.randint(2, size=(repetitions, num_qubits), dtype=bool)},
+            )
+            for point in range(num_points)
+        ]
+        for _ in range(num_sweeps)
+    ]
+    return sweeps, measurements
+
+
+def to_proto(sweeps: List[List[cirq.Result]], measurements: List[v2.MeasureInfo]):
+    """Converts the results to a proto."""
+    return v2.results_to_proto(sweeps, measurements)
+
+
+def from_proto(msg, measurements: List[v2.MeasureInfo]) -> List[List[cirq.Result]]:
+    """Converts the proto back to results."""
+    return v2.results_from_proto(msg, measurements)
+
+
+def main(
+    num_qubits: int,
+    repetitions: int,
+    num_points: int,
+    num_sweeps: int,
+    num_repetitions: int,
+    setup: str = 'from __main__ import to_proto, from_proto',
+):
+    sweeps, measurements = trial_sweeps(num_qubits, repetitions, num_points, num_sweeps)
+    msg = to_proto(sweeps, measurements)
+    context = {'sweeps': sweeps, 'measurements': measurements, 'msg': msg}
+    print(
+        f'Converting {num_sweeps} sweeps of {num_points} points with {repetitions} '
+        f'repetitions on {num_qubits} qubits:'
+    )
+    print(f'  {msg.ByteSize() / 1024:.1f} kB of proto')
+    for command in ['to_proto(sweeps, measurements)', 'from_proto(msg, measurements)']:
+        time = timeit.timeit(command, setup, number=num_repetitions, globals=context)
+        print(f'  {time / num_repetitions:.4f}s per {command.split("(")[0]}')
+
+
+def parse_arguments(args):
+    parser = argparse.ArgumentParser('Benchmark result proto conversion.')
+    parser.add_argument('--num_qubits', default=100, type=int, help='Number of measured qubits.')
+    parser.add_argument(
+        '--repetitions', default=1000, type=int, help='Number of repetitions per parameter point.'
+    )
+    parser.add_argument(
+        '--num_points', default=10, type=int, help='Number of parameter points per sweep.'
+    )
+    parser.add_argument('--num_sweeps', default=2, type=int, help='Number of sweeps.')
+    parser.add_argument(
+        '--num_repetitions', default=5, type=int, help='Number of times to repeat conversion.'
+    )
+    return vars(parser.parse_args(args))
+
+
+if __name__ == '__main__':
+    main(**parse_arguments(sys.argv[1:]))
@@ -0,0 +1,63 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the result proto benchmarker."""
+
+import numpy as np
+
+from dev_tools.profiling import benchmark_result_protos
+
+
+def test_round_trip():
+    sweeps, measurements = benchmark_result_protos.trial_sweeps(
+        num_qubits=3, repetitions=10, num_points=2, num_sweeps=2
+    )
+    msg = benchmark_result_protos.to_proto(sweeps, measurements)
+    decoded = benchmark_result_protos.from_proto(msg, measurements)
+    assert len(decoded) == 2
+    for expected_sweep, decoded_sweep in zip(sweeps, decoded):
+        for expected, actual in zip(expected_sweep, decoded_sweep):
+            assert actual.params == expected.params
+            np.testing.assert_array_equal(actual.measurements['m'], expected.measurements['m'])
+
+
+def test_args_have_defaults():
+    kwargs = benchmark_result_protos.parse_arguments([])
+    for _, v in kwargs.items():
+        assert v is not None
+
+
+def test_main_loop():
+    benchmark_result_protos.main(
+        num_qubits=5,
+        repetitions=20,
+        num_points=2,
+        num_sweeps=1,
+        num_repetitions=1,
+        setup='from dev_tools.profiling.benchmark_result_protos import to_proto, from_proto',
+    )
+
+
+def test_parse_args():
+    args = (
+        '--num_qubits 5 --repetitions 20 --num_points 3 --num_sweeps 2 --num_repetitions 2'
+    ).split()
+    kwargs = benchmark_result_protos.parse_arguments(args)
+    assert kwargs == {
+        'num_qubits': 5,
+        'repetitions': 20,
+        'num_points': 3,
+        'num_sweeps': 2,
+        'num_repetitions': 2,
+    }